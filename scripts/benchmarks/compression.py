@@ -0,0 +1,78 @@
+"""Measure wall time, client CPU time and bytes transferred per content encoding.
+
+Large trade and OHLCV history payloads are served by a local stand-in that
+simulates a link of `--mbps` megabits per second, so the time saved by
+transferring fewer bytes can be weighed against the CPU spent decompressing.
+
+Usage: python scripts/benchmarks/compression.py [--items N] [--calls N] [--mbps N]
+"""
+
+import argparse
+import time
+
+from standin import compressed_responder, make_ohlcv, make_trades, serve
+
+from coinapi import CoinAPI
+from coinapi.config import supported_encodings
+from coinapi.models import operations
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--mbps", type=float, default=100.0)
+    args = parser.parse_args()
+
+    encodings = supported_encodings()
+    payloads = {
+        "trades": (
+            make_trades(args.items),
+            lambda s: s.trades.get_v1_trades_symbol_id_history(
+                operations.GetV1TradesSymbolIDHistoryRequest(
+                    symbol_id="BITSTAMP_SPOT_BTC_USD",
+                ),
+            ),
+        ),
+        "ohlcv": (
+            make_ohlcv(args.items),
+            lambda s: s.ohlcv.get_v1_ohlcv_symbol_id_history(
+                operations.GetV1OhlcvSymbolIDHistoryRequest(
+                    symbol_id="BITSTAMP_SPOT_BTC_USD",
+                    period_id="1MIN",
+                ),
+            ),
+        ),
+    }
+
+    print(  # noqa: T201
+        f"{'payload':<8} {'encoding':<9} {'KiB/call':>10} {'wall ms':>9} {'cpu ms':>8}",
+    )
+    for name, (payload, call) in payloads.items():
+        responder = compressed_responder(payload, encodings, mbps=args.mbps)
+        with serve(responder) as base_url:
+            for encoding in ("identity", *encodings):
+                compression = () if encoding == "identity" else (encoding,)
+                with CoinAPI(
+                    "benchmark",
+                    server_url=base_url,
+                    compression=compression,
+                ) as coinapi:
+                    call(coinapi)  # warm up the connection
+                    received = 0
+                    wall = time.perf_counter()
+                    cpu = time.thread_time()
+                    for _ in range(args.calls):
+                        res = call(coinapi)
+                        received += res.raw_response.num_bytes_downloaded
+                    cpu = time.thread_time() - cpu
+                    wall = time.perf_counter() - wall
+                print(  # noqa: T201
+                    f"{name:<8} {encoding:<9} {received / args.calls / 1024:>10.1f} "
+                    f"{wall / args.calls * 1000:>9.1f} {cpu / args.calls * 1000:>8.1f}",
+                )
+
+
+if __name__ == "__main__":
+    main()
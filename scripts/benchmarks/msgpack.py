@@ -0,0 +1,51 @@
+"""Compare JSON and MessagePack payload size and decode time for trade history.
+
+Usage: python scripts/benchmarks/msgpack.py [--trades N] [--repeat N]
+"""
+
+import argparse
+import time
+
+import msgspec
+from standin import make_trades
+
+from coinapi.models import operations
+from coinapi.utils import decoders
+
+
+def best_of(
+    repeat: int,
+    decoder: msgspec.json.Decoder | msgspec.msgpack.Decoder,
+    payload: bytes,
+) -> float:
+    """Return the fastest of `repeat` decodes of `payload`, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decoder.decode(payload)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trades", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    trades = make_trades(args.trades)
+    codec = decoders.get_response_codec(operations.GetV1TradesSymbolIDHistoryResponse)
+    payloads = {
+        "json": (msgspec.json.encode(trades), codec.json),
+        "msgpack": (msgspec.msgpack.encode(trades), codec.msgpack),
+    }
+
+    print(f"{'format':<10} {'bytes':>12} {'decode ms':>10}")  # noqa: T201
+    for name, (payload, decoder) in payloads.items():
+        elapsed = best_of(args.repeat, decoder, payload)
+        print(f"{name:<10} {len(payload):>12,} {elapsed * 1000:>10.1f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare preparing request URLs and query params from plans and by reflection.
+
+Usage: python scripts/benchmarks/request_plan.py [--number N] [--repeat N]
+"""
+
+import argparse
+import timeit
+
+from coinapi.models import operations
+from coinapi.utils import request_plan, utils
+
+SERVER_URL = "https://rest.coinapi.io/"
+
+REQUEST = operations.GetV1TradesSymbolIDHistoryRequest(
+    symbol_id="KRAKEN_SPOT_BTC_USD",
+    time_start="2022-01-01T00:00:00",
+    time_end="2022-01-02T00:00:00",
+    limit=10,
+    include_id=True,
+)
+"""Request prepared in every scenario."""
+
+
+def reflective() -> None:
+    """Prepare the request from its field metadata."""
+    utils.generate_url(type(REQUEST), SERVER_URL, REQUEST.endpoint, REQUEST)
+    utils.get_query_params(type(REQUEST), REQUEST)
+
+
+def planned() -> None:
+    """Prepare the request from its class's plan."""
+    plan = request_plan.get_request_plan(type(REQUEST))
+    plan.build_url(SERVER_URL, REQUEST)
+    plan.build_query_params(REQUEST)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<12} {'us/call':>8}")  # noqa: T201
+    for name, prepare in (("reflective", reflective), ("planned", planned)):
+        elapsed = min(timeit.repeat(prepare, number=args.number, repeat=args.repeat))
+        print(f"{name:<12} {elapsed / args.number * 1e6:>8.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
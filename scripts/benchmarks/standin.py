@@ -0,0 +1,144 @@
+"""Local stand-in for the CoinAPI REST server used by the benchmarks."""
+
+import datetime as dt
+import gzip
+import threading
+import time
+import uuid
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import msgspec
+
+Responder = Callable[[BaseHTTPRequestHandler], tuple[int, dict[str, str], bytes]]
+"""Callable producing the status code, headers and body for a request."""
+
+
+def make_trades(count: int) -> list[dict[str, object]]:
+    """Build `count` trades shaped like `/v1/trades/{symbol_id}/history` items."""
+    start = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+    return [
+        {
+            "symbol_id": "BITSTAMP_SPOT_BTC_USD",
+            "time_exchange": (start + dt.timedelta(milliseconds=i)).isoformat(),
+            "time_coinapi": (start + dt.timedelta(milliseconds=i + 3)).isoformat(),
+            "uuid": str(uuid.UUID(int=i)),
+            "price": 42000.0 + (i % 100) / 10,
+            "size": 0.001 * (1 + i % 7),
+            "taker_side": "BUY" if i % 2 else "SELL",
+        }
+        for i in range(count)
+    ]
+
+
+def make_ohlcv(count: int) -> list[dict[str, object]]:
+    """Build `count` 1MIN bars shaped like `/v1/ohlcv/{symbol_id}/history` items."""
+    start = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+    bars = []
+    for i in range(count):
+        period_start = start + dt.timedelta(minutes=i)
+        price = 42000.0 + (i % 500) / 10
+        bars.append(
+            {
+                "time_period_start": period_start.isoformat(),
+                "time_period_end": (period_start + dt.timedelta(minutes=1)).isoformat(),
+                "time_open": (period_start + dt.timedelta(seconds=1)).isoformat(),
+                "time_close": (period_start + dt.timedelta(seconds=59)).isoformat(),
+                "price_open": price,
+                "price_high": price + 12.5,
+                "price_low": price - 7.25,
+                "price_close": price + 3.1,
+                "volume_traded": 1.5 + (i % 13) / 7,
+                "trades_count": 20 + i % 40,
+            },
+        )
+    return bars
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Encode a body with a content encoding, if its encoder is installed."""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "deflate":
+        return zlib.compress(body, 6)
+    if encoding == "br":
+        import brotli
+
+        return brotli.compress(body, quality=5)
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    msg = f"unknown encoding {encoding}"
+    raise ValueError(msg)
+
+
+def json_responder(payload: object) -> Responder:
+    """Serve the same JSON payload for every request."""
+    body = msgspec.json.encode(payload)
+
+    def respond(_: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+        return 200, {"Content-Type": "application/json; charset=utf-8"}, body
+
+    return respond
+
+
+def compressed_responder(
+    payload: object,
+    encodings: tuple[str, ...],
+    mbps: float | None = None,
+) -> Responder:
+    """Serve a JSON payload compressed with the first accepted encoding.
+
+    Bodies are compressed once up front, so serving costs no CPU. With `mbps`
+    every response is delayed by its transfer time over a link of that speed.
+    """
+    identity = msgspec.json.encode(payload)
+    bodies = {encoding: compress(identity, encoding) for encoding in encodings}
+
+    def respond(handler: BaseHTTPRequestHandler) -> tuple[int, dict[str, str], bytes]:
+        accepted = [
+            e.strip() for e in handler.headers.get("Accept-Encoding", "").split(",")
+        ]
+        encoding = next((e for e in accepted if e in bodies), None)
+        body = identity if encoding is None else bodies[encoding]
+        headers = {"Content-Type": "application/json; charset=utf-8"}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        if mbps:
+            time.sleep(len(body) * 8 / (mbps * 1_000_000))
+        return 200, headers, body
+
+    return respond
+
+
+@contextmanager
+def serve(responder: Responder) -> Iterator[str]:
+    """Run a keep-alive capable HTTP/1.1 server and yield its base URL."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802
+            status, headers, body = responder(self)
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,60 @@
+"""Measure the cold-start cost of importing the SDK and building a client.
+
+Each scenario runs in fresh interpreters; the time of an empty interpreter is
+subtracted. Exits with status 1 when the client scenario exceeds the budget.
+
+Usage: python scripts/benchmarks/startup.py [--runs N] [--budget MS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "import coinapi": "import coinapi",
+    "import models": "from coinapi.models import operations",
+    "build client": "from coinapi import CoinAPI; CoinAPI('key')",
+    "first group": "from coinapi import CoinAPI; CoinAPI('key').trades",
+}
+"""Code timed in each scenario."""
+
+BUDGET_SCENARIO = "build client"
+"""Scenario checked against the budget."""
+
+
+def run(code: str, runs: int) -> float:
+    """Return the median wall time in seconds of running `code` in a new interpreter."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget", type=float, default=250.0)
+    args = parser.parse_args()
+
+    baseline = run("pass", args.runs)
+    print(f"{'scenario':<16} {'ms':>8}")  # noqa: T201
+    results = {}
+    for name, code in SCENARIOS.items():
+        results[name] = (run(code, args.runs) - baseline) * 1000
+        print(f"{name:<16} {results[name]:>8.1f}")  # noqa: T201
+
+    if results[BUDGET_SCENARIO] > args.budget:
+        print(  # noqa: T201
+            f"{BUDGET_SCENARIO} took {results[BUDGET_SCENARIO]:.1f} ms, "
+            f"over the {args.budget:.0f} ms budget",
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare peak memory of a buffered and a streamed trade history download.
+
+Usage: python scripts/benchmarks/streaming.py [--trades N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from standin import json_responder, make_trades, serve
+
+from coinapi import CoinAPI
+from coinapi.models import operations
+
+
+def measure(consume: Callable[[], int]) -> tuple[int, float, float]:
+    """Return the items consumed, peak traced memory in MiB and wall time."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = consume()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak / 2**20, elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trades", type=int, default=100_000)
+    args = parser.parse_args()
+
+    request = operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="BITSTAMP_SPOT_BTC_USD",
+        limit=args.trades,
+    )
+
+    with (
+        serve(json_responder(make_trades(args.trades))) as base_url,
+        CoinAPI("benchmark", server_url=base_url) as coinapi,
+    ):
+
+        def buffered() -> int:
+            res = coinapi.trades.get_v1_trades_symbol_id_history(request)
+            return sum(1 for _ in res.content)
+
+        def streamed() -> int:
+            items = coinapi.trades.stream_v1_trades_symbol_id_history(request)
+            return sum(1 for _ in items)
+
+        results = {"buffered": measure(buffered), "streamed": measure(streamed)}
+
+    print(f"{'mode':<10} {'items':>8} {'peak MiB':>10} {'seconds':>8}")  # noqa: T201
+    for name, (count, peak, elapsed) in results.items():
+        print(f"{name:<10} {count:>8} {peak:>10.1f} {elapsed:>8.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
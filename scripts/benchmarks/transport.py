@@ -0,0 +1,61 @@
+"""Benchmark calls/sec with a throwaway client per call versus the pooled client.
+
+Usage: python scripts/benchmarks/transport.py [--calls N] [--threads N]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from standin import json_responder, make_trades, serve
+
+from coinapi import CoinAPI
+from coinapi.utils import utils
+
+
+def measure(call: Callable[[], object], calls: int, threads: int) -> float:
+    """Return the calls per second achieved running `call` on `threads` threads."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for _ in pool.map(lambda _: call(), range(calls)):
+            pass
+    return calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with serve(json_responder(make_trades(10))) as base_url:
+        url = f"{base_url}/v1/trades/latest"
+
+        def throwaway() -> object:
+            # The pre-pooling default: SecurityClient without a client opens
+            # and closes a single-connection httpx.Client per request.
+            return utils.SecurityClient().send(httpx.Request("GET", url))
+
+        with CoinAPI("benchmark", server_url=base_url) as coinapi:
+
+            def pooled() -> object:
+                return coinapi.trades.get_v1_trades_latest()
+
+            results = {
+                "throwaway client per call": measure(
+                    throwaway,
+                    args.calls,
+                    args.threads,
+                ),
+                "SDK-owned pooled client": measure(pooled, args.calls, args.threads),
+            }
+
+    for name, rate in results.items():
+        print(f"{name:<28} {rate:>10.1f} calls/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,21 @@
 """CoinAPI REST SDK."""
 
-__all__ = ("CoinAPI", "CoinAPIConfig")
+from typing import TYPE_CHECKING
 
-from coinapi.config import CoinAPIConfig
-from coinapi.rest import CoinAPI
+from coinapi._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from coinapi.config import CoinAPIConfig
+    from coinapi.rest import AsyncCoinAPI, CoinAPI
+
+__all__ = ("AsyncCoinAPI", "CoinAPI", "CoinAPIConfig")
+
+_EXPORTS = {
+    "AsyncCoinAPI": "coinapi.rest",
+    "CoinAPI": "coinapi.rest",
+    "CoinAPIConfig": "coinapi.config",
+}
+"""Module defining each exported name."""
+
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
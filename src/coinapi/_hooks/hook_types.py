@@ -78,19 +78,59 @@ class AfterErrorHook(metaclass=abc.ABCMeta):
         pass
 
 
+class AsyncBeforeRequestHook(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    async def before_request(
+        self,
+        hook_ctx: BeforeRequestContext,
+        request: httpx.Request,
+    ) -> httpx.Request | Exception:
+        pass
+
+
+class AsyncAfterSuccessHook(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    async def after_success(
+        self,
+        hook_ctx: AfterSuccessContext,
+        response: httpx.Response,
+    ) -> httpx.Response | Exception:
+        pass
+
+
+class AsyncAfterErrorHook(metaclass=abc.ABCMeta):
+    @abc.abstractmethod
+    async def after_error(
+        self,
+        hook_ctx: AfterErrorContext,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> tuple[httpx.Response | None, Exception | None] | Exception:
+        pass
+
+
 class Hooks(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def register_sdk_init_hook(self, hook: SDKInitHook) -> None:
         pass
 
     @abc.abstractmethod
-    def register_before_request_hook(self, hook: BeforeRequestHook) -> None:
+    def register_before_request_hook(
+        self,
+        hook: BeforeRequestHook | AsyncBeforeRequestHook,
+    ) -> None:
         pass
 
     @abc.abstractmethod
-    def register_after_success_hook(self, hook: AfterSuccessHook) -> None:
+    def register_after_success_hook(
+        self,
+        hook: AfterSuccessHook | AsyncAfterSuccessHook,
+    ) -> None:
         pass
 
     @abc.abstractmethod
-    def register_after_error_hook(self, hook: AfterErrorHook) -> None:
+    def register_after_error_hook(
+        self,
+        hook: AfterErrorHook | AsyncAfterErrorHook,
+    ) -> None:
         pass
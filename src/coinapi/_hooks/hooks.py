@@ -1,6 +1,7 @@
 """SDK Hooks Module."""
 
-from typing import ClassVar
+import inspect
+from typing import Any
 
 import httpx
 
@@ -9,6 +10,9 @@ from coinapi._hooks.hook_types import (
     AfterErrorHook,
     AfterSuccessContext,
     AfterSuccessHook,
+    AsyncAfterErrorHook,
+    AsyncAfterSuccessHook,
+    AsyncBeforeRequestHook,
     BeforeRequestContext,
     BeforeRequestHook,
     Hooks,
@@ -17,26 +21,45 @@ from coinapi._hooks.hook_types import (
 
 
 class SDKHooks(Hooks):
-    """SDK Hooks."""
+    """SDK Hooks.
 
-    sdk_init_hooks: ClassVar[list[SDKInitHook]] = []
-    before_request_hooks: ClassVar[list[BeforeRequestHook]] = []
-    after_success_hooks: ClassVar[list[AfterSuccessHook]] = []
-    after_error_hooks: ClassVar[list[AfterErrorHook]] = []
+    Every instance holds its own registries, so hooks registered for one SDK
+    instance do not run for another. Async hooks only run on the async
+    client; the sync client raises a `TypeError` when it meets one.
+    """
+
+    def __init__(self) -> None:
+        self.sdk_init_hooks: list[SDKInitHook] = []
+        r"""Hooks run when the SDK is built."""
+        self.before_request_hooks: list[BeforeRequestHook | AsyncBeforeRequestHook] = []
+        r"""Hooks run before every attempt of a request, in registration order."""
+        self.after_success_hooks: list[AfterSuccessHook | AsyncAfterSuccessHook] = []
+        r"""Hooks run for every successful response, in registration order."""
+        self.after_error_hooks: list[AfterErrorHook | AsyncAfterErrorHook] = []
+        r"""Hooks run for every failed request, in registration order."""
 
     def register_sdk_init_hook(self, hook: SDKInitHook) -> None:
         """Register an SDK init hook."""
         self.sdk_init_hooks.append(hook)
 
-    def register_before_request_hook(self, hook: BeforeRequestHook) -> None:
+    def register_before_request_hook(
+        self,
+        hook: BeforeRequestHook | AsyncBeforeRequestHook,
+    ) -> None:
         """Register a before request hook."""
         self.before_request_hooks.append(hook)
 
-    def register_after_success_hook(self, hook: AfterSuccessHook) -> None:
+    def register_after_success_hook(
+        self,
+        hook: AfterSuccessHook | AsyncAfterSuccessHook,
+    ) -> None:
         """Register an after success hook."""
         self.after_success_hooks.append(hook)
 
-    def register_after_error_hook(self, hook: AfterErrorHook) -> None:
+    def register_after_error_hook(
+        self,
+        hook: AfterErrorHook | AsyncAfterErrorHook,
+    ) -> None:
         """Register an after error hook."""
         self.after_error_hooks.append(hook)
 
@@ -55,27 +78,52 @@ class SDKHooks(Hooks):
         hook_ctx: BeforeRequestContext,
         request: httpx.Request,
     ) -> httpx.Request:
-        """Run the before request hooks."""
-        brequest: httpx.Request | Exception = request
+        """Run the before request hooks, each on the request returned by the previous one."""
         for hook in self.before_request_hooks:
-            brequest = hook.before_request(hook_ctx, request)
-            if isinstance(brequest, Exception):
-                raise brequest
+            result = _sync_result(hook.before_request(hook_ctx, request))
+            if isinstance(result, Exception):
+                raise result
+            request = result
+        return request
 
-        return brequest  # type: ignore[return-value]
+    async def before_request_async(
+        self,
+        hook_ctx: BeforeRequestContext,
+        request: httpx.Request,
+    ) -> httpx.Request:
+        """Run the sync and async before request hooks."""
+        for hook in self.before_request_hooks:
+            result = await _async_result(hook.before_request(hook_ctx, request))
+            if isinstance(result, Exception):
+                raise result
+            request = result
+        return request
 
     def after_success(
         self,
         hook_ctx: AfterSuccessContext,
         response: httpx.Response,
     ) -> httpx.Response:
-        """Run the after success hooks."""
-        aresponse: httpx.Response | Exception = response
+        """Run the after success hooks, each on the response returned by the previous one."""
+        for hook in self.after_success_hooks:
+            result = _sync_result(hook.after_success(hook_ctx, response))
+            if isinstance(result, Exception):
+                raise result
+            response = result
+        return response
+
+    async def after_success_async(
+        self,
+        hook_ctx: AfterSuccessContext,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Run the sync and async after success hooks."""
         for hook in self.after_success_hooks:
-            aresponse = hook.after_success(hook_ctx, response)
-            if isinstance(aresponse, Exception):
-                raise aresponse
-        return aresponse  # type: ignore[return-value]
+            result = await _async_result(hook.after_success(hook_ctx, response))
+            if isinstance(result, Exception):
+                raise result
+            response = result
+        return response
 
     def after_error(
         self,
@@ -85,8 +133,39 @@ class SDKHooks(Hooks):
     ) -> tuple[httpx.Response | None, Exception | None]:
         """Run the after error hooks."""
         for hook in self.after_error_hooks:
-            result = hook.after_error(hook_ctx, response, error)
+            result = _sync_result(hook.after_error(hook_ctx, response, error))
             if isinstance(result, Exception):
                 raise result
             response, error = result
         return response, error
+
+    async def after_error_async(
+        self,
+        hook_ctx: AfterErrorContext,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> tuple[httpx.Response | None, Exception | None]:
+        """Run the sync and async after error hooks."""
+        for hook in self.after_error_hooks:
+            result = await _async_result(hook.after_error(hook_ctx, response, error))
+            if isinstance(result, Exception):
+                raise result
+            response, error = result
+        return response, error
+
+
+def _sync_result(result: Any) -> Any:
+    """Get the result of a hook run by the sync client."""
+    if inspect.isawaitable(result):
+        if inspect.iscoroutine(result):
+            result.close()
+        msg = "async hooks can only run on the async client"
+        raise TypeError(msg)
+    return result
+
+
+async def _async_result(result: Any) -> Any:
+    """Get the result of a sync or async hook."""
+    if inspect.isawaitable(result):
+        return await result
+    return result
@@ -1,14 +1,20 @@
 """Base class for operation collections."""
 
 import enum
-from typing import Any, TypeVar
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any, NamedTuple, TypeVar
 
 import httpx
-import msgspec
 from httpx import codes
 
-from coinapi import utils
-from coinapi._hooks import BeforeRequestContext, HookContext
+from coinapi import ratelimit, utils
+from coinapi._hooks import (
+    AfterErrorContext,
+    AfterSuccessContext,
+    BeforeRequestContext,
+    HookContext,
+)
 from coinapi.config import CoinAPIConfig
 from coinapi.models import errors
 from coinapi.models.operations.base import CoinAPIRequest, CoinAPIResponse
@@ -24,17 +30,33 @@ class AcceptEnum(str, enum.Enum):
     ANY = "*/*"
 
 
+DEFAULT_ACCEPT = (
+    "application/json;q=1, text/json;q=0.8, text/plain;q=0.5, application/x-msgpack;q=0"
+)
+"""Accept header negotiating JSON responses."""
+
+MSGPACK_ACCEPT = "application/x-msgpack;q=1, application/json;q=0.8, text/json;q=0.5, text/plain;q=0.3"
+"""Accept header preferring MessagePack responses, falling back to JSON."""
+
 RequestT = TypeVar("RequestT", bound=CoinAPIRequest)
 ResponseT = TypeVar("ResponseT", bound=CoinAPIResponse)
 
 
+class _CacheKeys(NamedTuple):
+    """Keys of a request in the coalescer and the caches."""
+
+    operation_id: str
+    request: tuple[str, str, str]
+    disk: str | None
+
+
 class Base:
     """Base class for operation collections."""
 
     def __init__(self, sdk_config: CoinAPIConfig) -> None:
         self.sdk_configuration = sdk_config
 
-    def _make_request(  # type: ignore[return]
+    def _make_request(
         self,
         operation_id: str,
         request: RequestT,
@@ -45,13 +67,193 @@ class Base:
         hook_ctx = self._create_hook_context(operation_id)
         prepared_request = self._prepare_request(request, accept_header_override)
         client = self._configure_security_client()
+        keys = self._cache_keys(operation_id, prepared_request)
+        cached = self._load_cached(keys, prepared_request, response_cls)
+        if cached is not None:
+            return cached
+
+        def fetch() -> ResponseT:  # type: ignore[return]
+            try:
+                http_res = self._execute_request(hook_ctx, prepared_request, client)
+                http_res = self._after_success(hook_ctx, http_res)
+                res = self._decode_response(operation_id, http_res, response_cls)
+            except Exception as e:  # noqa: BLE001
+                self._handle_request_error(hook_ctx, e)
+            else:
+                self._store_cached(keys, http_res, res)
+                return res
+
+        if (coalescer := self.sdk_configuration.coalescer) is None:
+            return fetch()
+        return coalescer.do(keys.request, fetch)
+
+    async def _make_request_async(
+        self,
+        operation_id: str,
+        request: RequestT,
+        response_cls: type[ResponseT],
+        accept_header_override: AcceptEnum | None = None,
+    ) -> ResponseT:
+        """Send an HTTP request asynchronously."""
+        hook_ctx = self._create_hook_context(operation_id)
+        prepared_request = self._prepare_request(request, accept_header_override)
+        client = self._configure_security_client(is_async=True)
+        keys = self._cache_keys(operation_id, prepared_request)
+        cached = self._load_cached(keys, prepared_request, response_cls)
+        if cached is not None:
+            return cached
+
+        async def fetch() -> ResponseT:  # type: ignore[return]
+            try:
+                http_res = await self._execute_request_async(
+                    hook_ctx,
+                    prepared_request,
+                    client,
+                )
+                http_res = await self._after_success_async(hook_ctx, http_res)
+                res = self._decode_response(operation_id, http_res, response_cls)
+            except Exception as e:  # noqa: BLE001
+                await self._handle_request_error_async(hook_ctx, e)
+            else:
+                self._store_cached(keys, http_res, res)
+                return res
+
+        if (coalescer := self.sdk_configuration.coalescer) is None:
+            return await fetch()
+        return await coalescer.do_async(keys.request, fetch)
+
+    def _stream_request(
+        self,
+        operation_id: str,
+        request: RequestT,
+        response_cls: type[CoinAPIResponse],
+        on_cost: Callable[[int], None] | None = None,
+    ) -> Iterator[Any]:
+        """Send an HTTP request and yield the items of its JSON array as they arrive.
+
+        `on_cost` is called with the credits the request cost once all items
+        are yielded.
+        """
+        hook_ctx = self._create_hook_context(operation_id)
+        prepared_request = self._prepare_request(request, AcceptEnum.APPLICATION_JSON)
+        client = self._configure_security_client()
+        decoder = utils.get_response_codec(response_cls).items
 
         try:
-            http_res = self._execute_request(hook_ctx, prepared_request, client)
-            return self._process_response(http_res, response_cls)
+            http_res = self._execute_request(
+                hook_ctx,
+                prepared_request,
+                client,
+                stream=True,
+            )
+            items = 0
+            try:
+                http_res = self._after_success(hook_ctx, http_res)
+                if not self._is_streamable(http_res):
+                    http_res.read()
+                    self._handle_unstreamable_response(http_res)
+                for item in utils.iter_json_array(http_res.iter_bytes(), decoder):
+                    items += 1
+                    yield item
+                if on_cost is not None:
+                    on_cost(self._request_cost(http_res))
+            finally:
+                http_res.close()
+                self._end_stream(operation_id, http_res, items)
         except Exception as e:  # noqa: BLE001
             self._handle_request_error(hook_ctx, e)
 
+    async def _stream_request_async(
+        self,
+        operation_id: str,
+        request: RequestT,
+        response_cls: type[CoinAPIResponse],
+        on_cost: Callable[[int], None] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Send an HTTP request and yield the items of its JSON array as they arrive, asynchronously."""
+        hook_ctx = self._create_hook_context(operation_id)
+        prepared_request = self._prepare_request(request, AcceptEnum.APPLICATION_JSON)
+        client = self._configure_security_client(is_async=True)
+        decoder = utils.get_response_codec(response_cls).items
+
+        try:
+            http_res = await self._execute_request_async(
+                hook_ctx,
+                prepared_request,
+                client,
+                stream=True,
+            )
+            items = 0
+            try:
+                http_res = await self._after_success_async(hook_ctx, http_res)
+                if not self._is_streamable(http_res):
+                    await http_res.aread()
+                    self._handle_unstreamable_response(http_res)
+                async for item in utils.aiter_json_array(
+                    http_res.aiter_bytes(),
+                    decoder,
+                ):
+                    items += 1
+                    yield item
+                if on_cost is not None:
+                    on_cost(self._request_cost(http_res))
+            finally:
+                await http_res.aclose()
+                self._end_stream(operation_id, http_res, items)
+        except Exception as e:  # noqa: BLE001
+            await self._handle_request_error_async(hook_ctx, e)
+
+    def _cache_keys(
+        self,
+        operation_id: str,
+        prepared_request: httpx.Request,
+    ) -> _CacheKeys:
+        """Get the keys a request is coalesced and cached under."""
+        disk_cache = self.sdk_configuration.disk_cache
+        return _CacheKeys(
+            operation_id,
+            utils.request_key(prepared_request),
+            None
+            if disk_cache is None
+            else disk_cache.key_for(operation_id, prepared_request),
+        )
+
+    def _load_cached(
+        self,
+        keys: _CacheKeys,
+        prepared_request: httpx.Request,
+        response_cls: type[ResponseT],
+    ) -> ResponseT | None:
+        """Get a response from the memory or disk cache without sending the request."""
+        cache = self.sdk_configuration.response_cache
+        if cache is not None:
+            cached = cache.get(keys.operation_id, keys.request)
+            if cached is not None:
+                return cached  # type: ignore[no-any-return]
+        disk_cache = self.sdk_configuration.disk_cache
+        if disk_cache is None or keys.disk is None:
+            return None
+        http_res = disk_cache.load(keys.disk, prepared_request)
+        if http_res is None:
+            return None
+        res = self._process_response(http_res, response_cls)
+        if cache is not None:
+            cache.put(keys.operation_id, keys.request, res)
+        return res
+
+    def _store_cached(
+        self,
+        keys: _CacheKeys,
+        http_res: httpx.Response,
+        res: CoinAPIResponse,
+    ) -> None:
+        """Store a successful response in the memory and disk caches."""
+        if (cache := self.sdk_configuration.response_cache) is not None:
+            cache.put(keys.operation_id, keys.request, res)
+        disk_cache = self.sdk_configuration.disk_cache
+        if disk_cache is not None and keys.disk is not None:
+            disk_cache.store(keys.disk, keys.operation_id, http_res)
+
     def _create_hook_context(self, operation_id: str) -> BeforeRequestContext:
         """Create a hook context."""
         return BeforeRequestContext(
@@ -67,10 +269,11 @@ class Base:
     ) -> httpx.Request:
         """Prepare an HTTP request."""
         base_url = utils.template_url(*self.sdk_configuration.get_server_details())
-        url = utils.generate_url(type(request), base_url, request.endpoint, request)
+        plan = utils.get_request_plan(type(request))
+        url = plan.build_url(base_url, request)
         headers = self._prepare_headers(request, accept_header_override)
         data, form = self._prepare_body(request)
-        query_params = utils.get_query_params(type(request), request) or None
+        query_params = plan.build_query_params(request) or None
 
         return httpx.Request(
             request.method,
@@ -96,11 +299,13 @@ class Base:
             ):
                 headers["content-type"] = req_content_type
 
-        headers["Accept"] = (
-            accept_header_override.value
-            if accept_header_override is not None
-            else "application/json;q=1, text/json;q=0.8, text/plain;q=0.5, application/x-msgpack;q=0"
-        )
+        if accept_header_override is not None:
+            headers["Accept"] = accept_header_override.value
+        elif self.sdk_configuration.prefer_msgpack:
+            headers["Accept"] = MSGPACK_ACCEPT
+        else:
+            headers["Accept"] = DEFAULT_ACCEPT
+        headers["Accept-Encoding"] = self.sdk_configuration.get_accept_encoding()
         headers["user-agent"] = self.sdk_configuration.user_agent
         return headers
 
@@ -111,27 +316,252 @@ class Base:
             return data, form
         return None, None
 
-    def _configure_security_client(self) -> utils.SecurityClient:
+    def _configure_security_client(
+        self,
+        *,
+        is_async: bool = False,
+    ) -> utils.SecurityClient:
         """Configure the security client."""
-        security = (
-            self.sdk_configuration.security()
-            if callable(self.sdk_configuration.security)
-            else self.sdk_configuration.security
-        )
-        return utils.configure_security_client(self.sdk_configuration.client, security)
+        return self.sdk_configuration.get_security_client(is_async=is_async)
 
     def _execute_request(
         self,
         hook_ctx: BeforeRequestContext,
         prepared_request: httpx.Request,
         client: utils.SecurityClient,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Execute an HTTP request, retrying it according to the retry policy."""
+
+        def attempt() -> httpx.Response:
+            return self._send_request(hook_ctx, prepared_request, client, stream=stream)
+
+        def discard(http_res: httpx.Response) -> None:
+            http_res.close()
+            if stream:
+                self._end_stream(hook_ctx.operation_id, http_res)
+
+        if (policy := self.sdk_configuration.retry_policy) is None:
+            return attempt()
+        return utils.retry(attempt, policy, hook_ctx.operation_id, discard)
+
+    async def _execute_request_async(
+        self,
+        hook_ctx: BeforeRequestContext,
+        prepared_request: httpx.Request,
+        client: utils.SecurityClient,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Execute an HTTP request asynchronously, retrying it according to the retry policy."""
+
+        async def attempt() -> httpx.Response:
+            return await self._send_request_async(
+                hook_ctx,
+                prepared_request,
+                client,
+                stream=stream,
+            )
+
+        async def discard(http_res: httpx.Response) -> None:
+            await http_res.aclose()
+            if stream:
+                self._end_stream(hook_ctx.operation_id, http_res)
+
+        if (policy := self.sdk_configuration.retry_policy) is None:
+            return await attempt()
+        return await utils.retry_async(attempt, policy, hook_ctx.operation_id, discard)
+
+    def _send_request(
+        self,
+        hook_ctx: BeforeRequestContext,
+        prepared_request: httpx.Request,
+        client: utils.SecurityClient,
+        *,
+        stream: bool = False,
     ) -> httpx.Response:
-        """Execute an HTTP request."""
-        req = self.sdk_configuration.get_hooks().before_request(
-            hook_ctx,
-            prepared_request,
+        """Send a single attempt of an HTTP request."""
+        req = prepared_request
+        if (hooks := self.sdk_configuration.get_hooks()).before_request_hooks:
+            req = hooks.before_request(hook_ctx, req)
+        cost = self._admit(req)
+        instrumentation = self.sdk_configuration.instrumentation
+        if instrumentation is not None:
+            instrumentation.start(req)
+        try:
+            http_res = client.send(req, stream=stream)
+        except BaseException:
+            self._settle(cost, None)
+            if instrumentation is not None:
+                instrumentation.observe_error(hook_ctx.operation_id)
+            raise
+        self._settle(cost, http_res, streaming=stream)
+        if instrumentation is not None and not stream:
+            instrumentation.observe_response(hook_ctx.operation_id, http_res)
+        return http_res
+
+    async def _send_request_async(
+        self,
+        hook_ctx: BeforeRequestContext,
+        prepared_request: httpx.Request,
+        client: utils.SecurityClient,
+        *,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a single attempt of an HTTP request asynchronously."""
+        req = prepared_request
+        if (hooks := self.sdk_configuration.get_hooks()).before_request_hooks:
+            req = await hooks.before_request_async(hook_ctx, req)
+        cost = await self._admit_async(req)
+        instrumentation = self.sdk_configuration.instrumentation
+        if instrumentation is not None:
+            instrumentation.start(req, is_async=True)
+        try:
+            http_res = await client.send_async(req, stream=stream)
+        except BaseException:
+            self._settle(cost, None)
+            if instrumentation is not None:
+                instrumentation.observe_error(hook_ctx.operation_id)
+            raise
+        self._settle(cost, http_res, streaming=stream)
+        if instrumentation is not None and not stream:
+            instrumentation.observe_response(hook_ctx.operation_id, http_res)
+        return http_res
+
+    def _admit(self, req: httpx.Request) -> int:
+        """Wait for request budget and a concurrency slot, returning the reserved cost."""
+        cost = ratelimit.estimate_cost(req)
+        if (limiter := self.sdk_configuration.rate_limiter) is not None:
+            limiter.acquire(cost)
+        if (governor := self.sdk_configuration.concurrency_governor) is not None:
+            governor.acquire()
+        return cost
+
+    async def _admit_async(self, req: httpx.Request) -> int:
+        """Wait asynchronously for request budget and a concurrency slot."""
+        cost = ratelimit.estimate_cost(req)
+        if (limiter := self.sdk_configuration.rate_limiter) is not None:
+            await limiter.acquire_async(cost)
+        if (governor := self.sdk_configuration.concurrency_governor) is not None:
+            await governor.acquire_async()
+        return cost
+
+    def _settle(
+        self,
+        cost: int,
+        http_res: httpx.Response | None,
+        *,
+        streaming: bool = False,
+    ) -> None:
+        """Report the outcome of an admitted request to the limiter and governor.
+
+        A streamed response keeps its concurrency slot until `_end_stream`.
+        """
+        if (limiter := self.sdk_configuration.rate_limiter) is not None:
+            if http_res is None:
+                limiter.release(cost)
+            else:
+                limiter.update(http_res, cost)
+        if (governor := self.sdk_configuration.concurrency_governor) is not None:
+            if http_res is not None and streaming:
+                governor.observe(http_res)
+            else:
+                governor.release(http_res)
+
+    def _end_stream(
+        self,
+        operation_id: str,
+        http_res: httpx.Response,
+        items: int | None = None,
+    ) -> None:
+        """Free the concurrency slot held by a closed streamed response and record it.
+
+        `items` is the number of items decoded, or None for a discarded response.
+        """
+        if (governor := self.sdk_configuration.concurrency_governor) is not None:
+            governor.release()
+        if (instrumentation := self.sdk_configuration.instrumentation) is not None:
+            instrumentation.observe_response(operation_id, http_res)
+            if items is not None and codes.is_success(http_res.status_code):
+                instrumentation.observe_decode(
+                    operation_id,
+                    None,
+                    items,
+                    self._request_cost(http_res),
+                )
+
+    def _after_success(
+        self,
+        hook_ctx: HookContext,
+        http_res: httpx.Response,
+    ) -> httpx.Response:
+        """Run the after success hooks unless the response is an error."""
+        hooks = self.sdk_configuration.get_hooks()
+        if not hooks.after_success_hooks or utils.match_status_codes(
+            ["4XX", "5XX"],
+            http_res.status_code,
+        ):
+            return http_res
+        return hooks.after_success(
+            AfterSuccessContext(
+                hook_ctx.operation_id,
+                hook_ctx.oauth2_scopes,
+                hook_ctx.security_source,
+            ),
+            http_res,
+        )
+
+    async def _after_success_async(
+        self,
+        hook_ctx: HookContext,
+        http_res: httpx.Response,
+    ) -> httpx.Response:
+        """Run the sync and async after success hooks unless the response is an error."""
+        hooks = self.sdk_configuration.get_hooks()
+        if not hooks.after_success_hooks or utils.match_status_codes(
+            ["4XX", "5XX"],
+            http_res.status_code,
+        ):
+            return http_res
+        return await hooks.after_success_async(
+            AfterSuccessContext(
+                hook_ctx.operation_id,
+                hook_ctx.oauth2_scopes,
+                hook_ctx.security_source,
+            ),
+            http_res,
+        )
+
+    def _decode_response(
+        self,
+        operation_id: str,
+        http_res: httpx.Response,
+        response_cls: type[ResponseT],
+    ) -> ResponseT:
+        """Process an HTTP response, recording its decoding if instrumented."""
+        instrumentation = self.sdk_configuration.instrumentation
+        if instrumentation is None:
+            return self._process_response(http_res, response_cls)
+        started = time.perf_counter()
+        res = self._process_response(http_res, response_cls)
+        seconds = time.perf_counter() - started
+        content = getattr(res, "content", None)
+        instrumentation.observe_decode(
+            operation_id,
+            seconds,
+            len(content) if isinstance(content, list) else int(content is not None),
+            self._request_cost(http_res),
         )
-        return client.send(req)
+        return res
+
+    @staticmethod
+    def _request_cost(http_res: httpx.Response) -> int:
+        """Get the credits a request cost, as reported or else as estimated."""
+        cost = utils.get_int_header(http_res.headers, "x-ratelimit-request-cost")
+        if cost is None:
+            return ratelimit.estimate_cost(http_res.request)
+        return cost
 
     def _process_response(
         self,
@@ -146,7 +576,8 @@ class Base:
         res = response_cls(
             status_code=http_res.status_code,
             content_type=content_type,
-            raw_response=http_res,
+            raw_response=None if self.sdk_configuration.lean_responses else http_res,
+            headers=utils.get_limit_headers(http_res.headers),
         )
 
         if httpx.codes.is_success(http_res.status_code):
@@ -168,15 +599,13 @@ class Base:
             content_type,
             "application/json",
         ) or utils.match_content_type(content_type, "text/json"):
-            content_cls = next(
-                field
-                for field in msgspec.structs.fields(response_cls)
-                if field.name == "content"
-            ).type
-            out = msgspec.json.decode(http_res.content, type=content_cls)
-            res.content = out
+            codec = utils.get_response_codec(response_cls)
+            res.content = codec.json.decode(http_res.content)
         elif utils.match_content_type(content_type, "application/x-msgpack"):
-            res.body = http_res.content
+            codec = utils.get_response_codec(response_cls)
+            if not self.sdk_configuration.lean_responses:
+                res.body = http_res.content
+            res.content = codec.msgpack.decode(http_res.content)
         else:
             msg = f"unknown content-type received: {content_type}"
             raise errors.CoinAPIError(
@@ -186,6 +615,26 @@ class Base:
                 http_res,
             )
 
+    def _is_streamable(self, http_res: httpx.Response) -> bool:
+        """Check whether a response is a successful JSON body that can be streamed."""
+        content_type = http_res.headers.get("Content-Type", "")
+        return httpx.codes.is_success(http_res.status_code) and (
+            utils.match_content_type(content_type, "application/json")
+            or utils.match_content_type(content_type, "text/json")
+        )
+
+    def _handle_unstreamable_response(self, http_res: httpx.Response) -> None:
+        """Raise for a read response that cannot be streamed."""
+        self._handle_error_response(http_res)
+        content_type = http_res.headers.get("Content-Type", "")
+        msg = f"unknown content-type received: {content_type}"
+        raise errors.CoinAPIError(
+            msg,
+            http_res.status_code,
+            http_res.text,
+            http_res,
+        )
+
     def _handle_error_response(self, http_res: httpx.Response) -> None:
         """Handle an error response."""
         if codes.is_client_error(http_res.status_code) or codes.is_server_error(
@@ -200,5 +649,33 @@ class Base:
 
     def _handle_request_error(self, hook_ctx: HookContext, error: Exception) -> None:
         """Handle a request error."""
-        _, exc = self.sdk_configuration.get_hooks().after_error(hook_ctx, None, error)  # type: ignore[arg-type]
+        hooks = self.sdk_configuration.get_hooks()
+        if not hooks.after_error_hooks:
+            raise error
+        _, exc = hooks.after_error(self._error_context(hook_ctx), None, error)
+        raise exc from error  # type: ignore[misc]
+
+    async def _handle_request_error_async(
+        self,
+        hook_ctx: HookContext,
+        error: Exception,
+    ) -> None:
+        """Handle a request error, running sync and async after error hooks."""
+        hooks = self.sdk_configuration.get_hooks()
+        if not hooks.after_error_hooks:
+            raise error
+        _, exc = await hooks.after_error_async(
+            self._error_context(hook_ctx),
+            None,
+            error,
+        )
         raise exc from error  # type: ignore[misc]
+
+    @staticmethod
+    def _error_context(hook_ctx: HookContext) -> AfterErrorContext:
+        """Build the context of the after error hooks."""
+        return AfterErrorContext(
+            hook_ctx.operation_id,
+            hook_ctx.oauth2_scopes,
+            hook_ctx.security_source,
+        )
@@ -0,0 +1,169 @@
+"""Concurrent execution of lists of operations."""
+
+import asyncio
+import collections
+import concurrent.futures
+import itertools
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from typing import Any, Generic, TypeVar
+
+import msgspec
+
+DEFAULT_MAX_WORKERS = 8
+"""Operations of a batch executed at the same time."""
+
+_T = TypeVar("_T")
+
+BatchCall = tuple[Callable[..., Any], Any]
+"""An operation and its argument: a request, a mapping of keyword arguments, or None."""
+
+
+class BatchResult(msgspec.Struct, Generic[_T], frozen=True):
+    """Outcome of one operation of a batch."""
+
+    response: _T | None = None
+    r"""Response of the operation, or None if it failed"""
+    error: Exception | None = None
+    r"""Error raised by the operation, or None if it succeeded"""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> _T:
+        """Get the response, raising the error if the operation failed."""
+        if self.error is not None:
+            raise self.error
+        return self.response  # type: ignore[return-value]
+
+
+def _call(operation: Callable[..., _T], argument: Any) -> _T:
+    """Call an operation with a request, keyword arguments, or nothing."""
+    if argument is None:
+        return operation()
+    if isinstance(argument, Mapping):
+        return operation(**argument)
+    return operation(argument)
+
+
+def _run_one(operation: Callable[..., Any], argument: Any) -> BatchResult[Any]:
+    """Call an operation, capturing its error."""
+    try:
+        return BatchResult(response=_call(operation, argument))
+    except Exception as e:  # noqa: BLE001
+        return BatchResult(error=e)
+
+
+async def _run_one_async(
+    operation: Callable[..., Awaitable[Any]],
+    argument: Any,
+) -> BatchResult[Any]:
+    """Call an async operation, capturing its error."""
+    try:
+        return BatchResult(response=await _call(operation, argument))
+    except Exception as e:  # noqa: BLE001
+        return BatchResult(error=e)
+
+
+def run_batch(
+    calls: Iterable[BatchCall],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[BatchResult[Any]]:
+    """Execute operations on a thread pool, returning their outcomes in input order.
+
+    A failing operation does not stop the others; its error is returned in
+    its result instead.
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(calls)),
+        thread_name_prefix="coinapi-batch",
+    ) as executor:
+        futures = [executor.submit(_run_one, *call) for call in calls]
+        return [future.result() for future in futures]
+
+
+async def run_batch_async(
+    calls: Iterable[BatchCall],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[BatchResult[Any]]:
+    """Execute async operations as tasks, returning their outcomes in input order.
+
+    At most `max_workers` operations run at the same time.
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run_one(
+        operation: Callable[..., Awaitable[Any]],
+        argument: Any,
+    ) -> BatchResult[Any]:
+        async with semaphore:
+            return await _run_one_async(operation, argument)
+
+    return list(await asyncio.gather(*(run_one(*call) for call in calls)))
+
+
+def iter_batch(
+    calls: Iterable[BatchCall],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> Iterator[BatchResult[Any]]:
+    """Execute operations on a thread pool, yielding their outcomes in input order.
+
+    Operations are started as outcomes are consumed, so at most
+    `max_workers` of them run or wait to be consumed at a time, however
+    many calls there are.
+    """
+    calls = iter(calls)
+    pending: collections.deque[concurrent.futures.Future[Any]] = collections.deque()
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="coinapi-batch",
+    )
+    try:
+        for call in itertools.islice(calls, max_workers):
+            pending.append(executor.submit(_run_one, *call))
+        while pending:
+            result = pending.popleft().result()
+            for call in itertools.islice(calls, 1):
+                pending.append(executor.submit(_run_one, *call))
+            yield result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_batch(
+    calls: Iterable[BatchCall],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> AsyncIterator[BatchResult[Any]]:
+    """Execute async operations as tasks, yielding their outcomes in input order.
+
+    Operations are started as outcomes are consumed, so at most
+    `max_workers` of them run or wait to be consumed at a time.
+    """
+    calls = iter(calls)
+    pending: collections.deque[asyncio.Future[Any]] = collections.deque()
+    try:
+        for call in itertools.islice(calls, max_workers):
+            pending.append(asyncio.ensure_future(_run_one_async(*call)))
+        while pending:
+            result = await pending.popleft()
+            for call in itertools.islice(calls, 1):
+                pending.append(asyncio.ensure_future(_run_one_async(*call)))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,166 @@
+"""In-memory cache of decoded responses with per-operation expiry."""
+
+import collections
+import sys
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import httpx
+import msgspec
+
+DEFAULT_TTLS: dict[str, float] = {
+    "get_/v1/exchanges": 60 * 60.0,
+    "get_/v1/exchanges/{exchange_id}": 60 * 60.0,
+    "get_/v1/assets": 60 * 60.0,
+    "get_/v1/assets/{asset_id}": 60 * 60.0,
+    "get_/v1/ohlcv/periods": 24 * 60 * 60.0,
+    "get_/v1/exchangerate/history/periods": 24 * 60 * 60.0,
+}
+"""Seconds responses of rarely changing reference operations are cached for."""
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+"""Estimated size of the cached responses above which the least recently used are evicted."""
+
+
+def estimate_size(obj: object) -> int:
+    """Estimate the bytes taken by a decoded response, including what it references.
+
+    Objects referenced more than once are counted once. The body of a kept
+    raw response is counted, but not the rest of the HTTP machinery.
+    """
+    seen: set[int] = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, httpx.Response):
+            size += len(item.content) if item.is_stream_consumed else 0
+            continue
+        size += sys.getsizeof(item)
+        if isinstance(item, msgspec.Struct):
+            stack.extend(getattr(item, field) for field in item.__struct_fields__)
+        elif isinstance(item, list | tuple | set | frozenset):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+    return size
+
+
+class _Entry(msgspec.Struct):
+    """A cached response."""
+
+    value: Any
+    expires: float
+    size: int
+
+
+class ResponseCache:
+    """Cache successful responses of the configured operations in memory.
+
+    Each operation is cached for its TTL in seconds, taken from `ttls` or
+    `default_ttl`; operations without a TTL are not cached. Responses are
+    keyed by operation, URL with query and `Accept` header. Once the
+    estimated size of all entries exceeds `max_bytes`, the least recently
+    used are evicted.
+
+    Cached responses are shared between callers and should not be modified.
+    A cache is safe to share between threads, event loops and SDK instances
+    using the same API key.
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        *,
+        default_ttl: float | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        r"""Seconds each operation id is cached for."""
+        self.default_ttl = default_ttl
+        r"""Seconds operations without a TTL are cached for, or None to not cache them."""
+        self.max_bytes = max_bytes
+        r"""Estimated size of all entries above which entries are evicted."""
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: collections.OrderedDict[
+            tuple[str, Hashable],
+            _Entry,
+        ] = collections.OrderedDict()
+        self._size = 0
+        self.hits = 0
+        r"""Lookups answered from the cache."""
+        self.misses = 0
+        r"""Lookups of cached operations not answered from the cache."""
+        self.evictions = 0
+        r"""Entries evicted to stay within `max_bytes`."""
+
+    @property
+    def size(self) -> int:
+        """Estimated bytes taken by the cached responses."""
+        return self._size
+
+    def __len__(self) -> int:
+        """Get the number of cached responses."""
+        return len(self._entries)
+
+    def ttl_for(self, operation_id: str) -> float | None:
+        """Get the seconds an operation is cached for, or None if it is not cached."""
+        return self.ttls.get(operation_id, self.default_ttl)
+
+    def get(self, operation_id: str, key: Hashable) -> Any:
+        """Get a cached response, or None if it is missing or expired."""
+        if self.ttl_for(operation_id) is None:
+            return None
+        with self._lock:
+            entry = self._entries.get((operation_id, key))
+            if entry is not None and entry.expires <= self._clock():
+                self._remove((operation_id, key))
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((operation_id, key))
+            self.hits += 1
+            return entry.value
+
+    def put(self, operation_id: str, key: Hashable, value: object) -> None:
+        """Cache a response if its operation is cached and it fits."""
+        ttl = self.ttl_for(operation_id)
+        if ttl is None:
+            return
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._remove((operation_id, key))
+            self._entries[operation_id, key] = _Entry(value, self._clock() + ttl, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, operation_id: str | None = None) -> int:
+        """Drop the entries of an operation, or all entries, returning how many."""
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if operation_id is None or key[0] == operation_id
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def _remove(self, key: tuple[str, Hashable]) -> None:
+        """Drop an entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
@@ -0,0 +1,117 @@
+"""Sharing one request between identical concurrent calls."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+class _Call:
+    """A call in flight, awaited by the threads that joined it."""
+
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """Let concurrent calls with the same key share a single execution.
+
+    The first call for a key executes; calls with the same key arriving
+    before it completes wait for it and receive the same result, or the same
+    error. Results are shared, not copied, so they should not be mutated.
+    Nothing is cached: a call arriving after completion executes again.
+
+    A coalescer is safe to share between threads, event loops and SDK
+    instances using the same API key.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[
+            tuple[asyncio.AbstractEventLoop, Hashable],
+            asyncio.Future[Any],
+        ] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    @property
+    def executed(self) -> int:
+        """Calls that were executed."""
+        return self._executed
+
+    @property
+    def coalesced(self) -> int:
+        """Calls that received the result of another call."""
+        return self._coalesced
+
+    @property
+    def in_flight(self) -> int:
+        """Keys currently executing."""
+        return len(self._calls) + len(self._tasks)
+
+    def do(self, key: Hashable, fn: Callable[[], _T]) -> _T:
+        """Execute `fn`, or wait for the execution already in flight for `key`."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[no-any-return]
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[_T]]) -> _T:
+        """Await `fn`, or the execution already in flight for `key` on this loop.
+
+        The execution runs as a task, so cancelling the call that started it
+        does not cancel it for the calls that joined.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get((loop, key))
+            if task is None:
+                task = asyncio.ensure_future(fn())
+                self._tasks[loop, key] = task
+                task.add_done_callback(lambda t: self._finish(loop, key, t))
+                self._executed += 1
+            else:
+                self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        key: Hashable,
+        task: asyncio.Future[Any],
+    ) -> None:
+        """Forget a finished execution."""
+        with self._lock:
+            del self._tasks[loop, key]
+        if not task.cancelled():
+            # Mark the error as retrieved in case every caller was cancelled
+            task.exception()
@@ -0,0 +1,141 @@
+"""Adaptive limit on concurrent requests driven by the X-ConcurrencyLimit headers."""
+
+import asyncio
+import collections
+import threading
+
+import httpx
+
+from coinapi.utils import utils
+
+DEFAULT_INITIAL_LIMIT = 4
+"""Concurrent requests allowed before the API reports its concurrency limit."""
+
+
+class ConcurrencyGovernor:
+    """Limit requests in flight, adapting the limit to what the API accepts.
+
+    The limit grows by one whenever a response reports spare capacity in
+    `X-ConcurrencyLimit-Remaining` while the limit is fully used, and is
+    halved whenever a request is rejected with 429. It never exceeds the
+    `X-ConcurrencyLimit-Limit` reported by the API, nor `max_limit`.
+
+    A governor is safe to share between threads, event loops and SDK
+    instances using the same API key.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        *,
+        min_limit: int = 1,
+        max_limit: int | None = None,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit:
+            msg = "limits must satisfy 1 <= min_limit <= initial_limit"
+            raise ValueError(msg)
+        self.min_limit = min_limit
+        r"""Lowest limit the governor shrinks to."""
+        self.max_limit = max_limit
+        r"""Highest limit the governor grows to, regardless of the API limit."""
+        self._limit = initial_limit
+        self._in_flight = 0
+        self._server_limit: int | None = None
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._async_waiters: collections.deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = collections.deque()
+
+    @property
+    def limit(self) -> int:
+        """Requests currently allowed in flight."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently in flight."""
+        return self._in_flight
+
+    @property
+    def server_limit(self) -> int | None:
+        """Concurrency limit last reported by the API, or None while unknown."""
+        return self._server_limit
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._available:
+            while self._in_flight >= self._limit:
+                self._available.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """Wait until a request may be sent."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < self._limit:
+                    self._in_flight += 1
+                    return
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                    else:
+                        # Pass the wake-up on to another waiter
+                        self._notify()
+                raise
+
+    def release(self, response: httpx.Response | None = None) -> None:
+        """Free the slot of a finished request, adapting to its response."""
+        with self._lock:
+            self._in_flight -= 1
+            if response is not None:
+                self._adapt(response)
+            self._notify()
+
+    def observe(self, response: httpx.Response) -> None:
+        """Adapt to a response whose request is still in flight, such as a stream."""
+        with self._lock:
+            self._adapt(response)
+            self._notify()
+
+    def _adapt(self, response: httpx.Response) -> None:
+        """Grow or shrink the limit from a response."""
+        headers = response.headers
+        server_limit = utils.get_int_header(headers, "x-concurrencylimit-limit")
+        if server_limit is not None:
+            self._server_limit = server_limit
+        if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+            self._limit = max(self.min_limit, self._limit // 2)
+        else:
+            remaining = utils.get_int_header(headers, "x-concurrencylimit-remaining")
+            saturated = self._in_flight + 1 >= self._limit
+            if remaining is not None and remaining > 0 and saturated:
+                self._limit += 1
+        ceiling = min(
+            (c for c in (self._server_limit, self.max_limit) if c is not None),
+            default=None,
+        )
+        if ceiling is not None:
+            self._limit = max(self.min_limit, min(self._limit, ceiling))
+
+    def _notify(self) -> None:
+        """Wake as many waiters as there are free slots."""
+        free = self._limit - self._in_flight
+        if free <= 0:
+            return
+        self._available.notify(free)
+        for _ in range(min(free, len(self._async_waiters))):
+            loop, waiter = self._async_waiters.popleft()
+            loop.call_soon_threadsafe(_wake, waiter)
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    """Resolve a waiter unless it was cancelled meanwhile."""
+    if not waiter.done():
+        waiter.set_result(None)
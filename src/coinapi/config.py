@@ -1,26 +1,109 @@
 """SDK Config."""
 
-from collections.abc import Callable
-from importlib.metadata import version
-from typing import ClassVar
+from __future__ import annotations
+
+import functools
+import importlib.util
+import threading
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import msgspec
 
-from coinapi._hooks import SDKHooks
-from coinapi.models import components
 from coinapi.utils import utils
 
+if TYPE_CHECKING:
+    from coinapi._hooks import SDKHooks
+    from coinapi.cache import ResponseCache
+    from coinapi.coalescing import RequestCoalescer
+    from coinapi.concurrency import ConcurrencyGovernor
+    from coinapi.diskcache import DiskCache
+    from coinapi.instrumentation import Instrumentation
+    from coinapi.models import components
+    from coinapi.ratelimit import RateLimiter
+    from coinapi.utils.retries import RetryPolicy
+
 SERVERS = [
     "https://rest.coinapi.io",
 ]
 """Contains the list of available CoinAPI servers"""
 
+DEFAULT_TIMEOUT = 60.0
+"""Default timeout in seconds for requests sent through the SDK-owned client."""
+
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+"""Default connection pool limits of the SDK-owned client."""
+
+PREFERRED_ENCODINGS = ("zstd", "br", "gzip", "deflate")
+"""Content encodings negotiated by default, in order of preference."""
+
+
+def supported_encodings() -> tuple[str, ...]:
+    """Get the content encodings httpx can decode with the installed packages.
+
+    gzip and deflate are always available, br needs `brotli` or `brotlicffi`
+    and zstd needs `zstandard`.
+    """
+    encodings = ["gzip", "deflate"]
+    if any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi")):
+        encodings.append("br")
+    if importlib.util.find_spec("zstandard") is not None:
+        encodings.append("zstd")
+    return tuple(encodings)
+
+
+def resolve_compression(encodings: Iterable[str] | None) -> tuple[str, ...]:
+    """Check requested content encodings, defaulting to every supported one."""
+    supported = supported_encodings()
+    if encodings is None:
+        return tuple(e for e in PREFERRED_ENCODINGS if e in supported)
+    resolved = tuple(encodings)
+    unsupported = [e for e in resolved if e not in supported]
+    if unsupported:
+        msg = (
+            f"cannot decode {', '.join(unsupported)} responses; "
+            f"supported encodings are {', '.join(supported)}"
+        )
+        raise ValueError(msg)
+    return resolved
+
+
+@functools.cache
+def default_compression() -> tuple[str, ...]:
+    """Get the content encodings negotiated by default, probed on first use."""
+    return resolve_compression(None)
+
+
+_client_lock = threading.Lock()
+
+
+@functools.cache
+def package_version() -> str:
+    """Get the installed version of the package.
+
+    `importlib.metadata` is imported on first use, as it is slow to import.
+    """
+    from importlib.metadata import version
+
+    return version("coinapi-rest")
+
+
+class _PackageVersion:
+    """Class attribute resolving to the package version on first access."""
+
+    def __get__(self, instance: object, owner: type | None = None) -> str:
+        return package_version()
+
 
 class CoinAPIConfig(msgspec.Struct):
     """The configuration for the SDK."""
 
-    version: ClassVar[str] = version("coinapi-rest")
+    version = _PackageVersion()
 
     client: httpx.Client | None
     security: components.Security | Callable[[], components.Security] | None = None
@@ -28,7 +111,23 @@ class CoinAPIConfig(msgspec.Struct):
     server_idx: int | None = 0
     openapi_doc_version: str = "v1"
     user_agent: str = "coinapi-rest/python 0.0.1 CoinAPI v1"
+    async_client: httpx.AsyncClient | None = None
+    limits: httpx.Limits = DEFAULT_LIMITS
+    timeout: float = DEFAULT_TIMEOUT
+    prefer_msgpack: bool = False
+    lean_responses: bool = False
+    compression: tuple[str, ...] | None = None
+    rate_limiter: RateLimiter | None = None
+    concurrency_governor: ConcurrencyGovernor | None = None
+    retry_policy: RetryPolicy | None = None
+    coalescer: RequestCoalescer | None = None
+    response_cache: ResponseCache | None = None
+    disk_cache: DiskCache | None = None
+    instrumentation: Instrumentation | None = None
     _hooks: SDKHooks | None = None
+    _owned_client: httpx.Client | None = None
+    _owned_async_client: httpx.AsyncClient | None = None
+    _resolved_security: tuple[Any, dict[str, str], dict[str, str]] | None = None
 
     def get_server_details(self) -> tuple[str, dict[str, str]]:
         """Get the server details."""
@@ -39,7 +138,89 @@ class CoinAPIConfig(msgspec.Struct):
 
         return SERVERS[self.server_idx], {}
 
+    def get_accept_encoding(self) -> str:
+        """Get the Accept-Encoding header for the configured compression.
+
+        Without configured compression, every supported encoding is negotiated.
+        """
+        if self.compression is None:
+            self.compression = default_compression()
+        return ", ".join(self.compression) or "identity"
+
     def get_hooks(self) -> SDKHooks:
         """Get the hooks."""
         assert self._hooks is not None  # noqa: S101
         return self._hooks
+
+    def get_client(self) -> httpx.Client:
+        """Get the HTTP client, creating the SDK-owned pooled client on first use."""
+        if self.client is not None:
+            return self.client
+        if self._owned_client is None:
+            with _client_lock:
+                if self._owned_client is None:
+                    self._owned_client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=self.limits,
+                    )
+        return self._owned_client
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        """Get the async HTTP client, creating the SDK-owned pooled client on first use."""
+        if self.async_client is not None:
+            return self.async_client
+        if self._owned_async_client is None:
+            with _client_lock:
+                if self._owned_async_client is None:
+                    self._owned_async_client = httpx.AsyncClient(
+                        timeout=self.timeout,
+                        limits=self.limits,
+                    )
+        return self._owned_async_client
+
+    def get_security_client(self, *, is_async: bool = False) -> utils.SecurityClient:
+        """Get a client that applies the configured security to requests.
+
+        The auth headers and query parameters are resolved once and only
+        recomputed when `security` is a callable returning a different value.
+        """
+        security = self.security() if callable(self.security) else self.security
+        resolved = self._resolved_security
+        if resolved is None or (
+            resolved[0] is not security and resolved[0] != security
+        ):
+            configured = utils.configure_security_client(None, security)
+            resolved = (security, configured.query_params, configured.headers)
+            self._resolved_security = resolved
+
+        _, query_params, headers = resolved
+        if is_async:
+            return utils.SecurityClient(
+                query_params=query_params,
+                headers=headers,
+                async_client=self.get_async_client(),
+            )
+        return utils.SecurityClient(
+            self.get_client(),
+            query_params=query_params,
+            headers=headers,
+        )
+
+    def close(self) -> None:
+        """Close the SDK-owned HTTP client.
+
+        Clients passed in by the caller are left open.
+        """
+        if self._owned_client is not None:
+            self._owned_client.close()
+            self._owned_client = None
+
+    async def aclose(self) -> None:
+        """Close the SDK-owned HTTP clients.
+
+        Clients passed in by the caller are left open.
+        """
+        if self._owned_async_client is not None:
+            await self._owned_async_client.aclose()
+            self._owned_async_client = None
+        self.close()
@@ -0,0 +1,241 @@
+"""Persistent cache of historical responses for time windows that have closed."""
+
+import datetime as dt
+import gzip
+import hashlib
+import os
+import pathlib
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import urllib.parse
+
+import httpx
+
+HISTORY_OPERATIONS = frozenset(
+    {
+        "get_/v1/trades/{symbol_id}/history",
+        "get_/v1/quotes/{symbol_id}/history",
+        "get_/v1/orderbooks/{symbol_id}/history",
+        "get_/v1/ohlcv/{symbol_id}/history",
+        "get_/v1/ohlcv/exchanges/{exchange_id}/history",
+        "get_/v1/exchangerate/{asset_id_base}/{asset_id_quote}/history",
+        "get_/v1/indexes/{index_id}/history",
+    },
+)
+"""Operations whose responses never change once their time window has closed."""
+
+DEFAULT_SETTLE_DELAY = 60 * 60.0
+"""Seconds after `time_end` before a window is considered closed, allowing for late data."""
+
+TIME_PARAMS = ("time_start", "time_end")
+"""Query parameters normalized to UTC before keying."""
+
+_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    operation_id TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+def parse_time(value: str) -> dt.datetime | None:
+    """Parse an ISO 8601 time, taking times without an offset as UTC."""
+    value = _FRACTION.sub(r"\1", value.strip().replace("Z", "+00:00"))
+    try:
+        parsed = dt.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=dt.timezone.utc)
+    return parsed.astimezone(dt.timezone.utc)
+
+
+class DiskCache:
+    """Keep responses of historical operations on disk across runs.
+
+    Only successful responses of `operations` whose `time_end` lies at least
+    `settle_delay` seconds in the past are stored; open windows are always
+    fetched. Entries are keyed by operation, path, `Accept` header and query
+    parameters, sorted and with times normalized to UTC, so equivalent
+    requests share an entry. Hits are answered without a request, costing
+    no credits.
+
+    Bodies are stored as gzip files next to an SQLite index in `directory`.
+    With `max_bytes`, the least recently used entries are removed once the
+    compressed bodies exceed it. A cache is safe to share between threads
+    and event loops of one process.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        operations: frozenset[str] = HISTORY_OPERATIONS,
+        settle_delay: float = DEFAULT_SETTLE_DELAY,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.directory = pathlib.Path(directory)
+        r"""Directory holding the index and the bodies."""
+        self.operations = operations
+        r"""Operation ids that are cached."""
+        self.settle_delay = settle_delay
+        r"""Seconds after `time_end` before a window is considered closed."""
+        self.max_bytes = max_bytes
+        r"""Compressed size of all bodies above which entries are removed, or None."""
+        self.hits = 0
+        r"""Requests answered from disk."""
+        self.misses = 0
+        r"""Requests for closed windows that had to be sent."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.directory / "index.sqlite3",
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute(_SCHEMA)
+
+    def key_for(self, operation_id: str, request: httpx.Request) -> str | None:
+        """Get the key of a request, or None if its response must not be cached."""
+        if operation_id not in self.operations:
+            return None
+        params = sorted(request.url.params.multi_items())
+        times = dict(params)
+        time_end = parse_time(times.get("time_end", ""))
+        if time_end is None:
+            return None
+        closed_before = dt.datetime.now(dt.timezone.utc) - dt.timedelta(
+            seconds=self.settle_delay,
+        )
+        if time_end > closed_before:
+            return None
+        normalized = []
+        for name, value in params:
+            if name in TIME_PARAMS and (parsed := parse_time(value)) is not None:
+                value = parsed.isoformat()  # noqa: PLW2901
+            normalized.append((name, value))
+        identity = "\n".join(
+            (
+                operation_id,
+                request.url.path,
+                request.headers.get("accept", ""),
+                urllib.parse.urlencode(normalized),
+            ),
+        )
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def load(self, key: str, request: httpx.Request) -> httpx.Response | None:
+        """Get the stored response for a key, or None if there is none."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content_type FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            try:
+                body = gzip.decompress(self._path(key).read_bytes()) if row else None
+            except (OSError, EOFError):
+                self._delete(key)
+                body = None
+            if row is None or body is None:
+                self.misses += 1
+                return None
+            self._db.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self.hits += 1
+        return httpx.Response(
+            httpx.codes.OK,
+            headers={"Content-Type": row[0]},
+            content=body,
+            request=request,
+        )
+
+    def store(self, key: str, operation_id: str, response: httpx.Response) -> None:
+        """Store a successful response under a key."""
+        if response.status_code != httpx.codes.OK:
+            return
+        blob = gzip.compress(response.content, compresslevel=6)
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        # Write atomically so concurrent readers never see a partial body
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as file:
+            file.write(blob)
+        pathlib.Path(file.name).replace(path)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    operation_id,
+                    response.headers.get("content-type", ""),
+                    len(blob),
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """Compressed bytes of all stored bodies."""
+        with self._lock:
+            (size,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries",
+            ).fetchone()
+        return int(size)
+
+    def __len__(self) -> int:
+        """Get the number of stored responses."""
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return int(count)
+
+    def invalidate(self, operation_id: str | None = None) -> int:
+        """Remove the entries of an operation, or all entries, returning how many."""
+        with self._lock:
+            if operation_id is None:
+                rows = self._db.execute("SELECT key FROM entries").fetchall()
+            else:
+                rows = self._db.execute(
+                    "SELECT key FROM entries WHERE operation_id = ?",
+                    (operation_id,),
+                ).fetchall()
+            for (key,) in rows:
+                self._delete(key)
+            return len(rows)
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._db.close()
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond `max_bytes`."""
+        if self.max_bytes is None:
+            return
+        (size,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries",
+        ).fetchone()
+        rows = self._db.execute("SELECT key, size FROM entries ORDER BY accessed")
+        for key, entry_size in rows.fetchall():
+            if size <= self.max_bytes:
+                break
+            self._delete(key)
+            size -= entry_size
+
+    def _delete(self, key: str) -> None:
+        """Remove an entry and its body."""
+        self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> pathlib.Path:
+        """Get the path of the body of an entry."""
+        return self.directory / key[:2] / f"{key}.gz"
@@ -121,3 +121,105 @@ class ExchangeRates(Base):
             operations.GetV1PairHistoryResponse,
             accept_header_override=accept_header_override,
         )
+
+
+class AsyncExchangeRates(Base):
+    r"""Asynchronous counterpart of :class:`ExchangeRates`."""
+
+    async def get_v1_specific_rate(
+        self,
+        asset_id_base: str,
+        asset_id_quote: str,
+        time: str | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1SpecificRateResponse:
+        r"""[exchange rates] Get specific rate.
+
+        Retrieves the exchange rate for a specific base and quote asset at a given time or the current rate.
+
+        :::info
+        If you are using an exchange rate for mission-critical operations, then for best reliability, you should measure the difference between current time and the time returned from the response to ensure that value of the difference between those meets your internal requirements.
+        :::
+        """
+        return await self._make_request_async(
+            "Get specific rate",
+            operations.GetV1SpecificRateRequest(
+                asset_id_base=asset_id_base,
+                asset_id_quote=asset_id_quote,
+                time=time,
+            ),
+            operations.GetV1SpecificRateResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_base_rates(
+        self,
+        asset_id_base: str,
+        filter_asset_id: str | None = None,
+        invert: bool | None = None,
+        time: str | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1BaseRatesResponse:
+        r"""[exchange rates] Get all current rates.
+
+        Get the current exchange rate between requested asset and all other assets.
+
+        :::info
+        If you are using an exchange rate for mission-critical operations, then for best reliability, you should measure the difference between current time and the time returned from the response to ensure that value of the difference between those meets your internal requirements.
+        :::
+
+        :::info
+        You can invert the rates by using Y = 1 / X equation, for example BTC/USD = 1 / (USD/BTC);
+        :::
+        """
+        return await self._make_request_async(
+            "get_/v1/exchangerate/{asset_id_base}",
+            operations.GetV1BaseRatesRequest(
+                asset_id_base=asset_id_base,
+                filter_asset_id=filter_asset_id,
+                invert=invert,
+                time=time,
+            ),
+            operations.GetV1BaseRatesResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_history_periods(
+        self,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1HistoryPeriodsResponse:
+        r"""[exchange rates] Timeseries periods.
+
+        You can also obtain historical exchange rates of any asset pair, grouped into time periods.
+        Get full list of supported time periods available for requesting exchange rates historical timeseries data.
+
+        ## Timeseries periods
+        Time unit |	Period identifiers
+        --- | ---
+        Second | 1SEC, 2SEC, 3SEC, 4SEC, 5SEC, 6SEC, 10SEC, 15SEC, 20SEC, 30SEC
+        Minute | 1MIN, 2MIN, 3MIN, 4MIN, 5MIN, 6MIN, 10MIN, 15MIN, 20MIN, 30MIN
+        Hour | 1HRS, 2HRS, 3HRS, 4HRS, 6HRS, 8HRS, 12HRS
+        Day | 1DAY, 2DAY, 3DAY, 5DAY, 7DAY, 10DAY
+        """
+        return await self._make_request_async(
+            "get_/v1/exchangerate/history/periods",
+            operations.GetV1HistoryPeriodsRequest(),
+            operations.GetV1HistoryPeriodsResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_pair_history(
+        self,
+        request: operations.GetV1PairHistoryRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1PairHistoryResponse:
+        r"""[exchange rates] Timeseries data.
+
+        Get the historical exchange rates between two assets in the form of the timeseries.
+        """
+        return await self._make_request_async(
+            "get_/v1/exchangerate/{asset_id_base}/{asset_id_quote}/history",
+            request,
+            operations.GetV1PairHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
@@ -121,3 +121,120 @@ class Indexes(Base):
             operations.GetV1IndexesIndexIDTimeseriesTOBEANNOUNCEDResponse,
             accept_header_override,
         )
+
+
+class AsyncIndexes(Base):
+    r"""Asynchronous counterpart of :class:`Indexes`."""
+
+    async def get_v1_indexes(
+        self,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1IndexesResponse:
+        r"""List of available indexes."""
+        return await self._make_request_async(
+            "get_/v1/indexes",
+            operations.GetV1IndexesRequest(),
+            operations.GetV1IndexesResponse,
+            accept_header_override,
+        )
+
+    async def post_v1_indexes_json(
+        self,
+        request: operations.PostV1IndexesJSONRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.PostV1IndexesJSONResponse:
+        r"""Create index."""
+        return await self._make_request_async(
+            "post_/v1/indexes_json",
+            request,
+            operations.PostV1IndexesJSONResponse,
+            accept_header_override,
+        )
+
+    async def get_v1_indexes_index_id(
+        self,
+        index_id: str,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1IndexesIndexIDResponse:
+        r"""Get index data."""
+        return await self._make_request_async(
+            "get_/v1/indexes/{index_id}",
+            operations.GetV1IndexesIndexIDRequest(index_id=index_id),
+            operations.GetV1IndexesIndexIDResponse,
+            accept_header_override,
+        )
+
+    async def put_v1_indexes_index_id_json(
+        self,
+        index_id: str,
+        v1_index_data: components.V1IndexData | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.PutV1IndexesIndexIDJSONResponse:
+        r"""Update index."""
+        return await self._make_request_async(
+            "put_/v1/indexes/{index_id}_json",
+            operations.PutV1IndexesIndexIDJSONRequest(
+                index_id=index_id,
+                body=v1_index_data,
+            ),
+            operations.PutV1IndexesIndexIDJSONResponse,
+            accept_header_override,
+        )
+
+    async def get_v1_indexes_index_id_history(
+        self,
+        index_id: str,
+        time_start: datetime | None = None,
+        time_end: datetime | None = None,
+        limit: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1IndexesIndexIDHistoryResponse:
+        r"""Retrieve Historical Index Value and Composition."""
+        return await self._make_request_async(
+            "get_/v1/indexes/{index_id}/history",
+            operations.GetV1IndexesIndexIDHistoryRequest(
+                index_id=index_id,
+                time_start=time_start,
+                time_end=time_end,
+                limit=limit,
+            ),
+            operations.GetV1IndexesIndexIDHistoryResponse,
+            accept_header_override,
+        )
+
+    async def get_v1_indexes_index_id_timeseries(
+        self,
+        index_id: str,
+        time_start: datetime | None = None,
+        time_end: datetime | None = None,
+        limit: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1IndexesIndexIDTimeseriesResponse:
+        r"""Retrieve Historical Index Value Timeseries."""
+        return await self._make_request_async(
+            "get_/v1/indexes/{index_id}/timeseries",
+            operations.GetV1IndexesIndexIDTimeseriesRequest(
+                index_id=index_id,
+                time_start=time_start,
+                time_end=time_end,
+                limit=limit,
+            ),
+            operations.GetV1IndexesIndexIDTimeseriesResponse,
+            accept_header_override,
+        )
+
+    async def get_v1_indexes_index_id_timeseries_to_be_announced(
+        self,
+        request: operations.GetV1IndexesIndexIDTimeseriesTOBEANNOUNCEDRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1IndexesIndexIDTimeseriesTOBEANNOUNCEDResponse:
+        r"""Retrieve Historical Composition Value Timeseries.
+
+        Retrieves historical timeseries for the specific composition value for an index
+        """
+        return await self._make_request_async(
+            "get_/v1/indexes/{index_id}/timeseries/TO_BE_ANNOUNCED",
+            request,
+            operations.GetV1IndexesIndexIDTimeseriesTOBEANNOUNCEDResponse,
+            accept_header_override,
+        )
@@ -0,0 +1,323 @@
+"""Per-operation latency, size and decoding measurements."""
+
+import bisect
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import httpx
+import msgspec
+
+from coinapi.utils import utils
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Upper bounds in seconds of the latency histogram buckets."""
+
+SIZE_BUCKETS = tuple(256 * 4**i for i in range(11))
+"""Upper bounds in bytes of the response size histogram buckets, from 256 B to 256 MiB."""
+
+COUNT_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+"""Upper bounds of the item count histogram buckets."""
+
+COST_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1_000)
+"""Upper bounds in credits of the request cost histogram buckets."""
+
+HISTOGRAMS = {
+    "connect_seconds": LATENCY_BUCKETS,
+    "ttfb_seconds": LATENCY_BUCKETS,
+    "total_seconds": LATENCY_BUCKETS,
+    "response_bytes": SIZE_BUCKETS,
+    "decode_seconds": LATENCY_BUCKETS,
+    "items": COUNT_BUCKETS,
+    "cost": COST_BUCKETS,
+}
+"""Histograms recorded per operation and their bucket bounds."""
+
+_TRACE_KEY = "coinapi.trace"
+
+
+class HistogramSnapshot(msgspec.Struct, frozen=True):
+    """Copy of a histogram at a point in time."""
+
+    bounds: tuple[float, ...]
+    r"""Upper bounds of the buckets; a last bucket holds larger values"""
+    counts: tuple[int, ...]
+    r"""Observations per bucket"""
+    count: int
+    r"""Number of observations"""
+    sum: float
+    r"""Sum of the observations"""
+    min: float | None
+    r"""Smallest observation, or None without observations"""
+    max: float | None
+    r"""Largest observation, or None without observations"""
+
+    @property
+    def mean(self) -> float | None:
+        """Mean of the observations, or None without observations."""
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile by interpolating within its bucket."""
+        if not self.count or self.min is None or self.max is None:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.bounds[i - 1] if i else self.min
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.max
+
+
+class Histogram:
+    """Counts of observations in fixed buckets, with their sum and range."""
+
+    __slots__ = ("bounds", "count", "counts", "max", "min", "sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Copy the histogram."""
+        return HistogramSnapshot(
+            self.bounds,
+            tuple(self.counts),
+            self.count,
+            self.sum,
+            self.min,
+            self.max,
+        )
+
+
+class OperationSnapshot(msgspec.Struct, frozen=True):
+    """Measurements of an operation at a point in time."""
+
+    responses: int
+    r"""Responses received, including retried ones"""
+    errors: int
+    r"""Attempts that failed without a response"""
+    statuses: dict[int, int]
+    r"""Responses per status code"""
+    histograms: dict[str, HistogramSnapshot]
+    r"""Histograms by name, see `HISTOGRAMS`"""
+
+
+class _OperationStats:
+    """Measurements of an operation."""
+
+    __slots__ = ("errors", "histograms", "responses", "statuses")
+
+    def __init__(self) -> None:
+        self.responses = 0
+        self.errors = 0
+        self.statuses: dict[int, int] = {}
+        self.histograms = {
+            name: Histogram(bounds) for name, bounds in HISTOGRAMS.items()
+        }
+
+    def snapshot(self) -> OperationSnapshot:
+        """Copy the measurements."""
+        return OperationSnapshot(
+            self.responses,
+            self.errors,
+            dict(self.statuses),
+            {name: h.snapshot() for name, h in self.histograms.items()},
+        )
+
+
+class RequestTrace:
+    """Timings of one attempt, collected through the httpx `trace` extension.
+
+    Connection setup is only timed for attempts opening a new connection;
+    it includes name resolution, which httpcore does not report separately.
+    Every event is passed on to `forward`, the `trace` callback the request
+    carried before, if any.
+    """
+
+    __slots__ = ("connect_seconds", "forward", "started", "ttfb_seconds")
+
+    def __init__(
+        self,
+        forward: Callable[[str, dict[str, Any]], Any] | None = None,
+    ) -> None:
+        self.started = time.perf_counter()
+        self.connect_seconds: float | None = None
+        self.ttfb_seconds: float | None = None
+        self.forward = forward
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        """Record a trace event of a synchronous request."""
+        self._record(event_name)
+        if self.forward is not None:
+            self.forward(event_name, info)
+
+    async def atrace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Record a trace event of an asynchronous request."""
+        self._record(event_name)
+        if self.forward is not None:
+            await self.forward(event_name, info)
+
+    def _record(self, event_name: str) -> None:
+        """Time connection setup and first byte from their completion events."""
+        if event_name.endswith(".receive_response_headers.complete"):
+            self.ttfb_seconds = time.perf_counter() - self.started
+        elif event_name in {
+            "connection.connect_tcp.complete",
+            "connection.start_tls.complete",
+        }:
+            self.connect_seconds = time.perf_counter() - self.started
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the attempt started."""
+        return time.perf_counter() - self.started
+
+
+class Instrumentation:
+    """Record measurements of every request per operation id.
+
+    For each attempt the connection setup, time to first byte, total time
+    and downloaded bytes are recorded; for each decoded response the decode
+    time, item count and credit cost. Streamed responses are recorded when
+    the stream closes. The latest integer `X-RateLimit-*` and
+    `X-ConcurrencyLimit-*` headers are kept as well. A single lock guards
+    updates, so an instance can be shared between threads, event loops and
+    SDK instances.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: dict[str, _OperationStats] = {}
+        self._limits: dict[str, int] = {}
+
+    @property
+    def limits(self) -> dict[str, int]:
+        """Latest integer rate and concurrency limit headers, by lowercase name."""
+        with self._lock:
+            return dict(self._limits)
+
+    def start(self, request: httpx.Request, *, is_async: bool = False) -> None:
+        """Attach a trace to a request before it is sent.
+
+        A `trace` callback already set on the request keeps receiving every
+        event; a retried request forwards to the callback of its first attempt.
+        """
+        previous = request.extensions.get(_TRACE_KEY)
+        if isinstance(previous, RequestTrace):
+            forward = previous.forward
+        else:
+            forward = request.extensions.get("trace")
+        trace = RequestTrace(forward)
+        request.extensions["trace"] = trace.atrace if is_async else trace
+        request.extensions[_TRACE_KEY] = trace
+
+    def observe_response(self, operation_id: str, response: httpx.Response) -> None:
+        """Record the timings and size of a completed response."""
+        trace = response.request.extensions.get(_TRACE_KEY)
+        headers = response.headers
+        limits = {
+            name: value
+            for name in utils.get_limit_headers(headers)
+            if (value := utils.get_int_header(headers, name)) is not None
+        }
+        with self._lock:
+            self._limits.update(limits)
+            stats = self._stats(operation_id)
+            stats.responses += 1
+            status = response.status_code
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            histograms = stats.histograms
+            histograms["response_bytes"].observe(_response_bytes(response))
+            if isinstance(trace, RequestTrace):
+                histograms["total_seconds"].observe(trace.elapsed)
+                if trace.ttfb_seconds is not None:
+                    histograms["ttfb_seconds"].observe(trace.ttfb_seconds)
+                if trace.connect_seconds is not None:
+                    histograms["connect_seconds"].observe(trace.connect_seconds)
+
+    def observe_error(self, operation_id: str) -> None:
+        """Record an attempt that failed without a response."""
+        with self._lock:
+            self._stats(operation_id).errors += 1
+
+    def observe_decode(
+        self,
+        operation_id: str,
+        seconds: float | None,
+        items: int,
+        cost: int,
+    ) -> None:
+        """Record the decoding of a response."""
+        with self._lock:
+            histograms = self._stats(operation_id).histograms
+            if seconds is not None:
+                histograms["decode_seconds"].observe(seconds)
+            histograms["items"].observe(items)
+            histograms["cost"].observe(cost)
+
+    def snapshot(self, *, reset: bool = False) -> dict[str, OperationSnapshot]:
+        """Copy the measurements per operation id, optionally clearing them."""
+        with self._lock:
+            snapshot = {
+                operation: stats.snapshot()
+                for operation, stats in self._operations.items()
+            }
+            if reset:
+                self._operations.clear()
+        return snapshot
+
+    def reset(self) -> None:
+        """Clear all measurements."""
+        with self._lock:
+            self._operations.clear()
+
+    def _stats(self, operation_id: str) -> _OperationStats:
+        """Get the measurements of an operation, creating them if needed."""
+        stats = self._operations.get(operation_id)
+        if stats is None:
+            stats = self._operations[operation_id] = _OperationStats()
+        return stats
+
+
+def _response_bytes(response: httpx.Response) -> int:
+    """Get the bytes downloaded for a response, or its body size if not downloaded."""
+    if response.num_bytes_downloaded:
+        return response.num_bytes_downloaded
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return 0
@@ -209,3 +209,194 @@ class Metrics(Base):
             operations.GetV1MetricsAssetHistoryResponse,
             accept_header_override=accept_header_override,
         )
+
+
+class AsyncMetrics(Base):
+    r"""Asynchronous counterpart of :class:`Metrics`."""
+
+    async def get_v1_metrics_listing(
+        self,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsListingResponse:
+        r"""Listing of all supported metrics by CoinAPI.
+
+        Get all data metrics.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/listing",
+            operations.GetV1MetricsListingRequest(),
+            operations.GetV1MetricsListingResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_exchange_listing(
+        self,
+        exchange_id: str,
+        metric_id: str | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsExchangeListingResponse:
+        r"""Listing of all supported exchange metrics.
+
+        Get data metrics for exchange.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/exchange/listing",
+            operations.GetV1MetricsExchangeListingRequest(
+                exchange_id=exchange_id,
+                metric_id=metric_id,
+            ),
+            operations.GetV1MetricsExchangeListingResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_exchange_current(
+        self,
+        exchange_id: str,
+        metric_id: str | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsExchangeCurrentResponse:
+        r"""Current metrics for given exchange.
+
+        Get current exchange metrics values.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/exchange/current",
+            operations.GetV1MetricsExchangeCurrentRequest(
+                exchange_id=exchange_id,
+                metric_id=metric_id,
+            ),
+            operations.GetV1MetricsExchangeCurrentResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_exchange_history(
+        self,
+        request: operations.GetV1MetricsExchangeHistoryRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsExchangeHistoryResponse:
+        r"""Historical metrics for the exchange.
+
+        Get exchange metrics history.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/exchange/history",
+            request,
+            operations.GetV1MetricsExchangeHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_symbol_listing(
+        self,
+        metric_id: str | None = None,
+        exchange_id: str | None = None,
+        symbol_id: str | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsSymbolListingResponse:
+        r"""Listing of all supported metrics for symbol.
+
+        Get data metrics for symbol.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/symbol/listing",
+            operations.GetV1MetricsSymbolListingRequest(
+                metric_id=metric_id,
+                exchange_id=exchange_id,
+                symbol_id=symbol_id,
+            ),
+            operations.GetV1MetricsSymbolListingResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_symbol_current(
+        self,
+        metric_id: str | None = None,
+        symbol_id: str | None = None,
+        exchange_id: str | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsSymbolCurrentResponse:
+        r"""Current metrics for given symbol.
+
+        Get current symbol metrics.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/symbol/current",
+            operations.GetV1MetricsSymbolCurrentRequest(
+                metric_id=metric_id,
+                symbol_id=symbol_id,
+                exchange_id=exchange_id,
+            ),
+            operations.GetV1MetricsSymbolCurrentResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_symbol_history(
+        self,
+        request: operations.GetV1MetricsSymbolHistoryRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsSymbolHistoryResponse:
+        r"""Historical metrics for symbol.
+
+        Get symbol metrics history.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/symbol/history",
+            request,
+            operations.GetV1MetricsSymbolHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_asset_listing(
+        self,
+        request: operations.GetV1MetricsAssetListingRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsAssetListingResponse:
+        r"""Listing of all supported metrics for asset.
+
+        Get data metrics for asset.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/asset/listing",
+            request,
+            operations.GetV1MetricsAssetListingResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_asset_current(
+        self,
+        metric_id: str | None = None,
+        asset_id: str | None = None,
+        asset_id_external: str | None = None,
+        exchange_id: str | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsAssetCurrentResponse:
+        r"""Current metrics for given asset.
+
+        Get current asset metrics.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/asset/current",
+            operations.GetV1MetricsAssetCurrentRequest(
+                metric_id=metric_id,
+                asset_id=asset_id,
+                asset_id_external=asset_id_external,
+                exchange_id=exchange_id,
+            ),
+            operations.GetV1MetricsAssetCurrentResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_metrics_asset_history(
+        self,
+        request: operations.GetV1MetricsAssetHistoryRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1MetricsAssetHistoryResponse:
+        r"""Historical metrics for asset.
+
+        Get asset metrics history.
+        """
+        return await self._make_request_async(
+            "get_/v1/metrics/asset/history",
+            request,
+            operations.GetV1MetricsAssetHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
@@ -1,36 +1,41 @@
 """Components."""
 
-from coinapi.models.components.model_vwap24refrate import *
-from coinapi.models.components.models_exchangetimeseriesitem import *
-from coinapi.models.components.security import *
-from coinapi.models.components.v1_asset import *
-from coinapi.models.components.v1_exchange import *
-from coinapi.models.components.v1_exchangerate import *
-from coinapi.models.components.v1_exchangeratesrate import *
-from coinapi.models.components.v1_exchangeratestimeseriesitem import *
-from coinapi.models.components.v1_generaldata import *
-from coinapi.models.components.v1_icon import *
-from coinapi.models.components.v1_index import *
-from coinapi.models.components.v1_indexdata import *
-from coinapi.models.components.v1_indexdatacomponent import *
-from coinapi.models.components.v1_indexdataresponse import *
-from coinapi.models.components.v1_indextimeseriesitem import *
-from coinapi.models.components.v1_indexvalue import *
-from coinapi.models.components.v1_indexvaluecomponent import *
-from coinapi.models.components.v1_lasttrade import *
-from coinapi.models.components.v1_listingitem import *
-from coinapi.models.components.v1_metric import *
-from coinapi.models.components.v1_metricdata import *
-from coinapi.models.components.v1_orderbook import *
-from coinapi.models.components.v1_orderbookbase import *
-from coinapi.models.components.v1_orderbookdepth import *
-from coinapi.models.components.v1_quote import *
-from coinapi.models.components.v1_quotetrade import *
-from coinapi.models.components.v1_symbol import *
-from coinapi.models.components.v1_symbolmapping import *
-from coinapi.models.components.v1_timeseriesitem import *
-from coinapi.models.components.v1_timeseriesperiod import *
-from coinapi.models.components.v1_trade import *
+from typing import TYPE_CHECKING
+
+from coinapi._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from coinapi.models.components.model_vwap24refrate import *
+    from coinapi.models.components.models_exchangetimeseriesitem import *
+    from coinapi.models.components.security import *
+    from coinapi.models.components.v1_asset import *
+    from coinapi.models.components.v1_exchange import *
+    from coinapi.models.components.v1_exchangerate import *
+    from coinapi.models.components.v1_exchangeratesrate import *
+    from coinapi.models.components.v1_exchangeratestimeseriesitem import *
+    from coinapi.models.components.v1_generaldata import *
+    from coinapi.models.components.v1_icon import *
+    from coinapi.models.components.v1_index import *
+    from coinapi.models.components.v1_indexdata import *
+    from coinapi.models.components.v1_indexdatacomponent import *
+    from coinapi.models.components.v1_indexdataresponse import *
+    from coinapi.models.components.v1_indextimeseriesitem import *
+    from coinapi.models.components.v1_indexvalue import *
+    from coinapi.models.components.v1_indexvaluecomponent import *
+    from coinapi.models.components.v1_lasttrade import *
+    from coinapi.models.components.v1_listingitem import *
+    from coinapi.models.components.v1_metric import *
+    from coinapi.models.components.v1_metricdata import *
+    from coinapi.models.components.v1_orderbook import *
+    from coinapi.models.components.v1_orderbookbase import *
+    from coinapi.models.components.v1_orderbookdepth import *
+    from coinapi.models.components.v1_quote import *
+    from coinapi.models.components.v1_quotetrade import *
+    from coinapi.models.components.v1_symbol import *
+    from coinapi.models.components.v1_symbolmapping import *
+    from coinapi.models.components.v1_timeseriesitem import *
+    from coinapi.models.components.v1_timeseriesperiod import *
+    from coinapi.models.components.v1_trade import *
 
 __all__ = [
     "ModelVwap24RefRate",
@@ -65,3 +70,42 @@ __all__ = [
     "V1TimeseriesPeriod",
     "V1Trade",
 ]
+
+_EXPORTS = {
+    "ModelVwap24RefRate": "coinapi.models.components.model_vwap24refrate",
+    "ModelsExchangeTimeseriesItem": "coinapi.models.components.models_exchangetimeseriesitem",
+    "Security": "coinapi.models.components.security",
+    "V1Asset": "coinapi.models.components.v1_asset",
+    "V1Exchange": "coinapi.models.components.v1_exchange",
+    "V1ExchangeRate": "coinapi.models.components.v1_exchangerate",
+    "V1ExchangeRates": "coinapi.models.components.v1_exchangeratesrate",
+    "V1ExchangeRatesRate": "coinapi.models.components.v1_exchangeratesrate",
+    "V1ExchangeRatesTimeseriesItem": "coinapi.models.components.v1_exchangeratestimeseriesitem",
+    "V1GeneralData": "coinapi.models.components.v1_generaldata",
+    "V1Icon": "coinapi.models.components.v1_icon",
+    "V1Index": "coinapi.models.components.v1_index",
+    "V1IndexData": "coinapi.models.components.v1_indexdata",
+    "V1IndexDataComponent": "coinapi.models.components.v1_indexdatacomponent",
+    "V1IndexDataResponse": "coinapi.models.components.v1_indexdataresponse",
+    "V1IndexTimeseriesItem": "coinapi.models.components.v1_indextimeseriesitem",
+    "V1IndexValue": "coinapi.models.components.v1_indexvalue",
+    "V1IndexValueComponent": "coinapi.models.components.v1_indexvaluecomponent",
+    "V1LastTrade": "coinapi.models.components.v1_lasttrade",
+    "V1ListingItem": "coinapi.models.components.v1_listingitem",
+    "V1Metric": "coinapi.models.components.v1_metric",
+    "V1MetricData": "coinapi.models.components.v1_metricdata",
+    "V1OrderBook": "coinapi.models.components.v1_orderbook",
+    "V1OrderBookBase": "coinapi.models.components.v1_orderbookbase",
+    "V1OrderBookDepth": "coinapi.models.components.v1_orderbookdepth",
+    "V1Quote": "coinapi.models.components.v1_quote",
+    "V1QuoteTrade": "coinapi.models.components.v1_quotetrade",
+    "V1Symbol": "coinapi.models.components.v1_symbol",
+    "V1SymbolMapping": "coinapi.models.components.v1_symbolmapping",
+    "V1TimeseriesItem": "coinapi.models.components.v1_timeseriesitem",
+    "V1TimeseriesPeriod": "coinapi.models.components.v1_timeseriesperiod",
+    "V1Trade": "coinapi.models.components.v1_trade",
+}
+"""Module defining each exported name."""
+
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
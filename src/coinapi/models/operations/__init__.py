@@ -1,5 +1,64 @@
 """Operations."""
 
+from typing import TYPE_CHECKING
+
+from coinapi._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from coinapi.models.operations.base import CoinAPIRequest, CoinAPIResponse
+    from coinapi.models.operations.get_v1_assets import *
+    from coinapi.models.operations.get_v1_assets_asset_id_ import *
+    from coinapi.models.operations.get_v1_assets_icons_size_ import *
+    from coinapi.models.operations.get_v1_base_rates import *
+    from coinapi.models.operations.get_v1_exchanges import *
+    from coinapi.models.operations.get_v1_exchanges_exchange_id_ import *
+    from coinapi.models.operations.get_v1_exchanges_icons_size_ import *
+    from coinapi.models.operations.get_v1_history_periods import *
+    from coinapi.models.operations.get_v1_indexes import *
+    from coinapi.models.operations.get_v1_indexes_index_id_ import *
+    from coinapi.models.operations.get_v1_indexes_index_id_history import *
+    from coinapi.models.operations.get_v1_indexes_index_id_timeseries import *
+    from coinapi.models.operations.get_v1_indexes_index_id_timeseries_to_be_announced import *
+    from coinapi.models.operations.get_v1_metadata import *
+    from coinapi.models.operations.get_v1_metrics_asset_current import *
+    from coinapi.models.operations.get_v1_metrics_asset_history import *
+    from coinapi.models.operations.get_v1_metrics_asset_listing import *
+    from coinapi.models.operations.get_v1_metrics_exchange_current import *
+    from coinapi.models.operations.get_v1_metrics_exchange_history import *
+    from coinapi.models.operations.get_v1_metrics_exchange_listing import *
+    from coinapi.models.operations.get_v1_metrics_listing import *
+    from coinapi.models.operations.get_v1_metrics_symbol_current import *
+    from coinapi.models.operations.get_v1_metrics_symbol_history import *
+    from coinapi.models.operations.get_v1_metrics_symbol_listing import *
+    from coinapi.models.operations.get_v1_ohlcv_exchanges_exchange_id_history import *
+    from coinapi.models.operations.get_v1_ohlcv_periods import *
+    from coinapi.models.operations.get_v1_ohlcv_symbol_id_history import *
+    from coinapi.models.operations.get_v1_ohlcv_symbol_id_latest import *
+    from coinapi.models.operations.get_v1_orderbooks3_current import *
+    from coinapi.models.operations.get_v1_orderbooks3_symbol_id_current import *
+    from coinapi.models.operations.get_v1_orderbooks_symbol_id_current import *
+    from coinapi.models.operations.get_v1_orderbooks_symbol_id_depth_current import *
+    from coinapi.models.operations.get_v1_orderbooks_symbol_id_history import *
+    from coinapi.models.operations.get_v1_orderbooks_symbol_id_latest import *
+    from coinapi.models.operations.get_v1_pair_history import (
+        GetV1PairHistoryRequest,
+        GetV1PairHistoryResponse,
+    )
+    from coinapi.models.operations.get_v1_quotes_current import *
+    from coinapi.models.operations.get_v1_quotes_latest import *
+    from coinapi.models.operations.get_v1_quotes_symbol_id_current import *
+    from coinapi.models.operations.get_v1_quotes_symbol_id_history import *
+    from coinapi.models.operations.get_v1_quotes_symbol_id_latest import *
+    from coinapi.models.operations.get_v1_specific_rate import *
+    from coinapi.models.operations.get_v1_symbols import *
+    from coinapi.models.operations.get_v1_symbols_exchange_id_ import *
+    from coinapi.models.operations.get_v1_symbols_map_exchange_id_ import *
+    from coinapi.models.operations.get_v1_trades_latest import *
+    from coinapi.models.operations.get_v1_trades_symbol_id_history import *
+    from coinapi.models.operations.get_v1_trades_symbol_id_latest import *
+    from coinapi.models.operations.post_v1_indexes_json import *
+    from coinapi.models.operations.put_v1_indexes_index_id_json import *
+
 __all__ = (
     "CoinAPIRequest",
     "CoinAPIResponse",
@@ -97,56 +156,109 @@ __all__ = (
     "PutV1IndexesIndexIDJSONResponse",
 )
 
-from coinapi.models.operations.base import CoinAPIRequest, CoinAPIResponse
-from coinapi.models.operations.get_v1_assets import *
-from coinapi.models.operations.get_v1_assets_asset_id_ import *
-from coinapi.models.operations.get_v1_assets_icons_size_ import *
-from coinapi.models.operations.get_v1_base_rates import *
-from coinapi.models.operations.get_v1_exchanges import *
-from coinapi.models.operations.get_v1_exchanges_exchange_id_ import *
-from coinapi.models.operations.get_v1_exchanges_icons_size_ import *
-from coinapi.models.operations.get_v1_history_periods import *
-from coinapi.models.operations.get_v1_indexes import *
-from coinapi.models.operations.get_v1_indexes_index_id_ import *
-from coinapi.models.operations.get_v1_indexes_index_id_history import *
-from coinapi.models.operations.get_v1_indexes_index_id_timeseries import *
-from coinapi.models.operations.get_v1_indexes_index_id_timeseries_to_be_announced import *
-from coinapi.models.operations.get_v1_metadata import *
-from coinapi.models.operations.get_v1_metrics_asset_current import *
-from coinapi.models.operations.get_v1_metrics_asset_history import *
-from coinapi.models.operations.get_v1_metrics_asset_listing import *
-from coinapi.models.operations.get_v1_metrics_exchange_current import *
-from coinapi.models.operations.get_v1_metrics_exchange_history import *
-from coinapi.models.operations.get_v1_metrics_exchange_listing import *
-from coinapi.models.operations.get_v1_metrics_listing import *
-from coinapi.models.operations.get_v1_metrics_symbol_current import *
-from coinapi.models.operations.get_v1_metrics_symbol_history import *
-from coinapi.models.operations.get_v1_metrics_symbol_listing import *
-from coinapi.models.operations.get_v1_ohlcv_exchanges_exchange_id_history import *
-from coinapi.models.operations.get_v1_ohlcv_periods import *
-from coinapi.models.operations.get_v1_ohlcv_symbol_id_history import *
-from coinapi.models.operations.get_v1_ohlcv_symbol_id_latest import *
-from coinapi.models.operations.get_v1_orderbooks3_current import *
-from coinapi.models.operations.get_v1_orderbooks3_symbol_id_current import *
-from coinapi.models.operations.get_v1_orderbooks_symbol_id_current import *
-from coinapi.models.operations.get_v1_orderbooks_symbol_id_depth_current import *
-from coinapi.models.operations.get_v1_orderbooks_symbol_id_history import *
-from coinapi.models.operations.get_v1_orderbooks_symbol_id_latest import *
-from coinapi.models.operations.get_v1_pair_history import (
-    GetV1PairHistoryRequest,
-    GetV1PairHistoryResponse,
-)
-from coinapi.models.operations.get_v1_quotes_current import *
-from coinapi.models.operations.get_v1_quotes_latest import *
-from coinapi.models.operations.get_v1_quotes_symbol_id_current import *
-from coinapi.models.operations.get_v1_quotes_symbol_id_history import *
-from coinapi.models.operations.get_v1_quotes_symbol_id_latest import *
-from coinapi.models.operations.get_v1_specific_rate import *
-from coinapi.models.operations.get_v1_symbols import *
-from coinapi.models.operations.get_v1_symbols_exchange_id_ import *
-from coinapi.models.operations.get_v1_symbols_map_exchange_id_ import *
-from coinapi.models.operations.get_v1_trades_latest import *
-from coinapi.models.operations.get_v1_trades_symbol_id_history import *
-from coinapi.models.operations.get_v1_trades_symbol_id_latest import *
-from coinapi.models.operations.post_v1_indexes_json import *
-from coinapi.models.operations.put_v1_indexes_index_id_json import *
+_EXPORTS = {
+    "CoinAPIRequest": "coinapi.models.operations.base",
+    "CoinAPIResponse": "coinapi.models.operations.base",
+    "GetV1AssetsAssetIDRequest": "coinapi.models.operations.get_v1_assets_asset_id_",
+    "GetV1AssetsAssetIDResponse": "coinapi.models.operations.get_v1_assets_asset_id_",
+    "GetV1AssetsIconsSizeRequest": "coinapi.models.operations.get_v1_assets_icons_size_",
+    "GetV1AssetsIconsSizeResponse": "coinapi.models.operations.get_v1_assets_icons_size_",
+    "GetV1AssetsRequest": "coinapi.models.operations.get_v1_assets",
+    "GetV1AssetsResponse": "coinapi.models.operations.get_v1_assets",
+    "GetV1BaseRatesRequest": "coinapi.models.operations.get_v1_base_rates",
+    "GetV1BaseRatesResponse": "coinapi.models.operations.get_v1_base_rates",
+    "GetV1ExchangesExchangeIDRequest": "coinapi.models.operations.get_v1_exchanges_exchange_id_",
+    "GetV1ExchangesExchangeIDResponse": "coinapi.models.operations.get_v1_exchanges_exchange_id_",
+    "GetV1ExchangesIconsSizeRequest": "coinapi.models.operations.get_v1_exchanges_icons_size_",
+    "GetV1ExchangesIconsSizeResponse": "coinapi.models.operations.get_v1_exchanges_icons_size_",
+    "GetV1ExchangesRequest": "coinapi.models.operations.get_v1_exchanges",
+    "GetV1ExchangesResponse": "coinapi.models.operations.get_v1_exchanges",
+    "GetV1HistoryPeriodsRequest": "coinapi.models.operations.get_v1_history_periods",
+    "GetV1HistoryPeriodsResponse": "coinapi.models.operations.get_v1_history_periods",
+    "GetV1IndexesIndexIDHistoryRequest": "coinapi.models.operations.get_v1_indexes_index_id_history",
+    "GetV1IndexesIndexIDHistoryResponse": "coinapi.models.operations.get_v1_indexes_index_id_history",
+    "GetV1IndexesIndexIDRequest": "coinapi.models.operations.get_v1_indexes_index_id_",
+    "GetV1IndexesIndexIDResponse": "coinapi.models.operations.get_v1_indexes_index_id_",
+    "GetV1IndexesIndexIDTimeseriesRequest": "coinapi.models.operations.get_v1_indexes_index_id_timeseries",
+    "GetV1IndexesIndexIDTimeseriesResponse": "coinapi.models.operations.get_v1_indexes_index_id_timeseries",
+    "GetV1IndexesIndexIDTimeseriesTOBEANNOUNCEDRequest": "coinapi.models.operations.get_v1_indexes_index_id_timeseries_to_be_announced",
+    "GetV1IndexesIndexIDTimeseriesTOBEANNOUNCEDResponse": "coinapi.models.operations.get_v1_indexes_index_id_timeseries_to_be_announced",
+    "GetV1IndexesRequest": "coinapi.models.operations.get_v1_indexes",
+    "GetV1IndexesResponse": "coinapi.models.operations.get_v1_indexes",
+    "GetV1MetadataRequest": "coinapi.models.operations.get_v1_metadata",
+    "GetV1MetadataResponse": "coinapi.models.operations.get_v1_metadata",
+    "GetV1MetricsAssetCurrentRequest": "coinapi.models.operations.get_v1_metrics_asset_current",
+    "GetV1MetricsAssetCurrentResponse": "coinapi.models.operations.get_v1_metrics_asset_current",
+    "GetV1MetricsAssetHistoryRequest": "coinapi.models.operations.get_v1_metrics_asset_history",
+    "GetV1MetricsAssetHistoryResponse": "coinapi.models.operations.get_v1_metrics_asset_history",
+    "GetV1MetricsAssetListingRequest": "coinapi.models.operations.get_v1_metrics_asset_listing",
+    "GetV1MetricsAssetListingResponse": "coinapi.models.operations.get_v1_metrics_asset_listing",
+    "GetV1MetricsExchangeCurrentRequest": "coinapi.models.operations.get_v1_metrics_exchange_current",
+    "GetV1MetricsExchangeCurrentResponse": "coinapi.models.operations.get_v1_metrics_exchange_current",
+    "GetV1MetricsExchangeHistoryRequest": "coinapi.models.operations.get_v1_metrics_exchange_history",
+    "GetV1MetricsExchangeHistoryResponse": "coinapi.models.operations.get_v1_metrics_exchange_history",
+    "GetV1MetricsExchangeListingRequest": "coinapi.models.operations.get_v1_metrics_exchange_listing",
+    "GetV1MetricsExchangeListingResponse": "coinapi.models.operations.get_v1_metrics_exchange_listing",
+    "GetV1MetricsListingRequest": "coinapi.models.operations.get_v1_metrics_listing",
+    "GetV1MetricsListingResponse": "coinapi.models.operations.get_v1_metrics_listing",
+    "GetV1MetricsSymbolCurrentRequest": "coinapi.models.operations.get_v1_metrics_symbol_current",
+    "GetV1MetricsSymbolCurrentResponse": "coinapi.models.operations.get_v1_metrics_symbol_current",
+    "GetV1MetricsSymbolHistoryRequest": "coinapi.models.operations.get_v1_metrics_symbol_history",
+    "GetV1MetricsSymbolHistoryResponse": "coinapi.models.operations.get_v1_metrics_symbol_history",
+    "GetV1MetricsSymbolListingRequest": "coinapi.models.operations.get_v1_metrics_symbol_listing",
+    "GetV1MetricsSymbolListingResponse": "coinapi.models.operations.get_v1_metrics_symbol_listing",
+    "GetV1OhlcvExchangesExchangeIDHistoryRequest": "coinapi.models.operations.get_v1_ohlcv_exchanges_exchange_id_history",
+    "GetV1OhlcvExchangesExchangeIDHistoryResponse": "coinapi.models.operations.get_v1_ohlcv_exchanges_exchange_id_history",
+    "GetV1OhlcvPeriodsRequest": "coinapi.models.operations.get_v1_ohlcv_periods",
+    "GetV1OhlcvPeriodsResponse": "coinapi.models.operations.get_v1_ohlcv_periods",
+    "GetV1OhlcvSymbolIDHistoryRequest": "coinapi.models.operations.get_v1_ohlcv_symbol_id_history",
+    "GetV1OhlcvSymbolIDHistoryResponse": "coinapi.models.operations.get_v1_ohlcv_symbol_id_history",
+    "GetV1OhlcvSymbolIDLatestRequest": "coinapi.models.operations.get_v1_ohlcv_symbol_id_latest",
+    "GetV1OhlcvSymbolIDLatestResponse": "coinapi.models.operations.get_v1_ohlcv_symbol_id_latest",
+    "GetV1Orderbooks3CurrentRequest": "coinapi.models.operations.get_v1_orderbooks3_current",
+    "GetV1Orderbooks3CurrentResponse": "coinapi.models.operations.get_v1_orderbooks3_current",
+    "GetV1Orderbooks3SymbolIDCurrentRequest": "coinapi.models.operations.get_v1_orderbooks3_symbol_id_current",
+    "GetV1Orderbooks3SymbolIDCurrentResponse": "coinapi.models.operations.get_v1_orderbooks3_symbol_id_current",
+    "GetV1OrderbooksSymbolIDCurrentRequest": "coinapi.models.operations.get_v1_orderbooks_symbol_id_current",
+    "GetV1OrderbooksSymbolIDCurrentResponse": "coinapi.models.operations.get_v1_orderbooks_symbol_id_current",
+    "GetV1OrderbooksSymbolIDDepthCurrentRequest": "coinapi.models.operations.get_v1_orderbooks_symbol_id_depth_current",
+    "GetV1OrderbooksSymbolIDDepthCurrentResponse": "coinapi.models.operations.get_v1_orderbooks_symbol_id_depth_current",
+    "GetV1OrderbooksSymbolIDHistoryRequest": "coinapi.models.operations.get_v1_orderbooks_symbol_id_history",
+    "GetV1OrderbooksSymbolIDHistoryResponse": "coinapi.models.operations.get_v1_orderbooks_symbol_id_history",
+    "GetV1OrderbooksSymbolIDLatestRequest": "coinapi.models.operations.get_v1_orderbooks_symbol_id_latest",
+    "GetV1OrderbooksSymbolIDLatestResponse": "coinapi.models.operations.get_v1_orderbooks_symbol_id_latest",
+    "GetV1PairHistoryRequest": "coinapi.models.operations.get_v1_pair_history",
+    "GetV1PairHistoryResponse": "coinapi.models.operations.get_v1_pair_history",
+    "GetV1QuotesCurrentRequest": "coinapi.models.operations.get_v1_quotes_current",
+    "GetV1QuotesCurrentResponse": "coinapi.models.operations.get_v1_quotes_current",
+    "GetV1QuotesLatestRequest": "coinapi.models.operations.get_v1_quotes_latest",
+    "GetV1QuotesLatestResponse": "coinapi.models.operations.get_v1_quotes_latest",
+    "GetV1QuotesSymbolIDCurrentRequest": "coinapi.models.operations.get_v1_quotes_symbol_id_current",
+    "GetV1QuotesSymbolIDCurrentResponse": "coinapi.models.operations.get_v1_quotes_symbol_id_current",
+    "GetV1QuotesSymbolIDHistoryRequest": "coinapi.models.operations.get_v1_quotes_symbol_id_history",
+    "GetV1QuotesSymbolIDHistoryResponse": "coinapi.models.operations.get_v1_quotes_symbol_id_history",
+    "GetV1QuotesSymbolIDLatestRequest": "coinapi.models.operations.get_v1_quotes_symbol_id_latest",
+    "GetV1QuotesSymbolIDLatestResponse": "coinapi.models.operations.get_v1_quotes_symbol_id_latest",
+    "GetV1SpecificRateRequest": "coinapi.models.operations.get_v1_specific_rate",
+    "GetV1SpecificRateResponse": "coinapi.models.operations.get_v1_specific_rate",
+    "GetV1SymbolsExchangeIDRequest": "coinapi.models.operations.get_v1_symbols_exchange_id_",
+    "GetV1SymbolsExchangeIDResponse": "coinapi.models.operations.get_v1_symbols_exchange_id_",
+    "GetV1SymbolsMapExchangeIDRequest": "coinapi.models.operations.get_v1_symbols_map_exchange_id_",
+    "GetV1SymbolsMapExchangeIDResponse": "coinapi.models.operations.get_v1_symbols_map_exchange_id_",
+    "GetV1SymbolsRequest": "coinapi.models.operations.get_v1_symbols",
+    "GetV1SymbolsResponse": "coinapi.models.operations.get_v1_symbols",
+    "GetV1TradesLatestRequest": "coinapi.models.operations.get_v1_trades_latest",
+    "GetV1TradesLatestResponse": "coinapi.models.operations.get_v1_trades_latest",
+    "GetV1TradesSymbolIDHistoryRequest": "coinapi.models.operations.get_v1_trades_symbol_id_history",
+    "GetV1TradesSymbolIDHistoryResponse": "coinapi.models.operations.get_v1_trades_symbol_id_history",
+    "GetV1TradesSymbolIDLatestRequest": "coinapi.models.operations.get_v1_trades_symbol_id_latest",
+    "GetV1TradesSymbolIDLatestResponse": "coinapi.models.operations.get_v1_trades_symbol_id_latest",
+    "PostV1IndexesJSONRequest": "coinapi.models.operations.post_v1_indexes_json",
+    "PostV1IndexesJSONResponse": "coinapi.models.operations.post_v1_indexes_json",
+    "PutV1IndexesIndexIDJSONRequest": "coinapi.models.operations.put_v1_indexes_index_id_json",
+    "PutV1IndexesIndexIDJSONResponse": "coinapi.models.operations.put_v1_indexes_index_id_json",
+}
+"""Module defining each exported name."""
+
+if not TYPE_CHECKING:
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
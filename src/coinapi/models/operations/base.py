@@ -22,11 +22,13 @@ class CoinAPIResponse(msgspec.Struct, omit_defaults=True):
     r"""HTTP response content type for this operation"""
     status_code: int = msgspec.field()
     r"""HTTP response status code for this operation"""
-    raw_response: httpx.Response = msgspec.field()
-    r"""Raw HTTP response; suitable for custom response parsing"""
+    raw_response: httpx.Response | None = msgspec.field(default=None)
+    r"""Raw HTTP response; suitable for custom response parsing. Not kept with lean responses"""
+    headers: dict[str, str] = msgspec.field(default_factory=dict)
+    r"""Rate limit and concurrency limit headers of the HTTP response"""
     content_plain: str | None = msgspec.field(default=None)
     r"""successful operation"""
     content: Any = msgspec.field(default=None)
     r"""successful operation"""
     body: bytes | None = msgspec.field(default=None)
-    r"""successful operation"""
+    r"""successful operation; not kept with lean responses"""
@@ -1,7 +1,54 @@
 """OHLCV operations."""
 
+import datetime as dt
+from collections.abc import AsyncIterator, Iterator, Mapping
+from typing import Any
+
+from coinapi import batch, paging, timeranges
 from coinapi.base import AcceptEnum, Base
-from coinapi.models import operations
+from coinapi.models import components, operations
+
+
+def _history_request(
+    symbol_id: str,
+    period_id: str,
+    chunk: timeranges.TimeRange,
+    limit: int,
+    *,
+    include_empty_items: bool,
+) -> operations.GetV1OhlcvSymbolIDHistoryRequest:
+    """Build the request of one chunk of a time range."""
+    return operations.GetV1OhlcvSymbolIDHistoryRequest(
+        symbol_id=symbol_id,
+        period_id=period_id,
+        time_start=paging.format_time(chunk[0]),
+        time_end=paging.format_time(chunk[1]),
+        limit=limit,
+        include_empty_items=include_empty_items,
+    )
+
+
+def _exchange_history_arguments(
+    exchange_id: str,
+    period_id: str,
+    day: timeranges.TimeRange,
+) -> Mapping[str, Any]:
+    """Build the keyword arguments of the exchange-wide request of one day.
+
+    Both times must fall on the same day, so a day ending at the next
+    midnight is requested up to its last instant instead.
+    """
+    start, end = day
+    if end.date() == start.date():
+        time_end = paging.format_time(end)
+    else:
+        time_end = f"{start.date().isoformat()}T23:59:59.9999999"
+    return {
+        "exchange_id": exchange_id,
+        "period_id": period_id,
+        "time_start": paging.format_time(start),
+        "time_end": time_end,
+    }
 
 
 class Ohlcv(Base):
@@ -74,6 +121,72 @@ class Ohlcv(Base):
             accept_header_override=accept_header_override,
         )
 
+    def stream_v1_ohlcv_symbol_id_history(
+        self,
+        request: operations.GetV1OhlcvSymbolIDHistoryRequest,
+    ) -> Iterator[components.V1TimeseriesItem]:
+        r"""[ohlcv] Historical data, decoded item by item.
+
+        Streaming variant of :meth:`get_v1_ohlcv_symbol_id_history`
+        yielding each item as soon as it is received, so memory stays bounded
+        regardless of `limit`.
+        """
+        return self._stream_request(
+            "get_/v1/ohlcv/{symbol_id}/history",
+            request,
+            operations.GetV1OhlcvSymbolIDHistoryResponse,
+        )
+
+    def get_ohlcv_history_range(  # noqa: PLR0913
+        self,
+        symbol_id: str,
+        period_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        include_empty_items: bool = False,
+        max_workers: int = batch.DEFAULT_MAX_WORKERS,
+    ) -> timeranges.OhlcvSeries:
+        r"""[ohlcv] Historical data over a time range of any length.
+
+        Splits `[time_start, time_end)` into chunks of at most `limit`
+        periods, aligned to the period looked up in :meth:`get_v1_ohlcv_periods`,
+        and fetches them concurrently on a thread pool of `max_workers`.
+        Requests pass through the configured rate limiter and concurrency
+        governor; the first failing chunk raises its error. The chunks are
+        merged into one series in time ascending order, along with the spans
+        no item covers.
+        """
+        start, end = timeranges.parse_time(time_start), timeranges.parse_time(time_end)
+        period = timeranges.find_period(
+            self.get_v1_ohlcv_periods().content or [],
+            period_id,
+        )
+        chunks = timeranges.split(start, end, period, limit)
+        results = batch.run_batch(
+            [
+                (
+                    self.get_v1_ohlcv_symbol_id_history,
+                    _history_request(
+                        symbol_id,
+                        period_id,
+                        chunk,
+                        limit,
+                        include_empty_items=include_empty_items,
+                    ),
+                )
+                for chunk in chunks
+            ],
+            max_workers=max_workers,
+        )
+        return timeranges.merge(
+            (result.unwrap().content or [] for result in results),
+            start,
+            end,
+            period,
+        )
+
     def get_v1_ohlcv_exchanges_exchange_id_history(
         self,
         exchange_id: str,
@@ -104,6 +217,43 @@ class Ohlcv(Base):
             accept_header_override=accept_header_override,
         )
 
+    def iter_ohlcv_exchange_history(
+        self,
+        exchange_id: str,
+        period_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime,
+        *,
+        max_workers: int = batch.DEFAULT_MAX_WORKERS,
+    ) -> Iterator[timeranges.ExchangeOhlcvDay]:
+        r"""[ohlcv] Historical data by exchange over a range of any length.
+
+        Fans `[time_start, time_end)` out into one
+        :meth:`get_v1_ohlcv_exchanges_exchange_id_history` request per UTC
+        day, executed concurrently on a thread pool of `max_workers`, and
+        yields the items of each day grouped by symbol, in day order. Days
+        are requested as they are consumed, so at most `max_workers` of them
+        are held at a time. The first failing day raises its error.
+        """
+        days = timeranges.split(
+            timeranges.parse_time(time_start),
+            timeranges.parse_time(time_end),
+            timeranges.DAY,
+            1,
+        )
+        results = batch.iter_batch(
+            (
+                (
+                    self.get_v1_ohlcv_exchanges_exchange_id_history,
+                    _exchange_history_arguments(exchange_id, period_id, day),
+                )
+                for day in days
+            ),
+            max_workers=max_workers,
+        )
+        for day, result in zip(days, results, strict=True):
+            yield timeranges.group_by_symbol(day, result.unwrap().content or [])
+
     def get_v1_ohlcv_symbol_id_latest(
         self,
         symbol_id: str,
@@ -135,3 +285,218 @@ class Ohlcv(Base):
             operations.GetV1OhlcvSymbolIDLatestResponse,
             accept_header_override=accept_header_override,
         )
+
+
+class AsyncOhlcv(Base):
+    r"""Asynchronous counterpart of :class:`Ohlcv`."""
+
+    async def get_v1_ohlcv_periods(
+        self,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1OhlcvPeriodsResponse:
+        r"""[ohlcv] List all periods.
+
+        Get full list of supported time periods available for requesting OHLCV timeseries data.
+
+        ### Available periods
+
+        Time unit | Period identifiers
+        --------- | -----------
+        Second | 1SEC, 2SEC, 3SEC, 4SEC, 5SEC, 6SEC, 10SEC, 15SEC, 20SEC, 30SEC
+        Minute | 1MIN, 2MIN, 3MIN, 4MIN, 5MIN, 6MIN, 10MIN, 15MIN, 20MIN, 30MIN
+        Hour | 1HRS, 2HRS, 3HRS, 4HRS, 6HRS, 8HRS, 12HRS
+        Day | 1DAY, 2DAY, 3DAY, 5DAY, 7DAY, 10DAY
+        Month | 1MTH, 2MTH, 3MTH, 4MTH, 6MTH
+        Year | 1YRS, 2YRS, 3YRS, 4YRS, 5YRS
+
+        :::tip
+        You can assume that we will not remove any periods from this response, however, we may add new ones.
+        :::
+        """
+        return await self._make_request_async(
+            "get_/v1/ohlcv/periods",
+            operations.GetV1OhlcvPeriodsRequest(),
+            operations.GetV1OhlcvPeriodsResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_ohlcv_symbol_id_history(
+        self,
+        request: operations.GetV1OhlcvSymbolIDHistoryRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1OhlcvSymbolIDHistoryResponse:
+        r"""[ohlcv] Historical data.
+
+        Get OHLCV timeseries data returned in time ascending order. Data can
+        be requested by the period and for the specific symbol eg
+        `BITSTAMP_SPOT_BTC_USD`, if you need to query timeseries by asset
+        pairs eg. `BTC/USD`, then please reffer to the Exchange Rates Timeseries data.
+
+        :::info
+        The OHLCV Historical endpoint data can be delayed a few seconds. Use OHLCV Latest endpoint to get real-time data without delay.
+        :::
+        """
+        return await self._make_request_async(
+            "get_/v1/ohlcv/{symbol_id}/history",
+            request,
+            operations.GetV1OhlcvSymbolIDHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    def stream_v1_ohlcv_symbol_id_history(
+        self,
+        request: operations.GetV1OhlcvSymbolIDHistoryRequest,
+    ) -> AsyncIterator[components.V1TimeseriesItem]:
+        r"""[ohlcv] Historical data, decoded item by item.
+
+        Streaming variant of :meth:`get_v1_ohlcv_symbol_id_history`
+        yielding each item as soon as it is received, so memory stays bounded
+        regardless of `limit`.
+        """
+        return self._stream_request_async(
+            "get_/v1/ohlcv/{symbol_id}/history",
+            request,
+            operations.GetV1OhlcvSymbolIDHistoryResponse,
+        )
+
+    async def get_ohlcv_history_range(  # noqa: PLR0913
+        self,
+        symbol_id: str,
+        period_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        include_empty_items: bool = False,
+        max_workers: int = batch.DEFAULT_MAX_WORKERS,
+    ) -> timeranges.OhlcvSeries:
+        r"""[ohlcv] Historical data over a time range of any length.
+
+        Asynchronous counterpart of :meth:`Ohlcv.get_ohlcv_history_range`,
+        fetching at most `max_workers` chunks at the same time.
+        """
+        start, end = timeranges.parse_time(time_start), timeranges.parse_time(time_end)
+        periods = await self.get_v1_ohlcv_periods()
+        period = timeranges.find_period(periods.content or [], period_id)
+        chunks = timeranges.split(start, end, period, limit)
+        results = await batch.run_batch_async(
+            [
+                (
+                    self.get_v1_ohlcv_symbol_id_history,
+                    _history_request(
+                        symbol_id,
+                        period_id,
+                        chunk,
+                        limit,
+                        include_empty_items=include_empty_items,
+                    ),
+                )
+                for chunk in chunks
+            ],
+            max_workers=max_workers,
+        )
+        return timeranges.merge(
+            (result.unwrap().content or [] for result in results),
+            start,
+            end,
+            period,
+        )
+
+    async def get_v1_ohlcv_exchanges_exchange_id_history(
+        self,
+        exchange_id: str,
+        period_id: str,
+        time_start: str,
+        time_end: str,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1OhlcvExchangesExchangeIDHistoryResponse:
+        r"""[ohlcv] Historical data by exchange.
+
+        Get OHLCV timeseries data returned in time ascending order. Data can
+        be requested by the period and for the specific exchange eg `BITSTAMP`
+
+        :::info
+        The OHLCV Historical endpoint data can be delayed a few seconds.
+        `time_start` and `time_end` must point to the same day
+        :::
+        """
+        return await self._make_request_async(
+            "get_/v1/ohlcv/exchanges/{exchange_id}/history",
+            operations.GetV1OhlcvExchangesExchangeIDHistoryRequest(
+                exchange_id=exchange_id,
+                period_id=period_id,
+                time_start=time_start,
+                time_end=time_end,
+            ),
+            operations.GetV1OhlcvExchangesExchangeIDHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def iter_ohlcv_exchange_history(
+        self,
+        exchange_id: str,
+        period_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime,
+        *,
+        max_workers: int = batch.DEFAULT_MAX_WORKERS,
+    ) -> AsyncIterator[timeranges.ExchangeOhlcvDay]:
+        r"""[ohlcv] Historical data by exchange over a range of any length.
+
+        Asynchronous counterpart of :meth:`Ohlcv.iter_ohlcv_exchange_history`,
+        requesting at most `max_workers` days at the same time.
+        """
+        days = timeranges.split(
+            timeranges.parse_time(time_start),
+            timeranges.parse_time(time_end),
+            timeranges.DAY,
+            1,
+        )
+        results = batch.aiter_batch(
+            (
+                (
+                    self.get_v1_ohlcv_exchanges_exchange_id_history,
+                    _exchange_history_arguments(exchange_id, period_id, day),
+                )
+                for day in days
+            ),
+            max_workers=max_workers,
+        )
+        day_iter = iter(days)
+        async for result in results:
+            yield timeranges.group_by_symbol(
+                next(day_iter),
+                result.unwrap().content or [],
+            )
+
+    async def get_v1_ohlcv_symbol_id_latest(
+        self,
+        symbol_id: str,
+        period_id: str | None = None,
+        limit: int | None = None,
+        include_empty_items: bool | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1OhlcvSymbolIDLatestResponse:
+        r"""[ohlcv] Latest data.
+
+        Get OHLCV latest timeseries data returned in time descending order.
+        Data can be requested by the period and for the specific symbol
+        eg `BITSTAMP_SPOT_BTC_USD`, if you need to query timeseries by asset pairs
+        eg. `BTC/USD`, then please reffer to the Exchange Rates Timeseries data.
+
+        :::info
+        OHLCV Latest endpoint is providing real-time data without delay.
+        The OHLCV Historical endpoint data can be delayed a few seconds.
+        :::
+        """
+        return await self._make_request_async(
+            "get_/v1/ohlcv/{symbol_id}/latest",
+            operations.GetV1OhlcvSymbolIDLatestRequest(
+                symbol_id=symbol_id,
+                period_id=period_id,
+                limit=limit,
+                include_empty_items=include_empty_items,
+            ),
+            operations.GetV1OhlcvSymbolIDLatestResponse,
+            accept_header_override=accept_header_override,
+        )
@@ -1,7 +1,21 @@
 """Order book module."""
 
+import datetime as dt
+from collections.abc import AsyncIterator, Callable, Iterator
+
+from coinapi import paging
 from coinapi.base import AcceptEnum, Base
-from coinapi.models import operations
+from coinapi.models import components, operations
+
+
+def _book_time(book: components.V1OrderBook) -> dt.datetime:
+    """Get the time order book snapshots are ordered and paged by."""
+    return book.time_exchange
+
+
+def _book_key(book: components.V1OrderBook) -> tuple[dt.datetime, dt.datetime]:
+    """Get the key identifying an order book snapshot."""
+    return book.time_exchange, book.time_coinapi
 
 
 class OrderBook(Base):
@@ -60,6 +74,69 @@ class OrderBook(Base):
             accept_header_override=accept_header_override,
         )
 
+    def stream_v1_orderbooks_symbol_id_history(
+        self,
+        request: operations.GetV1OrderbooksSymbolIDHistoryRequest,
+    ) -> Iterator[components.V1OrderBook]:
+        r"""[order book] Historical data, decoded item by item.
+
+        Streaming variant of :meth:`get_v1_orderbooks_symbol_id_history`
+        yielding each item as soon as it is received, so memory stays bounded
+        regardless of `limit`.
+        """
+        return self._stream_request(
+            "get_/v1/orderbooks/{symbol_id}/history",
+            request,
+            operations.GetV1OrderbooksSymbolIDHistoryResponse,
+        )
+
+    def iter_orderbooks_history(  # noqa: PLR0913
+        self,
+        symbol_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime | None = None,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        limit_levels: int | None = None,
+        on_page: Callable[[paging.PageReport], None] | None = None,
+    ) -> Iterator[components.V1OrderBook]:
+        r"""[order book] Historical data, across as many pages as needed.
+
+        Yields every snapshot from `time_start` until `time_end`, or until
+        the latest snapshot, with at most `limit_levels` levels per side.
+        Pages of `limit` snapshots are streamed, so memory stays bounded
+        however long the range. Each page starts at the last snapshot of the
+        previous one; snapshots returned twice at the boundary are dropped
+        by their times. `on_page` is called with the cost of each page once
+        it is consumed.
+        """
+        end = None if time_end is None else paging.format_time(time_end)
+        cursor = paging.TimeCursor(
+            time_start,
+            limit=limit,
+            time_of=_book_time,
+            key_of=_book_key,
+        )
+        pages = paging.PageCosts(on_page)
+        while (start := cursor.start) is not None:
+            snapshots = self._stream_request(
+                "get_/v1/orderbooks/{symbol_id}/history",
+                operations.GetV1OrderbooksSymbolIDHistoryRequest(
+                    symbol_id=symbol_id,
+                    time_start=start,
+                    time_end=end,
+                    limit=limit,
+                    limit_levels=limit_levels,
+                ),
+                operations.GetV1OrderbooksSymbolIDHistoryResponse,
+                on_cost=pages.spend,
+            )
+            items = 0
+            for book in cursor.stream(snapshots):
+                items += 1
+                yield book
+            pages.report(start, items)
+
     def get_v1_orderbooks_symbol_id_current(
         self,
         symbol_id: str,
@@ -105,3 +182,150 @@ class OrderBook(Base):
             operations.GetV1OrderbooksSymbolIDLatestResponse,
             accept_header_override=accept_header_override,
         )
+
+
+class AsyncOrderBook(Base):
+    r"""Asynchronous counterpart of :class:`OrderBook`."""
+
+    async def get_v1_orderbooks_symbol_id_depth_current(
+        self,
+        symbol_id: str,
+        limit_levels: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1OrderbooksSymbolIDDepthCurrentResponse:
+        r"""[order book] Current depth of the order book.
+
+        Retrieves the current depth of the order book for the specified symbol.
+        """
+        return await self._make_request_async(
+            "get_/v1/orderbooks/{symbol_id}/depth/current",
+            operations.GetV1OrderbooksSymbolIDDepthCurrentRequest(
+                symbol_id=symbol_id,
+                limit_levels=limit_levels,
+            ),
+            operations.GetV1OrderbooksSymbolIDDepthCurrentResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_orderbooks_symbol_id_history(
+        self,
+        request: operations.GetV1OrderbooksSymbolIDHistoryRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1OrderbooksSymbolIDHistoryResponse:
+        r"""[order book] Historical data.
+
+        Get historical order book snapshots for a specific symbol within time range, returned in time ascending order.
+
+        :::info
+        The historical order book data via the REST API is currently limited by a number of updates and to the maximum number of 20 levels.
+        :::
+        """
+        return await self._make_request_async(
+            "get_/v1/orderbooks/{symbol_id}/history",
+            request,
+            operations.GetV1OrderbooksSymbolIDHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    def stream_v1_orderbooks_symbol_id_history(
+        self,
+        request: operations.GetV1OrderbooksSymbolIDHistoryRequest,
+    ) -> AsyncIterator[components.V1OrderBook]:
+        r"""[order book] Historical data, decoded item by item.
+
+        Streaming variant of :meth:`get_v1_orderbooks_symbol_id_history`
+        yielding each item as soon as it is received, so memory stays bounded
+        regardless of `limit`.
+        """
+        return self._stream_request_async(
+            "get_/v1/orderbooks/{symbol_id}/history",
+            request,
+            operations.GetV1OrderbooksSymbolIDHistoryResponse,
+        )
+
+    async def iter_orderbooks_history(  # noqa: PLR0913
+        self,
+        symbol_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime | None = None,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        limit_levels: int | None = None,
+        on_page: Callable[[paging.PageReport], None] | None = None,
+    ) -> AsyncIterator[components.V1OrderBook]:
+        r"""[order book] Historical data, across as many pages as needed.
+
+        Asynchronous counterpart of :meth:`OrderBook.iter_orderbooks_history`.
+        """
+        end = None if time_end is None else paging.format_time(time_end)
+        cursor = paging.TimeCursor(
+            time_start,
+            limit=limit,
+            time_of=_book_time,
+            key_of=_book_key,
+        )
+        pages = paging.PageCosts(on_page)
+        while (start := cursor.start) is not None:
+            snapshots = self._stream_request_async(
+                "get_/v1/orderbooks/{symbol_id}/history",
+                operations.GetV1OrderbooksSymbolIDHistoryRequest(
+                    symbol_id=symbol_id,
+                    time_start=start,
+                    time_end=end,
+                    limit=limit,
+                    limit_levels=limit_levels,
+                ),
+                operations.GetV1OrderbooksSymbolIDHistoryResponse,
+                on_cost=pages.spend,
+            )
+            items = 0
+            async for book in cursor.astream(snapshots):
+                items += 1
+                yield book
+            pages.report(start, items)
+
+    async def get_v1_orderbooks_symbol_id_current(
+        self,
+        symbol_id: str,
+        limit_levels: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1OrderbooksSymbolIDCurrentResponse:
+        r"""Get current order book.
+
+        Retrieves the current order book for the specified symbol.
+        """
+        return await self._make_request_async(
+            "get_/v1/orderbooks/{symbol_id}/current",
+            operations.GetV1OrderbooksSymbolIDCurrentRequest(
+                symbol_id=symbol_id,
+                limit_levels=limit_levels,
+            ),
+            operations.GetV1OrderbooksSymbolIDCurrentResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_orderbooks_symbol_id_latest(
+        self,
+        symbol_id: str,
+        limit: int | None = None,
+        limit_levels: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1OrderbooksSymbolIDLatestResponse:
+        r"""[order book] Latest data.
+
+        Get latest order book snapshots for a specific symbol, returned in time descending order.
+
+        :::info
+        The historical order book data via the REST API is currently limited by a number of updates and to the maximum number of 20 levels.
+        :::
+        """
+        return await self._make_request_async(
+            "get_/v1/orderbooks/{symbol_id}/latest",
+            operations.GetV1OrderbooksSymbolIDLatestRequest(
+                symbol_id=symbol_id,
+                limit=limit,
+                limit_levels=limit_levels,
+            ),
+            operations.GetV1OrderbooksSymbolIDLatestResponse,
+            accept_header_override=accept_header_override,
+        )
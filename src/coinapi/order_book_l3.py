@@ -43,3 +43,44 @@ class OrderBookL3(Base):
             operations.GetV1Orderbooks3SymbolIDCurrentResponse,
             accept_header_override=accept_header_override,
         )
+
+
+class AsyncOrderBookL3(Base):
+    r"""Asynchronous counterpart of :class:`OrderBookL3`."""
+
+    async def get_v1_orderbooks3_current(
+        self,
+        filter_symbol_id: str | None = None,
+        limit_levels: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1Orderbooks3CurrentResponse:
+        r"""[order book l3] Current order books."""
+        return await self._make_request_async(
+            "get_/v1/orderbooks3/current",
+            operations.GetV1Orderbooks3CurrentRequest(
+                filter_symbol_id=filter_symbol_id,
+                limit_levels=limit_levels,
+            ),
+            operations.GetV1Orderbooks3CurrentResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_orderbooks3_symbol_id_current(
+        self,
+        symbol_id: str,
+        limit_levels: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1Orderbooks3SymbolIDCurrentResponse:
+        r"""[order book l3] Current order book by symbol_id.
+
+        Retrieves the current order book for the specified symbol.
+        """
+        return await self._make_request_async(
+            "get_/v1/orderbooks3/{symbol_id}/current",
+            operations.GetV1Orderbooks3SymbolIDCurrentRequest(
+                symbol_id=symbol_id,
+                limit_levels=limit_levels,
+            ),
+            operations.GetV1Orderbooks3SymbolIDCurrentResponse,
+            accept_header_override=accept_header_override,
+        )
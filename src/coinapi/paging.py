@@ -0,0 +1,249 @@
+"""Paging through history operations by advancing a time cursor."""
+
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import datetime as dt
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from typing import Generic, TypeVar
+
+import msgspec
+
+DEFAULT_PAGE_LIMIT = 100_000
+"""Items requested per page, the most history operations return."""
+
+_OVERLAP = dt.timedelta(microseconds=1)
+
+_T = TypeVar("_T")
+
+
+def format_time(value: str | dt.datetime) -> str:
+    """Format a time as an ISO 8601 query parameter, taking naive times as UTC."""
+    if isinstance(value, str):
+        return value
+    if value.tzinfo is not None:
+        value = value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+class TimeCursor(Generic[_T]):
+    """Position within a time-ordered history, advanced one page at a time.
+
+    A full page means more items may follow, so the next page starts at the
+    time of the last item. Decoded times are rounded to microseconds while
+    the API keeps 100 ns, so the next page starts a microsecond earlier and
+    items already returned in that overlap are dropped by their key. Keys
+    are counted, so items sharing a key are each dropped only as many times
+    as they were returned in the overlap.
+    """
+
+    def __init__(
+        self,
+        time_start: str | dt.datetime,
+        *,
+        limit: int,
+        time_of: Callable[[_T], dt.datetime],
+        key_of: Callable[[_T], Hashable],
+    ) -> None:
+        self.start: str | None = format_time(time_start)
+        r"""Start of the next page, or None once the history is exhausted."""
+        self.limit = limit
+        r"""Items requested per page."""
+        self._time_of = time_of
+        self._key_of = key_of
+        self._seen: collections.Counter[Hashable] = collections.Counter()
+
+    def advance(self, page: Sequence[_T]) -> list[_T]:
+        """Take the next page, returning its new items and moving the cursor.
+
+        Raises `ValueError` when a full page holds no new item, as more than
+        `limit` items share a microsecond and the cursor cannot move past them.
+        """
+        items = [item for item in page if self._is_new(item)]
+        self._move(len(page), len(items), page)
+        return items
+
+    def stream(self, page: Iterable[_T]) -> Iterator[_T]:
+        """Yield the new items of the next page as they arrive, then move the cursor.
+
+        Only the items of the last microsecond are held, so memory does not
+        grow with the page. The cursor does not move if the page is not
+        consumed to the end.
+        """
+        tail: collections.deque[_T] = collections.deque()
+        size = new = 0
+        for item in page:
+            size += 1
+            if self._push(tail, item):
+                new += 1
+                yield item
+        self._move(size, new, tail)
+
+    async def astream(self, page: AsyncIterable[_T]) -> AsyncIterator[_T]:
+        """Yield the new items of the next page as they arrive, asynchronously."""
+        tail: collections.deque[_T] = collections.deque()
+        size = new = 0
+        async for item in page:
+            size += 1
+            if self._push(tail, item):
+                new += 1
+                yield item
+        self._move(size, new, tail)
+
+    def _push(self, tail: collections.deque[_T], item: _T) -> bool:
+        """Append an item to the tail of a page, returning whether it is new."""
+        time_of = self._time_of
+        boundary = time_of(item) - _OVERLAP
+        while tail and time_of(tail[0]) < boundary:
+            tail.popleft()
+        tail.append(item)
+        return self._is_new(item)
+
+    def _is_new(self, item: _T) -> bool:
+        """Tell whether an item is new, counting off a repeat from the overlap."""
+        if not self._seen:
+            return True
+        key = self._key_of(item)
+        count = self._seen[key]
+        if not count:
+            return True
+        if count == 1:
+            del self._seen[key]
+        else:
+            self._seen[key] = count - 1
+        return False
+
+    def _move(self, size: int, new: int, tail: Sequence[_T]) -> None:
+        """Move past a page of `size` items, `new` of them unseen, ending with `tail`."""
+        if size < self.limit:
+            self.start = None
+            return
+        if not new:
+            msg = f"more than {self.limit} items at {self.start}, use a larger limit"
+            raise ValueError(msg)
+        key_of, time_of = self._key_of, self._time_of
+        boundary = time_of(tail[-1]) - _OVERLAP
+        self._seen = collections.Counter(
+            key_of(item) for item in tail if time_of(item) >= boundary
+        )
+        self.start = format_time(boundary)
+
+
+class PageReport(msgspec.Struct, frozen=True):
+    r"""Cost of a page of history, reported as paging goes."""
+
+    time_start: str
+    r"""Start of the page."""
+    items: int
+    r"""New items of the page."""
+    credits: int
+    r"""Credits the page cost, as reported by the API or else as estimated."""
+    total_credits: int
+    r"""Credits all pages so far cost."""
+
+
+class PageCosts:
+    """Credits spent paging through a history, reported page by page."""
+
+    def __init__(self, on_page: Callable[[PageReport], None] | None) -> None:
+        self.total = 0
+        r"""Credits all reported pages cost."""
+        self._on_page = on_page
+        self._credits = 0
+
+    def spend(self, cost: int) -> None:
+        """Take the cost of the current page."""
+        self._credits += cost
+
+    def report(self, time_start: str, items: int) -> None:
+        """Report the current page, starting at `time_start` with `items` new items."""
+        self.total += self._credits
+        if self._on_page is not None:
+            self._on_page(
+                PageReport(
+                    time_start=time_start,
+                    items=items,
+                    credits=self._credits,
+                    total_credits=self.total,
+                ),
+            )
+        self._credits = 0
+
+
+def iter_pages(
+    fetch: Callable[[str], Sequence[_T]],
+    cursor: TimeCursor[_T],
+    *,
+    prefetch: bool = True,
+) -> Generator[list[_T], None, None]:
+    """Yield the new items of each page, fetching pages from the cursor start.
+
+    With `prefetch`, the next page is requested on a background thread while
+    the current one is consumed.
+    """
+    start = cursor.start
+    if not prefetch or start is None:
+        while cursor.start is not None:
+            yield cursor.advance(fetch(cursor.start))
+        return
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1,
+        thread_name_prefix="coinapi-prefetch",
+    )
+    try:
+        future = executor.submit(fetch, start)
+        while True:
+            items = cursor.advance(future.result())
+            start = cursor.start
+            if start is None:
+                yield items
+                return
+            future = executor.submit(fetch, start)
+            yield items
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch: Callable[[str], Awaitable[Sequence[_T]]],
+    cursor: TimeCursor[_T],
+    *,
+    prefetch: bool = True,
+) -> AsyncGenerator[list[_T], None]:
+    """Yield the new items of each page asynchronously.
+
+    With `prefetch`, the next page is requested in a task while the current
+    one is consumed.
+    """
+    start = cursor.start
+    if not prefetch or start is None:
+        while cursor.start is not None:
+            yield cursor.advance(await fetch(cursor.start))
+        return
+    task = asyncio.ensure_future(fetch(start))
+    try:
+        while True:
+            items = cursor.advance(await task)
+            start = cursor.start
+            if start is None:
+                yield items
+                return
+            task = asyncio.ensure_future(fetch(start))
+            yield items
+    finally:
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
@@ -0,0 +1,296 @@
+"""Prometheus text exposition of the SDK's measurements."""
+
+import http.server
+import math
+import threading
+
+from coinapi.concurrency import ConcurrencyGovernor
+from coinapi.instrumentation import HistogramSnapshot, Instrumentation
+from coinapi.ratelimit import RateLimiter
+from coinapi.utils.retries import RetryPolicy
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text exposition format."""
+
+DEFAULT_PORT = 9464
+"""Port the metrics endpoint listens on by default."""
+
+HISTOGRAM_METRICS = {
+    "connect_seconds": (
+        "coinapi_connect_seconds",
+        "Time to set up new connections, including name resolution.",
+    ),
+    "ttfb_seconds": (
+        "coinapi_ttfb_seconds",
+        "Time from sending a request to its first response byte.",
+    ),
+    "total_seconds": (
+        "coinapi_request_duration_seconds",
+        "Time to send a request and receive its whole response.",
+    ),
+    "response_bytes": (
+        "coinapi_response_bytes",
+        "Bytes downloaded per response.",
+    ),
+    "decode_seconds": (
+        "coinapi_decode_seconds",
+        "Time to decode a response.",
+    ),
+    "items": (
+        "coinapi_response_items",
+        "Items decoded per response.",
+    ),
+    "cost": (
+        "coinapi_request_cost_credits",
+        "Credits a request cost.",
+    ),
+}
+"""Metric name and help text of each instrumentation histogram."""
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _labels(**labels: str) -> str:
+    """Format a label set."""
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class _Writer:
+    """Collect metric families in exposition order."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        """Start a metric family."""
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, **labels: str) -> None:
+        """Add a sample to the current family."""
+        self.lines.append(f"{name}{_labels(**labels)} {_format_value(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        operation: str,
+        histogram: HistogramSnapshot,
+    ) -> None:
+        """Add the cumulative buckets, sum and count of a histogram."""
+        cumulative = 0
+        for bound, count in zip(
+            (*histogram.bounds, math.inf),
+            histogram.counts,
+            strict=True,
+        ):
+            cumulative += count
+            self.sample(
+                f"{name}_bucket",
+                cumulative,
+                operation=operation,
+                le=_format_value(bound),
+            )
+        self.sample(f"{name}_sum", histogram.sum, operation=operation)
+        self.sample(f"{name}_count", histogram.count, operation=operation)
+
+    def render(self) -> str:
+        """Get the exposition text."""
+        return "\n".join(self.lines) + "\n" if self.lines else ""
+
+
+class PrometheusExporter:
+    """Render the state of SDK components as Prometheus metrics.
+
+    Each source is optional and only read when metrics are rendered, so an
+    exporter adds no work to requests. Pass the same components that are
+    passed to the SDK.
+    """
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation | None = None,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_governor: ConcurrencyGovernor | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        self.instrumentation = instrumentation
+        r"""Source of request counters, histograms and limit headers."""
+        self.rate_limiter = rate_limiter
+        r"""Source of the client-side request budget."""
+        self.concurrency_governor = concurrency_governor
+        r"""Source of the adaptive concurrency limit."""
+        self.retry_policy = retry_policy
+        r"""Source of the retry counters."""
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        writer = _Writer()
+        if self.instrumentation is not None:
+            self._render_instrumentation(writer, self.instrumentation)
+        if self.rate_limiter is not None:
+            self._render_rate_limiter(writer, self.rate_limiter)
+        if self.concurrency_governor is not None:
+            self._render_governor(writer, self.concurrency_governor)
+        if self.retry_policy is not None:
+            self._render_retries(writer, self.retry_policy)
+        return writer.render()
+
+    def serve(
+        self,
+        port: int = DEFAULT_PORT,
+        host: str = "127.0.0.1",
+    ) -> http.server.ThreadingHTTPServer:
+        """Serve the metrics at `/metrics` from a daemon thread.
+
+        Call `shutdown` on the returned server to stop it.
+        """
+        exporter = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_: object) -> None:
+                """Do not log scrapes."""
+
+        server = http.server.ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever,
+            name="coinapi-metrics",
+            daemon=True,
+        ).start()
+        return server
+
+    @staticmethod
+    def _render_instrumentation(
+        writer: _Writer,
+        instrumentation: Instrumentation,
+    ) -> None:
+        """Render request counters, histograms and limit headers."""
+        snapshot = instrumentation.snapshot()
+        writer.family(
+            "coinapi_responses_total",
+            "counter",
+            "Responses received, by operation and status code.",
+        )
+        for operation, stats in snapshot.items():
+            for status, count in sorted(stats.statuses.items()):
+                writer.sample(
+                    "coinapi_responses_total",
+                    count,
+                    operation=operation,
+                    status=str(status),
+                )
+        writer.family(
+            "coinapi_transport_errors_total",
+            "counter",
+            "Attempts that failed without a response, by operation.",
+        )
+        for operation, stats in snapshot.items():
+            writer.sample(
+                "coinapi_transport_errors_total",
+                stats.errors,
+                operation=operation,
+            )
+        for key, (name, help_text) in HISTOGRAM_METRICS.items():
+            writer.family(name, "histogram", help_text)
+            for operation, stats in snapshot.items():
+                writer.histogram(name, operation, stats.histograms[key])
+        for header, value in sorted(instrumentation.limits.items()):
+            name = "coinapi_" + header.removeprefix("x-").replace("-", "_")
+            writer.family(name, "gauge", f"Latest {header} response header.")
+            writer.sample(name, value)
+
+    @staticmethod
+    def _render_rate_limiter(writer: _Writer, limiter: RateLimiter) -> None:
+        """Render the client-side request budget."""
+        remaining, limit = limiter.remaining, limiter.limit
+        if remaining is not None:
+            writer.family(
+                "coinapi_limiter_remaining_credits",
+                "gauge",
+                "Credits the rate limiter expects to be left in the window.",
+            )
+            writer.sample("coinapi_limiter_remaining_credits", remaining)
+        if limit is not None:
+            writer.family(
+                "coinapi_limiter_limit_credits",
+                "gauge",
+                "Credits allowed per window.",
+            )
+            writer.sample("coinapi_limiter_limit_credits", limit)
+        writer.family(
+            "coinapi_limiter_spent_credits",
+            "gauge",
+            "Credits spent through the rate limiter within the window.",
+        )
+        writer.sample("coinapi_limiter_spent_credits", limiter.spent)
+
+    @staticmethod
+    def _render_governor(writer: _Writer, governor: ConcurrencyGovernor) -> None:
+        """Render the adaptive concurrency limit."""
+        writer.family(
+            "coinapi_concurrency_limit",
+            "gauge",
+            "Requests the concurrency governor allows in flight.",
+        )
+        writer.sample("coinapi_concurrency_limit", governor.limit)
+        writer.family(
+            "coinapi_concurrency_in_flight",
+            "gauge",
+            "Requests in flight.",
+        )
+        writer.sample("coinapi_concurrency_in_flight", governor.in_flight)
+        server_limit = governor.server_limit
+        if server_limit is not None:
+            writer.family(
+                "coinapi_concurrency_server_limit",
+                "gauge",
+                "Concurrent requests the API allows.",
+            )
+            writer.sample("coinapi_concurrency_server_limit", server_limit)
+
+    @staticmethod
+    def _render_retries(writer: _Writer, policy: RetryPolicy) -> None:
+        """Render the retry counters and budget."""
+        snapshot = policy.metrics.snapshot()
+        for counter in policy.metrics.COUNTERS:
+            name = f"coinapi_retry_{counter}_total"
+            writer.family(
+                name,
+                "counter",
+                f"Retry {counter.replace('_', ' ')} count, by operation.",
+            )
+            for operation, counts in snapshot.items():
+                writer.sample(name, counts[counter], operation=operation)
+        writer.family(
+            "coinapi_retry_budget_tokens",
+            "gauge",
+            "Retries the retry budget currently allows.",
+        )
+        writer.sample("coinapi_retry_budget_tokens", policy.budget.tokens)
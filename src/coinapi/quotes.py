@@ -1,7 +1,21 @@
 """Quote operations."""
 
+import datetime as dt
+from collections.abc import AsyncIterator, Iterator
+
+from coinapi import paging
 from coinapi.base import AcceptEnum, Base
-from coinapi.models import operations
+from coinapi.models import components, operations
+
+
+def _quote_time(quote: components.V1Quote) -> dt.datetime:
+    """Get the time quotes are ordered and paged by."""
+    return quote.time_exchange
+
+
+def _quote_key(quote: components.V1Quote) -> components.V1Quote:
+    """Get the key identifying a quote, the whole quote as it has no id."""
+    return quote
 
 
 class Quotes(Base):
@@ -31,6 +45,86 @@ class Quotes(Base):
             accept_header_override=accept_header_override,
         )
 
+    def stream_v1_quotes_symbol_id_history(
+        self,
+        symbol_id: str,
+        time_start: str | None = None,
+        time_end: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[components.V1Quote]:
+        r"""[quotes] Historical data, decoded item by item.
+
+        Streaming variant of :meth:`get_v1_quotes_symbol_id_history`
+        yielding each item as soon as it is received, so memory stays bounded
+        regardless of `limit`.
+        """
+        return self._stream_request(
+            "get_/v1/quotes/{symbol_id}/history",
+            operations.GetV1QuotesSymbolIDHistoryRequest(
+                symbol_id=symbol_id,
+                time_start=time_start,
+                time_end=time_end,
+                limit=limit,
+            ),
+            operations.GetV1QuotesSymbolIDHistoryResponse,
+        )
+
+    def iter_quotes_history(
+        self,
+        symbol_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime | None = None,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        prefetch: bool = True,
+    ) -> Iterator[components.V1Quote]:
+        r"""[quotes] Historical data, across as many pages as needed.
+
+        Yields every quote update from `time_start` until `time_end`, or
+        until the latest update. See :meth:`iter_quotes_history_pages`.
+        """
+        for page in self.iter_quotes_history_pages(
+            symbol_id,
+            time_start,
+            time_end,
+            limit=limit,
+            prefetch=prefetch,
+        ):
+            yield from page
+
+    def iter_quotes_history_pages(
+        self,
+        symbol_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime | None = None,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        prefetch: bool = True,
+    ) -> Iterator[list[components.V1Quote]]:
+        r"""[quotes] Historical data, page by page.
+
+        Yields the quote updates of each page of `limit` updates from
+        `time_start` until `time_end`, or until the latest update. Each page
+        starts at the last update of the previous one; updates returned
+        twice at the boundary are dropped, counting identical updates so each
+        separate one is still yielded. With `prefetch`, the next page is requested
+        while the current one is consumed, which costs one page more than
+        needed if iteration stops early.
+        """
+        end = None if time_end is None else paging.format_time(time_end)
+
+        def fetch(start: str) -> list[components.V1Quote]:
+            res = self.get_v1_quotes_symbol_id_history(symbol_id, start, end, limit)
+            return res.content or []
+
+        cursor = paging.TimeCursor(
+            time_start,
+            limit=limit,
+            time_of=_quote_time,
+            key_of=_quote_key,
+        )
+        return paging.iter_pages(fetch, cursor, prefetch=prefetch)
+
     def get_v1_quotes_current(
         self,
         filter_symbol_id: str | None = None,
@@ -101,3 +195,181 @@ class Quotes(Base):
             operations.GetV1QuotesSymbolIDLatestResponse,
             accept_header_override=accept_header_override,
         )
+
+
+class AsyncQuotes(Base):
+    r"""Asynchronous counterpart of :class:`Quotes`."""
+
+    async def get_v1_quotes_symbol_id_history(
+        self,
+        symbol_id: str,
+        time_start: str | None = None,
+        time_end: str | None = None,
+        limit: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1QuotesSymbolIDHistoryResponse:
+        r"""[quotes] Historical data.
+
+        Get historical quote updates within requested time range, returned in time ascending order.
+        """
+        return await self._make_request_async(
+            "get_/v1/quotes/{symbol_id}/history",
+            operations.GetV1QuotesSymbolIDHistoryRequest(
+                symbol_id=symbol_id,
+                time_start=time_start,
+                time_end=time_end,
+                limit=limit,
+            ),
+            operations.GetV1QuotesSymbolIDHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    def stream_v1_quotes_symbol_id_history(
+        self,
+        symbol_id: str,
+        time_start: str | None = None,
+        time_end: str | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[components.V1Quote]:
+        r"""[quotes] Historical data, decoded item by item.
+
+        Streaming variant of :meth:`get_v1_quotes_symbol_id_history`
+        yielding each item as soon as it is received, so memory stays bounded
+        regardless of `limit`.
+        """
+        return self._stream_request_async(
+            "get_/v1/quotes/{symbol_id}/history",
+            operations.GetV1QuotesSymbolIDHistoryRequest(
+                symbol_id=symbol_id,
+                time_start=time_start,
+                time_end=time_end,
+                limit=limit,
+            ),
+            operations.GetV1QuotesSymbolIDHistoryResponse,
+        )
+
+    async def iter_quotes_history(
+        self,
+        symbol_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime | None = None,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        prefetch: bool = True,
+    ) -> AsyncIterator[components.V1Quote]:
+        r"""[quotes] Historical data, across as many pages as needed.
+
+        Asynchronous counterpart of :meth:`Quotes.iter_quotes_history`.
+        """
+        async for page in self.iter_quotes_history_pages(
+            symbol_id,
+            time_start,
+            time_end,
+            limit=limit,
+            prefetch=prefetch,
+        ):
+            for quote in page:
+                yield quote
+
+    def iter_quotes_history_pages(
+        self,
+        symbol_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime | None = None,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        prefetch: bool = True,
+    ) -> AsyncIterator[list[components.V1Quote]]:
+        r"""[quotes] Historical data, page by page.
+
+        Asynchronous counterpart of :meth:`Quotes.iter_quotes_history_pages`.
+        """
+        end = None if time_end is None else paging.format_time(time_end)
+
+        async def fetch(start: str) -> list[components.V1Quote]:
+            res = await self.get_v1_quotes_symbol_id_history(
+                symbol_id,
+                start,
+                end,
+                limit,
+            )
+            return res.content or []
+
+        cursor = paging.TimeCursor(
+            time_start,
+            limit=limit,
+            time_of=_quote_time,
+            key_of=_quote_key,
+        )
+        return paging.aiter_pages(fetch, cursor, prefetch=prefetch)
+
+    async def get_v1_quotes_current(
+        self,
+        filter_symbol_id: str | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1QuotesCurrentResponse:
+        r"""[quotes] Current data.
+
+        Get current quotes for all symbols or for a specific symbol.
+
+        :::info
+        When requesting current data for a specific symbol, output is not encapsulated
+        into JSON array as only one item is returned.
+        :::
+        """
+        return await self._make_request_async(
+            "get_/v1/quotes/current",
+            operations.GetV1QuotesCurrentRequest(filter_symbol_id=filter_symbol_id),
+            operations.GetV1QuotesCurrentResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_quotes_symbol_id_current(
+        self,
+        symbol_id: str,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1QuotesSymbolIDCurrentResponse:
+        r"""[quotes] Current quotes for a specific symbol."""
+        return await self._make_request_async(
+            "get_/v1/quotes/{symbol_id}/current",
+            operations.GetV1QuotesSymbolIDCurrentRequest(symbol_id=symbol_id),
+            operations.GetV1QuotesSymbolIDCurrentResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_quotes_latest(
+        self,
+        filter_symbol_id: str | None = None,
+        limit: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1QuotesLatestResponse:
+        r"""[quotes] Latest data.
+
+        Get latest updates of the quotes up to 1 minute ago. Latest data is always returned in time descending order.
+        """
+        return await self._make_request_async(
+            "get_/v1/quotes/latest",
+            operations.GetV1QuotesLatestRequest(
+                filter_symbol_id=filter_symbol_id,
+                limit=limit,
+            ),
+            operations.GetV1QuotesLatestResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_quotes_symbol_id_latest(
+        self,
+        symbol_id: str,
+        limit: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1QuotesSymbolIDLatestResponse:
+        r"""[quotes] Latest quote updates for a specific symbol."""
+        return await self._make_request_async(
+            "get_/v1/quotes/{symbol_id}/latest",
+            operations.GetV1QuotesSymbolIDLatestRequest(
+                symbol_id=symbol_id,
+                limit=limit,
+            ),
+            operations.GetV1QuotesSymbolIDLatestResponse,
+            accept_header_override=accept_header_override,
+        )
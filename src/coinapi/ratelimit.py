@@ -0,0 +1,208 @@
+"""Client-side pacing of requests against the CoinAPI request budget."""
+
+import asyncio
+import collections
+import math
+import threading
+import time
+from collections.abc import Callable
+
+import httpx
+
+from coinapi.utils import utils
+
+WINDOW = 24 * 60 * 60.0
+"""Length in seconds of the sliding window the request budget applies to."""
+
+DEFAULT_PROBE_INTERVAL = 60.0
+"""Seconds to wait before probing the API when the spend log cannot explain an exhausted budget."""
+
+DATA_POINTS_PER_CREDIT = 100
+"""Data points returned per request credit when the `limit` parameter is used."""
+
+
+def estimate_cost(request: httpx.Request) -> int:
+    """Estimate the credits a request costs from its `limit` query parameter."""
+    limit = request.url.params.get("limit")
+    if limit is None or not limit.isdigit():
+        return 1
+    return max(1, math.ceil(int(limit) / DATA_POINTS_PER_CREDIT))
+
+
+class RateLimiter:
+    """Pace requests so they stay within the 24 hour sliding request budget.
+
+    The budget is read from the `X-RateLimit-*` headers of every response.
+    Credits spent by this limiter are logged with their time, so credits
+    returning to the budget as the window slides are accounted for between
+    responses. When the budget is exhausted, callers wait until enough
+    logged credits leave the window; if the log cannot cover the deficit,
+    because credits were spent elsewhere, a single request is let through
+    every `probe_interval` seconds to refresh the budget from the API.
+
+    A limiter is safe to share between threads, event loops and SDK
+    instances using the same API key.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = WINDOW,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window = window
+        r"""Length in seconds of the sliding window."""
+        self.probe_interval = probe_interval
+        r"""Seconds between probes when the deficit cannot be explained."""
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._spent: collections.deque[tuple[float, int]] = collections.deque()
+        self._spent_total = 0
+        self._pending = 0
+        self._remaining: int | None = None
+        self._limit: int | None = None
+        self._blocked_until = 0.0
+        self._next_probe: float | None = None
+
+    @property
+    def remaining(self) -> int | None:
+        """Credits left in the window, or None while the budget is unknown."""
+        with self._lock:
+            self._expire(self._clock())
+            return self._remaining
+
+    @property
+    def limit(self) -> int | None:
+        """Credits allowed per window, or None while unknown."""
+        return self._limit
+
+    @property
+    def spent(self) -> int:
+        """Credits spent through this limiter within the window."""
+        with self._lock:
+            self._expire(self._clock())
+            return self._spent_total
+
+    def acquire(self, cost: int = 1) -> None:
+        """Block until `cost` credits can be spent, then reserve them."""
+        while (wait := self._reserve(cost)) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, cost: int = 1) -> None:
+        """Wait until `cost` credits can be spent, then reserve them."""
+        while (wait := self._reserve(cost)) > 0:  # noqa: ASYNC110
+            await asyncio.sleep(wait)
+
+    def release(self, cost: int) -> None:
+        """Give back credits reserved for a request that was never answered."""
+        with self._lock:
+            self._pending -= cost
+            if self._remaining is not None:
+                self._remaining += cost
+            self._adjust_log(-cost)
+
+    def update(self, response: httpx.Response, reserved: int) -> None:
+        """Reconcile a reservation with the budget reported by a response."""
+        headers = response.headers
+        now = self._clock()
+        with self._lock:
+            self._pending -= reserved
+            cost = utils.get_int_header(headers, "x-ratelimit-request-cost")
+            if cost is not None and cost != reserved:
+                self._adjust_log(cost - reserved)
+            limit = utils.get_int_header(headers, "x-ratelimit-limit")
+            if limit is not None:
+                self._limit = limit
+            remaining = self._reported_remaining(headers)
+            if remaining is not None:
+                # The report does not include requests still in flight
+                self._remaining = remaining - self._pending
+            elif self._remaining is not None and cost is not None:
+                self._remaining += reserved - cost
+            if response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+                self._throttled(headers, now)
+
+    def _reported_remaining(self, headers: httpx.Headers) -> int | None:
+        """Get the tightest remaining budget reported by the headers."""
+        reported = [utils.get_int_header(headers, "x-ratelimit-remaining")]
+        if headers.get("x-ratelimit-quota-overage", "").upper() != "ENABLED":
+            reported.append(
+                utils.get_int_header(headers, "x-ratelimit-quota-remaining"),
+            )
+        values = [value for value in reported if value is not None]
+        return min(values) if values else None
+
+    def _throttled(self, headers: httpx.Headers, now: float) -> None:
+        """Stop spending after the API rejected a request for exceeding the budget.
+
+        With a `Retry-After` header spending resumes after the delay and the
+        budget is refreshed by the next response, otherwise the budget is
+        considered exhausted.
+        """
+        retry_after = headers.get("retry-after")
+        if retry_after is not None and retry_after.isdigit():
+            self._blocked_until = max(self._blocked_until, now + int(retry_after))
+            self._remaining = None
+        else:
+            self._remaining = min(self._remaining or 0, 0)
+
+    def _reserve(self, cost: int) -> float:
+        """Reserve `cost` credits, or return the seconds to wait before retrying."""
+        now = self._clock()
+        with self._lock:
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._expire(now)
+            if self._remaining is not None and self._remaining < cost:
+                wait = self._wait_for(cost - self._remaining, now)
+                if wait > 0:
+                    return wait
+            self._next_probe = None
+            self._pending += cost
+            if self._remaining is not None:
+                self._remaining -= cost
+            self._spent.append((now, cost))
+            self._spent_total += cost
+            return 0.0
+
+    def _wait_for(self, deficit: int, now: float) -> float:
+        """Get the seconds until `deficit` logged credits leave the window."""
+        returned = 0
+        for spent_at, cost in self._spent:
+            returned += cost
+            if returned >= deficit:
+                return spent_at + self.window - now
+        # Credits spent elsewhere are not logged, so ask the API periodically
+        if self._next_probe is None:
+            self._next_probe = now + self.probe_interval
+        return self._next_probe - now
+
+    def _expire(self, now: float) -> None:
+        """Return credits spent before the window to the budget."""
+        horizon = now - self.window
+        while self._spent and self._spent[0][0] <= horizon:
+            _, cost = self._spent.popleft()
+            self._spent_total -= cost
+            if self._remaining is not None:
+                self._remaining += cost
+        if self._remaining is not None and self._limit is not None:
+            self._remaining = min(self._remaining, self._limit)
+
+    def _adjust_log(self, delta: int) -> None:
+        """Add `delta` credits, possibly negative, to the newest spend log entries."""
+        if not self._spent:
+            return
+        self._spent_total += delta
+        if delta >= 0:
+            spent_at, cost = self._spent.pop()
+            self._spent.append((spent_at, cost + delta))
+            return
+        excess = -delta
+        while excess and self._spent:
+            spent_at, cost = self._spent.pop()
+            if cost > excess:
+                self._spent.append((spent_at, cost - excess))
+                return
+            excess -= cost
+        self._spent_total += excess
@@ -1,24 +1,74 @@
 """SDK."""
 
-from collections.abc import Callable
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable, Iterable, Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
 import httpx
 
 from coinapi import utils
 from coinapi._hooks import SDKHooks
-from coinapi.config import CoinAPIConfig
-from coinapi.exchange_rates import ExchangeRates
-from coinapi.indexes import Indexes
-from coinapi.metadata import Metadata
-from coinapi.metrics import Metrics
+from coinapi.batch import (
+    DEFAULT_MAX_WORKERS,
+    BatchCall,
+    BatchResult,
+    run_batch,
+    run_batch_async,
+)
+from coinapi.config import CoinAPIConfig, resolve_compression
 from coinapi.models import components
-from coinapi.ohlcv import Ohlcv
-from coinapi.order_book import OrderBook
-from coinapi.order_book_l3 import OrderBookL3
-from coinapi.quotes import Quotes
-from coinapi.trades import Trades
 
-# ruff: noqa: E501
+if TYPE_CHECKING:
+    from coinapi.cache import ResponseCache
+    from coinapi.coalescing import RequestCoalescer
+    from coinapi.concurrency import ConcurrencyGovernor
+    from coinapi.diskcache import DiskCache
+    from coinapi.exchange_rates import AsyncExchangeRates, ExchangeRates
+    from coinapi.indexes import AsyncIndexes, Indexes
+    from coinapi.instrumentation import Instrumentation
+    from coinapi.metadata import AsyncMetadata, Metadata
+    from coinapi.metrics import AsyncMetrics, Metrics
+    from coinapi.ohlcv import AsyncOhlcv, Ohlcv
+    from coinapi.order_book import AsyncOrderBook, OrderBook
+    from coinapi.order_book_l3 import AsyncOrderBookL3, OrderBookL3
+    from coinapi.quotes import AsyncQuotes, Quotes
+    from coinapi.ratelimit import RateLimiter
+    from coinapi.trades import AsyncTrades, Trades
+    from coinapi.utils.retries import RetryPolicy
+
+_G = TypeVar("_G")
+
+
+class _Group(Generic[_G]):
+    """Operation group created, and its module imported, on first access.
+
+    The group class is looked up in the module named after the attribute.
+    """
+
+    def __init__(self, cls: str) -> None:
+        self.cls = cls
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> _Group[_G]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> _G: ...
+
+    def __get__(self, instance: object | None, owner: type) -> _Group[_G] | _G:
+        if instance is None:
+            return self
+        module = importlib.import_module(f"coinapi.{self.name}")
+        cls = getattr(module, self.cls)
+        group: _G = cls(instance.sdk_configuration)  # type: ignore[attr-defined]
+        instance.__dict__[self.name] = group
+        return group
 
 
 class CoinAPI:
@@ -224,9 +274,9 @@ class CoinAPI:
      * Select the menu Insert -> Sheet From File, 2. In the Insert dialog, put the URL eg. ```https://rest.coinapi.io/v1/exchangerate/USD?apikey=YOUR_API_KEY&invert=true&output_format=csv``` in the File Name box at the bottom. Set the drop-down list next to that to Web Page Query and click Open. The Text Import dialog opens where you can change the defaults if needed.
     """
 
-    metadata: Metadata
+    metadata: _Group[Metadata] = _Group("Metadata")
     r"""<span data-status-page=\\"28923\\"></span>"""
-    exchange_rates: ExchangeRates
+    exchange_rates: _Group[ExchangeRates] = _Group("ExchangeRates")
     r"""<span data-status-page=\\"28924\\"></span>
     Exchange rate is defined as (VWAP-24H) last 24 hour (rolling window over time) Volume Weighted Average Price across multiple data sources listed on our platform. We are selecting and managing the data sources that are used in the calculation based on multiple factors to provide data of highest quality.
 
@@ -246,9 +296,9 @@ class CoinAPI:
       1. From the VWAP24 data, we are creating a tree structure where node/vertex = asset and edge = rate.
       1. By traversing the tree structure using the BFS algorithm and our secret sauce, we are able to establish the final exchange rates.
     """
-    indexes: Indexes
+    indexes: _Group[Indexes] = _Group("Indexes")
     r"""Indexes section of the API is in the Alpha release cycle. Use only for testing, evaluaton and feedback."""
-    metrics: Metrics
+    metrics: _Group[Metrics] = _Group("Metrics")
     r"""<span data-status-page=\\"28933\\"></span>
     Metrics are quantitative measurements used to evaluate the performance and activity of cryptocurrency exchanges. These metrics include:
 
@@ -265,7 +315,7 @@ class CoinAPI:
 
     These metrics assist traders and investors in evaluating market activity, liquidity, and the reliability of crypto exchanges for informed decision-making.
     """
-    order_book: OrderBook
+    order_book: _Group[OrderBook] = _Group("OrderBook")
     r"""<span data-status-page=\\"28929\\"></span>
     This section describes calls related to order book data, also known as books or passive level 2 data.
 
@@ -281,13 +331,13 @@ class CoinAPI:
     When requesting current order book data limited to a single level, then quotes are actually used. This information is important from the perspective that quotes data could be faster than order book data (behavior is dependent solely one the data source) and they can have the size equal to 0 when the size is unknown. Some data sources publish order books and separately quote data (without the sizes) at a higher frequency. In that case, we will merge the order book feed with quotes feed to make sure that our updates are as fast as possible. The quotes will have the size equal to 0 as the value is unknown and the customer can decide if these higher frequency updates without the sizes are valuable or if not then can discard them or ask for at least 2 order book levels (in case of a REST API call). For the data sources that publish order books only or order books and quotes with the sizes then this will not happen.
     :::
     """
-    order_book_l3: OrderBookL3
+    order_book_l3: _Group[OrderBookL3] = _Group("OrderBookL3")
     r"""<span data-status-page=\\"28929\\"></span>
     This section describes calls related to order book data, also known as books or passive level 3 data.
     """
-    quotes: Quotes
+    quotes: _Group[Quotes] = _Group("Quotes")
     r"""Controller for retrieving quotes data, also known as quotes or passive level 1 data."""
-    ohlcv: Ohlcv
+    ohlcv: _Group[Ohlcv] = _Group("Ohlcv")
     r"""<span data-status-page=\\"28926\\"></span>
 
     API calls described in this section are related to downloading OHLCV *(Open, High, Low, Close, Volume)* timeseries data.
@@ -302,18 +352,32 @@ class CoinAPI:
     CoinAPI expanded the standard OHLCV timeseries by including time of first and last trade and amount of trades executed inside period.
     :::
     """
-    trades: Trades
+    trades: _Group[Trades] = _Group("Trades")
     r"""Controller for retrieving trade data related to executed transactions."""
 
     sdk_configuration: CoinAPIConfig
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         api_key: str | Callable[[], str],
         server_idx: int | None = None,
         server_url: str | None = None,
         url_params: dict[str, str] | None = None,
         client: httpx.Client | None = None,
+        *,
+        limits: httpx.Limits | None = None,
+        timeout: float | None = None,
+        prefer_msgpack: bool = False,
+        lean_responses: bool = False,
+        compression: Sequence[str] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_governor: ConcurrencyGovernor | None = None,
+        retry_policy: RetryPolicy | None = None,
+        coalescer: RequestCoalescer | None = None,
+        response_cache: ResponseCache | None = None,
+        disk_cache: DiskCache | None = None,
+        instrumentation: Instrumentation | None = None,
+        hooks: SDKHooks | None = None,
     ) -> None:
         """Instantiates the SDK configuring it with the provided parameters.
 
@@ -327,45 +391,300 @@ class CoinAPI:
         :type url_params: Dict[str, str]
         :param client: The httpx.Client HTTP client to use for all operations
         :type client: Optional[httpx.Client]
+        :param limits: Connection pool limits of the SDK-owned client, ignored if `client` is given
+        :type limits: Optional[httpx.Limits]
+        :param timeout: Timeout in seconds of the SDK-owned client, ignored if `client` is given
+        :type timeout: Optional[float]
+        :param prefer_msgpack: Negotiate MessagePack responses instead of JSON
+        :type prefer_msgpack: bool
+        :param lean_responses: Drop the raw response and body bytes once decoded
+        :type lean_responses: bool
+        :param compression: Content encodings to negotiate, all supported ones by default and none if empty
+        :type compression: Optional[Sequence[str]]
+        :param rate_limiter: Limiter pacing requests within the 24 hour request budget
+        :type rate_limiter: Optional[RateLimiter]
+        :param concurrency_governor: Governor adapting the requests in flight to the API concurrency limit
+        :type concurrency_governor: Optional[ConcurrencyGovernor]
+        :param retry_policy: Policy retrying throttled and failed requests with backoff
+        :type retry_policy: Optional[RetryPolicy]
+        :param coalescer: Coalescer sharing one request between identical concurrent calls
+        :type coalescer: Optional[RequestCoalescer]
+        :param response_cache: Cache of responses of rarely changing operations
+        :type response_cache: Optional[ResponseCache]
+        :param disk_cache: Persistent cache of historical responses for closed time windows
+        :type disk_cache: Optional[DiskCache]
+        :param instrumentation: Recorder of latency, size and decoding measurements per operation
+        :type instrumentation: Optional[Instrumentation]
+        :param hooks: Hooks of this SDK instance, a new empty registry by default
+        :type hooks: Optional[SDKHooks]
         """
-        if callable(api_key):
+        self.sdk_configuration = _configure_sdk(
+            api_key,
+            server_idx,
+            server_url,
+            url_params,
+            client=client,
+            limits=limits,
+            timeout=timeout,
+            prefer_msgpack=prefer_msgpack,
+            lean_responses=lean_responses,
+            compression=compression,
+            rate_limiter=rate_limiter,
+            concurrency_governor=concurrency_governor,
+            retry_policy=retry_policy,
+            coalescer=coalescer,
+            response_cache=response_cache,
+            disk_cache=disk_cache,
+            instrumentation=instrumentation,
+            hooks=hooks,
+        )
 
-            def security() -> components.Security:
-                return components.Security(api_key=api_key())
-        else:
-            security = components.Security(api_key=api_key)  # type: ignore[assignment]
+    def __enter__(self) -> CoinAPI:  # noqa: PYI034
+        """Enter the runtime context, returning the SDK itself."""
+        return self
 
-        if server_url is not None and url_params is not None:
-            server_url = utils.template_url(server_url, url_params)
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the runtime context, closing the SDK-owned connection pool."""
+        self.close()
 
-        self.sdk_configuration = CoinAPIConfig(
-            client,
-            security,
-            server_url,
+    def close(self) -> None:
+        """Close the SDK-owned connection pool.
+
+        A client passed in by the caller is left open.
+        """
+        self.sdk_configuration.close()
+
+    def batch(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[BatchResult[Any]]:
+        """Execute operations concurrently on a thread pool.
+
+        Each call pairs an operation, such as `sdk.trades.get_v1_trades_latest`,
+        with its request, a mapping of its keyword arguments, or None. Requests
+        pass through the configured rate limiter and concurrency governor.
+
+        :param calls: Operations and their arguments
+        :param max_workers: Operations executed at the same time
+        :return: Outcome of every call in input order, holding its response or error
+        """
+        return run_batch(calls, max_workers=max_workers)
+
+
+class AsyncCoinAPI:
+    r"""REST API for asyncio applications.
+
+    Exposes the same operation groups as :class:`CoinAPI`, with every operation
+    implemented as a coroutine running on an `httpx.AsyncClient`. Requests,
+    responses, hooks and errors are shared with the synchronous client.
+    """
+
+    metadata: _Group[AsyncMetadata] = _Group("AsyncMetadata")
+    exchange_rates: _Group[AsyncExchangeRates] = _Group("AsyncExchangeRates")
+    indexes: _Group[AsyncIndexes] = _Group("AsyncIndexes")
+    metrics: _Group[AsyncMetrics] = _Group("AsyncMetrics")
+    order_book: _Group[AsyncOrderBook] = _Group("AsyncOrderBook")
+    order_book_l3: _Group[AsyncOrderBookL3] = _Group("AsyncOrderBookL3")
+    quotes: _Group[AsyncQuotes] = _Group("AsyncQuotes")
+    ohlcv: _Group[AsyncOhlcv] = _Group("AsyncOhlcv")
+    trades: _Group[AsyncTrades] = _Group("AsyncTrades")
+
+    sdk_configuration: CoinAPIConfig
+
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key: str | Callable[[], str],
+        server_idx: int | None = None,
+        server_url: str | None = None,
+        url_params: dict[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+        *,
+        limits: httpx.Limits | None = None,
+        timeout: float | None = None,
+        prefer_msgpack: bool = False,
+        lean_responses: bool = False,
+        compression: Sequence[str] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_governor: ConcurrencyGovernor | None = None,
+        retry_policy: RetryPolicy | None = None,
+        coalescer: RequestCoalescer | None = None,
+        response_cache: ResponseCache | None = None,
+        disk_cache: DiskCache | None = None,
+        instrumentation: Instrumentation | None = None,
+        hooks: SDKHooks | None = None,
+    ) -> None:
+        """Instantiates the async SDK configuring it with the provided parameters.
+
+        :param api_key: The api_key required for authentication
+        :type api_key: Union[str, Callable[[], str]]
+        :param server_idx: The index of the server to use for all operations
+        :type server_idx: int
+        :param server_url: The server URL to use for all operations
+        :type server_url: str
+        :param url_params: Parameters to optionally template the server URL with
+        :type url_params: Dict[str, str]
+        :param client: The httpx.AsyncClient HTTP client to use for all operations
+        :type client: Optional[httpx.AsyncClient]
+        :param limits: Connection pool limits of the SDK-owned client, ignored if `client` is given
+        :type limits: Optional[httpx.Limits]
+        :param timeout: Timeout in seconds of the SDK-owned client, ignored if `client` is given
+        :type timeout: Optional[float]
+        :param prefer_msgpack: Negotiate MessagePack responses instead of JSON
+        :type prefer_msgpack: bool
+        :param lean_responses: Drop the raw response and body bytes once decoded
+        :type lean_responses: bool
+        :param compression: Content encodings to negotiate, all supported ones by default and none if empty
+        :type compression: Optional[Sequence[str]]
+        :param rate_limiter: Limiter pacing requests within the 24 hour request budget
+        :type rate_limiter: Optional[RateLimiter]
+        :param concurrency_governor: Governor adapting the requests in flight to the API concurrency limit
+        :type concurrency_governor: Optional[ConcurrencyGovernor]
+        :param retry_policy: Policy retrying throttled and failed requests with backoff
+        :type retry_policy: Optional[RetryPolicy]
+        :param coalescer: Coalescer sharing one request between identical concurrent calls
+        :type coalescer: Optional[RequestCoalescer]
+        :param response_cache: Cache of responses of rarely changing operations
+        :type response_cache: Optional[ResponseCache]
+        :param disk_cache: Persistent cache of historical responses for closed time windows
+        :type disk_cache: Optional[DiskCache]
+        :param instrumentation: Recorder of latency, size and decoding measurements per operation
+        :type instrumentation: Optional[Instrumentation]
+        :param hooks: Hooks of this SDK instance, a new empty registry by default
+        :type hooks: Optional[SDKHooks]
+        """
+        self.sdk_configuration = _configure_sdk(
+            api_key,
             server_idx,
+            server_url,
+            url_params,
+            async_client=client,
+            limits=limits,
+            timeout=timeout,
+            prefer_msgpack=prefer_msgpack,
+            lean_responses=lean_responses,
+            compression=compression,
+            rate_limiter=rate_limiter,
+            concurrency_governor=concurrency_governor,
+            retry_policy=retry_policy,
+            coalescer=coalescer,
+            response_cache=response_cache,
+            disk_cache=disk_cache,
+            instrumentation=instrumentation,
+            hooks=hooks,
         )
 
+    async def __aenter__(self) -> AsyncCoinAPI:  # noqa: PYI034
+        """Enter the async runtime context, returning the SDK itself."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the async runtime context, closing the SDK-owned connection pool."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the SDK-owned connection pool.
+
+        A client passed in by the caller is left open.
+        """
+        await self.sdk_configuration.aclose()
+
+    async def batch(
+        self,
+        calls: Iterable[BatchCall],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> list[BatchResult[Any]]:
+        """Execute operations concurrently as tasks.
+
+        Each call pairs an operation, such as `sdk.trades.get_v1_trades_latest`,
+        with its request, a mapping of its keyword arguments, or None. Requests
+        pass through the configured rate limiter and concurrency governor.
+
+        :param calls: Operations and their arguments
+        :param max_workers: Operations executed at the same time
+        :return: Outcome of every call in input order, holding its response or error
+        """
+        return await run_batch_async(calls, max_workers=max_workers)
+
+
+def _configure_sdk(  # noqa: PLR0913
+    api_key: str | Callable[[], str],
+    server_idx: int | None,
+    server_url: str | None,
+    url_params: dict[str, str] | None,
+    client: httpx.Client | None = None,
+    async_client: httpx.AsyncClient | None = None,
+    limits: httpx.Limits | None = None,
+    timeout: float | None = None,
+    *,
+    prefer_msgpack: bool = False,
+    lean_responses: bool = False,
+    compression: Sequence[str] | None = None,
+    rate_limiter: RateLimiter | None = None,
+    concurrency_governor: ConcurrencyGovernor | None = None,
+    retry_policy: RetryPolicy | None = None,
+    coalescer: RequestCoalescer | None = None,
+    response_cache: ResponseCache | None = None,
+    disk_cache: DiskCache | None = None,
+    instrumentation: Instrumentation | None = None,
+    hooks: SDKHooks | None = None,
+) -> CoinAPIConfig:
+    """Build the SDK configuration shared by the sync and async clients."""
+    if callable(api_key):
+
+        def security() -> components.Security:
+            return components.Security(api_key=api_key())
+    else:
+        security = components.Security(api_key=api_key)  # type: ignore[assignment]
+
+    if server_url is not None and url_params is not None:
+        server_url = utils.template_url(server_url, url_params)
+
+    sdk_configuration = CoinAPIConfig(
+        client,
+        security,
+        server_url,
+        server_idx,
+        async_client=async_client,
+        prefer_msgpack=prefer_msgpack,
+        lean_responses=lean_responses,
+        compression=None if compression is None else resolve_compression(compression),
+        rate_limiter=rate_limiter,
+        concurrency_governor=concurrency_governor,
+        retry_policy=retry_policy,
+        coalescer=coalescer,
+        response_cache=response_cache,
+        disk_cache=disk_cache,
+        instrumentation=instrumentation,
+    )
+    if limits is not None:
+        sdk_configuration.limits = limits
+    if timeout is not None:
+        sdk_configuration.timeout = timeout
+
+    if hooks is None:
         hooks = SDKHooks()
 
-        current_server_url, *_ = self.sdk_configuration.get_server_details()
-        server_url, self.sdk_configuration.client = hooks.sdk_init(
-            current_server_url,
-            self.sdk_configuration.client,
-        )
-        if current_server_url != server_url:
-            self.sdk_configuration.server_url = server_url
-
-        self.sdk_configuration._hooks = hooks  # noqa: SLF001
-
-        self._init_sdks()
-
-    def _init_sdks(self) -> None:
-        self.metadata = Metadata(self.sdk_configuration)
-        self.exchange_rates = ExchangeRates(self.sdk_configuration)
-        self.indexes = Indexes(self.sdk_configuration)
-        self.metrics = Metrics(self.sdk_configuration)
-        self.order_book = OrderBook(self.sdk_configuration)
-        self.order_book_l3 = OrderBookL3(self.sdk_configuration)
-        self.quotes = Quotes(self.sdk_configuration)
-        self.ohlcv = Ohlcv(self.sdk_configuration)
-        self.trades = Trades(self.sdk_configuration)
+    current_server_url, *_ = sdk_configuration.get_server_details()
+    server_url, sdk_configuration.client = hooks.sdk_init(
+        current_server_url,
+        sdk_configuration.client,
+    )
+    if current_server_url != server_url:
+        sdk_configuration.server_url = server_url
+
+    sdk_configuration._hooks = hooks  # noqa: SLF001
+
+    return sdk_configuration
@@ -0,0 +1,167 @@
+"""Splitting time ranges into period-aligned chunks and merging or grouping their timeseries."""
+
+import datetime as dt
+import re
+from collections.abc import Iterable, Sequence
+
+import msgspec
+
+from coinapi.models import components
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+_SUBMICROSECONDS = re.compile(r"(\.\d{6})\d+")
+
+TimeRange = tuple[dt.datetime, dt.datetime]
+"""Start and exclusive end of a span of time."""
+
+DAY = components.V1TimeseriesPeriod(
+    period_id="1DAY",
+    length_seconds=24 * 60 * 60,
+    length_months=0,
+)
+"""Period of one UTC day, the most exchange-wide OHLCV requests may span."""
+
+
+class OhlcvSeries(msgspec.Struct, frozen=True):
+    """Timeseries merged from the chunks of a time range."""
+
+    items: list[components.V1TimeseriesItem]
+    r"""Items of every chunk in time ascending order, each period once."""
+    gaps: list[TimeRange]
+    r"""Spans of the aligned range covered by no item, in time ascending order."""
+
+
+class ExchangeOhlcvDay(msgspec.Struct, frozen=True):
+    """Exchange-wide timeseries of one day, grouped by symbol."""
+
+    time_start: dt.datetime
+    r"""Start of the day, or of the range on its first day."""
+    time_end: dt.datetime
+    r"""End of the day, or of the range on its last day."""
+    series: dict[str, list[components.ModelsExchangeTimeseriesItem]]
+    r"""Items of each symbol in time ascending order, by CoinAPI symbol identifier."""
+
+
+def parse_time(value: str | dt.datetime) -> dt.datetime:
+    """Parse a time, taking naive times as UTC and truncating it to microseconds."""
+    if isinstance(value, str):
+        value = _SUBMICROSECONDS.sub(r"\1", value.replace("Z", "+00:00"))
+        value = dt.datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value.astimezone(dt.timezone.utc)
+
+
+def find_period(
+    periods: Iterable[components.V1TimeseriesPeriod],
+    period_id: str,
+) -> components.V1TimeseriesPeriod:
+    """Get a period of the catalog by its identifier."""
+    for period in periods:
+        if period.period_id == period_id:
+            return period
+    msg = f"unknown period {period_id!r}"
+    raise ValueError(msg)
+
+
+def align(value: dt.datetime, period: components.V1TimeseriesPeriod) -> dt.datetime:
+    """Get the start of the period holding a UTC time.
+
+    Periods counted in months start on the first of a month, the others are
+    whole multiples of their length since the Unix epoch.
+    """
+    if period.length_months:
+        months = value.year * 12 + value.month - 1
+        months -= months % period.length_months
+        return _EPOCH.replace(year=months // 12, month=months % 12 + 1)
+    seconds = int((value - _EPOCH).total_seconds())
+    return _EPOCH + dt.timedelta(seconds=seconds - seconds % period.length_seconds)
+
+
+def advance(
+    value: dt.datetime,
+    period: components.V1TimeseriesPeriod,
+    count: int = 1,
+) -> dt.datetime:
+    """Move a period-aligned time `count` periods forward."""
+    if period.length_months:
+        months = value.year * 12 + value.month - 1 + count * period.length_months
+        return value.replace(year=months // 12, month=months % 12 + 1)
+    return value + dt.timedelta(seconds=count * period.length_seconds)
+
+
+def split(
+    time_start: dt.datetime,
+    time_end: dt.datetime,
+    period: components.V1TimeseriesPeriod,
+    limit: int,
+) -> list[TimeRange]:
+    """Split a time range into chunks of at most `limit` periods.
+
+    Chunks are bounded by period starts, except that the first one starts at
+    `time_start`.
+    """
+    chunks = []
+    start = time_start
+    while start < time_end:
+        end = min(advance(align(start, period), period, limit), time_end)
+        chunks.append((start, end))
+        start = end
+    return chunks
+
+
+def merge(
+    chunks: Iterable[Sequence[components.V1TimeseriesItem]],
+    time_start: dt.datetime,
+    time_end: dt.datetime,
+    period: components.V1TimeseriesPeriod,
+) -> OhlcvSeries:
+    """Merge the items of consecutive chunks into one series and find its gaps.
+
+    A period returned by two chunks is kept once. Raises `ValueError` when
+    items overlap or go back in time otherwise. Gaps are looked for from the
+    first period starting at or after `time_start` to the end of the period
+    holding `time_end`.
+    """
+    items: list[components.V1TimeseriesItem] = []
+    for chunk in chunks:
+        for item in chunk:
+            if items and item.time_period_start < items[-1].time_period_end:
+                if item.time_period_start == items[-1].time_period_start:
+                    continue
+                msg = f"period at {item.time_period_start} overlaps the previous one"
+                raise ValueError(msg)
+            items.append(item)
+
+    gaps = []
+    covered = align(time_start, period)
+    if covered < time_start:
+        covered = advance(covered, period)
+    end = align(time_end, period)
+    if end < time_end:
+        end = advance(end, period)
+    for item in items:
+        if item.time_period_start > covered:
+            gaps.append((covered, item.time_period_start))
+        covered = max(covered, item.time_period_end)
+    if covered < end:
+        gaps.append((covered, end))
+    return OhlcvSeries(items, gaps)
+
+
+def group_by_symbol(
+    time_range: TimeRange,
+    items: Iterable[components.ModelsExchangeTimeseriesItem],
+) -> ExchangeOhlcvDay:
+    """Group the exchange-wide items of a day by symbol, keeping their order.
+
+    Items without a CoinAPI symbol identifier are keyed by their exchange one.
+    """
+    series: dict[str, list[components.ModelsExchangeTimeseriesItem]] = {}
+    for item in items:
+        symbol_id = item.symbol_id_coinapi
+        if not isinstance(symbol_id, str):
+            symbol_id = item.symbol_id_exchange or ""
+        series.setdefault(symbol_id, []).append(item)
+    return ExchangeOhlcvDay(time_range[0], time_range[1], series)
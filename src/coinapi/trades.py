@@ -1,7 +1,21 @@
 """Trades operations."""
 
+import datetime as dt
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
+
+from coinapi import paging
 from coinapi.base import AcceptEnum, Base
-from coinapi.models import operations
+from coinapi.models import components, operations
+
+
+def _trade_time(trade: components.V1Trade) -> dt.datetime:
+    """Get the time trades are ordered and paged by."""
+    return trade.time_exchange
+
+
+def _trade_key(trade: components.V1Trade) -> str:
+    """Get the key identifying a trade."""
+    return trade.uuid
 
 
 class Trades(Base):
@@ -23,6 +37,62 @@ class Trades(Base):
             accept_header_override=accept_header_override,
         )
 
+    def stream_v1_trades_symbol_id_history(
+        self,
+        request: operations.GetV1TradesSymbolIDHistoryRequest,
+    ) -> Iterator[components.V1Trade]:
+        r"""[trades] Historical data, decoded item by item.
+
+        Streaming variant of :meth:`get_v1_trades_symbol_id_history`
+        yielding each item as soon as it is received, so memory stays bounded
+        regardless of `limit`.
+        """
+        return self._stream_request(
+            "get_/v1/trades/{symbol_id}/history",
+            request,
+            operations.GetV1TradesSymbolIDHistoryResponse,
+        )
+
+    def iter_trades_history(  # noqa: PLR0913
+        self,
+        symbol_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime | None = None,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        include_id: bool = False,
+        prefetch: bool = True,
+    ) -> Generator[components.V1Trade, None, None]:
+        r"""[trades] Historical data, across as many pages as needed.
+
+        Yields every trade from `time_start` until `time_end`, or until the
+        latest trade, requesting pages of `limit` trades. Each page starts
+        at the last trade of the previous one; trades returned twice at the
+        boundary are dropped by `uuid`. With `prefetch`, the next page is
+        requested while the current one is consumed, which costs one page
+        more than needed if iteration stops early.
+        """
+        end = None if time_end is None else paging.format_time(time_end)
+
+        def fetch(start: str) -> list[components.V1Trade]:
+            request = operations.GetV1TradesSymbolIDHistoryRequest(
+                symbol_id=symbol_id,
+                time_start=start,
+                time_end=end,
+                limit=limit,
+                include_id=include_id,
+            )
+            return self.get_v1_trades_symbol_id_history(request).content or []
+
+        cursor = paging.TimeCursor(
+            time_start,
+            limit=limit,
+            time_of=_trade_time,
+            key_of=_trade_key,
+        )
+        for page in paging.iter_pages(fetch, cursor, prefetch=prefetch):
+            yield from page
+
     def get_v1_trades_symbol_id_latest(
         self,
         symbol_id: str,
@@ -66,3 +136,120 @@ class Trades(Base):
             operations.GetV1TradesLatestResponse,
             accept_header_override=accept_header_override,
         )
+
+
+class AsyncTrades(Base):
+    r"""Asynchronous counterpart of :class:`Trades`."""
+
+    async def get_v1_trades_symbol_id_history(
+        self,
+        request: operations.GetV1TradesSymbolIDHistoryRequest,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1TradesSymbolIDHistoryResponse:
+        r"""[trades] Historical data.
+
+        Get history transactions from specific symbol, returned in time ascending order.
+        """
+        return await self._make_request_async(
+            "get_/v1/trades/{symbol_id}/history",
+            request,
+            operations.GetV1TradesSymbolIDHistoryResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    def stream_v1_trades_symbol_id_history(
+        self,
+        request: operations.GetV1TradesSymbolIDHistoryRequest,
+    ) -> AsyncIterator[components.V1Trade]:
+        r"""[trades] Historical data, decoded item by item.
+
+        Streaming variant of :meth:`get_v1_trades_symbol_id_history`
+        yielding each item as soon as it is received, so memory stays bounded
+        regardless of `limit`.
+        """
+        return self._stream_request_async(
+            "get_/v1/trades/{symbol_id}/history",
+            request,
+            operations.GetV1TradesSymbolIDHistoryResponse,
+        )
+
+    async def iter_trades_history(  # noqa: PLR0913
+        self,
+        symbol_id: str,
+        time_start: str | dt.datetime,
+        time_end: str | dt.datetime | None = None,
+        *,
+        limit: int = paging.DEFAULT_PAGE_LIMIT,
+        include_id: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncGenerator[components.V1Trade, None]:
+        r"""[trades] Historical data, across as many pages as needed.
+
+        Asynchronous counterpart of :meth:`Trades.iter_trades_history`.
+        """
+        end = None if time_end is None else paging.format_time(time_end)
+
+        async def fetch(start: str) -> list[components.V1Trade]:
+            request = operations.GetV1TradesSymbolIDHistoryRequest(
+                symbol_id=symbol_id,
+                time_start=start,
+                time_end=end,
+                limit=limit,
+                include_id=include_id,
+            )
+            res = await self.get_v1_trades_symbol_id_history(request)
+            return res.content or []
+
+        cursor = paging.TimeCursor(
+            time_start,
+            limit=limit,
+            time_of=_trade_time,
+            key_of=_trade_key,
+        )
+        async for page in paging.aiter_pages(fetch, cursor, prefetch=prefetch):
+            for trade in page:
+                yield trade
+
+    async def get_v1_trades_symbol_id_latest(
+        self,
+        symbol_id: str,
+        limit: int | None = None,
+        include_id: bool | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1TradesSymbolIDLatestResponse:
+        r"""[trades] Latest data by symbol_id.
+
+        Get latest trades executed up to 1 minute ago. Latest data is always returned in time descending order.
+        """
+        return await self._make_request_async(
+            "get_/v1/trades/{symbol_id}/latest",
+            operations.GetV1TradesSymbolIDLatestRequest(
+                symbol_id=symbol_id,
+                limit=limit,
+                include_id=include_id,
+            ),
+            operations.GetV1TradesSymbolIDLatestResponse,
+            accept_header_override=accept_header_override,
+        )
+
+    async def get_v1_trades_latest(
+        self,
+        filter_symbol_id: str | None = None,
+        include_id: bool | None = None,
+        limit: int | None = None,
+        accept_header_override: AcceptEnum | None = None,
+    ) -> operations.GetV1TradesLatestResponse:
+        r"""[trades] Latest data.
+
+        Get latest trades executed up to 1 minute ago. Latest data is always returned in time descending order.
+        """
+        return await self._make_request_async(
+            "get_/v1/trades/latest",
+            operations.GetV1TradesLatestRequest(
+                filter_symbol_id=filter_symbol_id,
+                include_id=include_id,
+                limit=limit,
+            ),
+            operations.GetV1TradesLatestResponse,
+            accept_header_override=accept_header_override,
+        )
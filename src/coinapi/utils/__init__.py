@@ -1,3 +1,7 @@
 """Utilities."""
 
+from coinapi.utils.decoders import *
+from coinapi.utils.request_plan import *
+from coinapi.utils.retries import *
+from coinapi.utils.streaming import *
 from coinapi.utils.utils import *
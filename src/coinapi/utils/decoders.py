@@ -0,0 +1,68 @@
+"""Cached response decoders."""
+
+import types
+import typing
+from typing import Any
+
+import msgspec
+
+
+class ResponseCodec:
+    """Content type and reusable decoders of a response class.
+
+    Codecs are built once per response class and cached on the class, so
+    decoding a response neither looks up the `content` field nor compiles
+    the decoder type again.
+    """
+
+    __slots__ = ("_items", "_msgpack", "content_type", "json")
+
+    def __init__(self, content_type: Any) -> None:
+        self.content_type = content_type
+        r"""Declared type of the `content` field."""
+        self.json: msgspec.json.Decoder[Any] = msgspec.json.Decoder(content_type)
+        r"""JSON decoder for the `content` field."""
+        self._msgpack: msgspec.msgpack.Decoder[Any] | None = None
+        self._items: msgspec.json.Decoder[Any] | None = None
+
+    @property
+    def msgpack(self) -> msgspec.msgpack.Decoder[Any]:
+        """MessagePack decoder for the `content` field, built on first use."""
+        if self._msgpack is None:
+            self._msgpack = msgspec.msgpack.Decoder(self.content_type)
+        return self._msgpack
+
+    @property
+    def items(self) -> msgspec.json.Decoder[Any]:
+        """JSON decoder for a single item of a list `content`, built on first use."""
+        if self._items is None:
+            list_type = next(
+                arg
+                for arg in typing.get_args(self.content_type) or (self.content_type,)
+                if arg is not types.NoneType
+            )
+            if typing.get_origin(list_type) is not list:
+                msg = f"{self.content_type} is not a list content type"
+                raise TypeError(msg)
+            (item_type,) = typing.get_args(list_type)
+            self._items = msgspec.json.Decoder(item_type)
+        return self._items
+
+    @classmethod
+    def compile(cls, response_cls: type[msgspec.Struct]) -> "ResponseCodec":
+        """Build the codec of a response class."""
+        content_type = next(
+            field.type
+            for field in msgspec.structs.fields(response_cls)
+            if field.name == "content"
+        )
+        return cls(content_type)
+
+
+def get_response_codec(response_cls: type[Any]) -> ResponseCodec:
+    """Get the codec of a response class, building it on first use."""
+    codec: ResponseCodec | None = response_cls.__dict__.get("_response_codec")
+    if codec is None:
+        codec = ResponseCodec.compile(response_cls)
+        response_cls._response_codec = codec  # noqa: SLF001
+    return codec
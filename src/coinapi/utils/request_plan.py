@@ -0,0 +1,150 @@
+"""Precompiled request plans."""
+
+import functools
+import re
+from collections.abc import Callable
+from typing import Any
+
+import msgspec
+
+from coinapi.utils.utils import (
+    _get_serialized_params,
+    get_metadata,
+    get_query_param_handler,
+    handle_single_path_param,
+    remove_suffix,
+    serialize_param,
+)
+
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+QuerySerializer = Callable[[Any], dict[str, list[str]]]
+"""Serializer turning a query field value into query parameters."""
+
+
+class PathParam(msgspec.Struct, frozen=True):
+    """A path parameter of a request plan."""
+
+    attr: str
+    r"""Name of the attribute holding the value on the request."""
+    name: str
+    r"""Name of the placeholder in the endpoint template."""
+    metadata: dict[str, Any]
+    r"""The `path_param` metadata of the field."""
+    field_type: Any
+    r"""Declared type of the field, used for JSON serialization."""
+
+    def serialize(self, value: Any) -> dict[str, str]:
+        """Serialize a value into placeholder replacements."""
+        if self.metadata.get("serialization"):
+            return serialize_param(value, self.metadata, self.field_type, self.name)
+        return {self.name: handle_single_path_param(value, self.metadata)}
+
+
+class RequestPlan:
+    """Precompiled URL and query parameter layout of a request class.
+
+    Plans are built once per request class from the field metadata and
+    cached on the class, so preparing a request no longer introspects the
+    struct fields.
+    """
+
+    __slots__ = ("path_params", "query_params", "segments")
+
+    def __init__(
+        self,
+        segments: tuple[str, ...],
+        path_params: tuple[PathParam, ...],
+        query_params: tuple[tuple[str, QuerySerializer], ...],
+    ) -> None:
+        self.segments = segments
+        r"""Endpoint split on placeholders; odd indices are placeholder names."""
+        self.path_params = path_params
+        self.query_params = query_params
+
+    @classmethod
+    def compile(cls, clazz: type[msgspec.Struct], endpoint: str) -> "RequestPlan":
+        """Compile the plan of a request class."""
+        path_params: list[PathParam] = []
+        query_params: list[tuple[str, QuerySerializer]] = []
+
+        for field in msgspec.structs.fields(clazz):
+            metadata = get_metadata(field)
+            if path_metadata := metadata.get("path_param"):
+                if path_metadata.get("serialization") or (
+                    path_metadata.get("style", "simple") == "simple"
+                ):
+                    path_params.append(
+                        PathParam(
+                            attr=field.name,
+                            name=path_metadata.get("field_name", field.name),
+                            metadata=path_metadata,
+                            field_type=field.type,
+                        ),
+                    )
+            elif metadata.get("request") is None and (
+                query_metadata := metadata.get("query_param")
+            ):
+                query_params.append(
+                    (field.name, _compile_query_param(field, query_metadata)),
+                )
+
+        return cls(
+            tuple(_PLACEHOLDER.split(endpoint)),
+            tuple(path_params),
+            tuple(query_params),
+        )
+
+    def build_url(self, server_url: str, request: msgspec.Struct) -> str:
+        """Build the URL of a request."""
+        values: dict[str, str] = {}
+        for param in self.path_params:
+            value = getattr(request, param.attr)
+            if value is not None:
+                values.update(param.serialize(value))
+
+        segments = self.segments
+        parts = [remove_suffix(server_url, "/")]
+        for i, segment in enumerate(segments):
+            if i % 2:
+                parts.append(values.get(segment, "{" + segment + "}"))
+            else:
+                parts.append(segment)
+        return "".join(parts)
+
+    def build_query_params(self, request: msgspec.Struct) -> dict[str, list[str]]:
+        """Build the query parameters of a request."""
+        params: dict[str, list[str]] = {}
+        for attr, serializer in self.query_params:
+            value = getattr(request, attr)
+            if value is not None:
+                params.update(serializer(value))
+        return params
+
+
+def _compile_query_param(
+    field: msgspec.structs.FieldInfo,
+    metadata: dict[str, Any],
+) -> QuerySerializer:
+    """Pre-resolve the serializer of a query parameter."""
+    field_name = metadata.get("field_name", field.name)
+
+    if metadata.get("serialization"):
+
+        def serialize(value: Any) -> dict[str, list[str]]:
+            serialized = _get_serialized_params(metadata, field.type, field_name, value)
+            return {key: [val] for key, val in serialized.items()}
+
+        return serialize
+
+    handler = get_query_param_handler(metadata.get("style", "form"))
+    return functools.partial(handler.handle, metadata, field_name)
+
+
+def get_request_plan(clazz: type[Any]) -> RequestPlan:
+    """Get the plan of a request class, compiling it on first use."""
+    plan: RequestPlan | None = clazz.__dict__.get("_request_plan")
+    if plan is None:
+        plan = RequestPlan.compile(clazz, clazz.endpoint)
+        clazz._request_plan = plan  # noqa: SLF001
+    return plan
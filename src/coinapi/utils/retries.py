@@ -0,0 +1,279 @@
+"""Retrying requests with backoff, jitter and a retry budget."""
+
+import asyncio
+import datetime as dt
+import email.utils
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+import msgspec
+
+from coinapi.utils.utils import match_status_codes
+
+RETRYABLE_STATUS_CODES = ("429", "500", "502", "503", "504", "550")
+"""Status codes retried by default; 550 is returned when no data is available yet."""
+
+
+class BackoffStrategy(msgspec.Struct, frozen=True):
+    """Exponential backoff between attempts."""
+
+    initial_interval: float = 0.5
+    r"""Seconds to wait before the first retry"""
+    max_interval: float = 30.0
+    r"""Longest wait between two attempts, in seconds"""
+    exponent: float = 2.0
+    r"""Factor the wait grows by after every attempt"""
+    max_elapsed_time: float = 300.0
+    r"""Seconds after which no further attempt is started"""
+    jitter: float = 1.0
+    r"""Fraction of each wait that is randomized, from 0 (none) to 1 (full jitter)"""
+
+    def interval(self, retry: int) -> float:
+        """Get the wait before the `retry`-th retry, counting from 1."""
+        interval = min(
+            self.max_interval,
+            self.initial_interval * self.exponent ** (retry - 1),
+        )
+        return interval * (1 - self.jitter * random.random())  # noqa: S311
+
+
+class RetryConfig(msgspec.Struct, frozen=True):
+    """When and how often to retry a request."""
+
+    max_attempts: int = 5
+    r"""Attempts per request, including the first one"""
+    backoff: BackoffStrategy = msgspec.field(default_factory=BackoffStrategy)
+    r"""Wait between attempts"""
+    status_codes: tuple[str, ...] = RETRYABLE_STATUS_CODES
+    r"""Status codes or ranges such as `5XX` that are retried"""
+    retry_connection_errors: bool = True
+    r"""Whether connection errors and timeouts are retried"""
+    respect_retry_after: bool = True
+    r"""Whether a `Retry-After` header replaces the backoff interval"""
+
+
+class RetryBudget:
+    """Cap retries to a fraction of requests, so outages do not cause retry storms.
+
+    Every request deposits `ratio` tokens, up to `capacity`, and every retry
+    withdraws one token. Retries are refused while fewer than one token is
+    left.
+    """
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 20.0) -> None:
+        self.ratio = ratio
+        r"""Tokens deposited per request."""
+        self.capacity = capacity
+        r"""Most tokens the budget holds."""
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        return self._tokens
+
+    def deposit(self) -> None:
+        """Credit the budget for a request."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a token for a retry, returning whether one was available."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryMetrics:
+    """Counters of attempts and retry outcomes per operation id."""
+
+    COUNTERS = ("attempts", "retries", "exhausted", "budget_denied")
+    r"""Counter names: attempts sent, retries made, requests out of attempts or time, and retries refused by the budget."""
+
+    def __init__(self) -> None:
+        self._counts: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, operation_id: str, counter: str) -> None:
+        """Increment a counter of an operation."""
+        with self._lock:
+            counts = self._counts.setdefault(
+                operation_id,
+                dict.fromkeys(self.COUNTERS, 0),
+            )
+            counts[counter] += 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Get a copy of the counters per operation id."""
+        with self._lock:
+            return {
+                operation: dict(counts) for operation, counts in self._counts.items()
+            }
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._counts.clear()
+
+
+class RetryPolicy:
+    """Retry settings of an SDK, with overrides per operation id.
+
+    Overrides are keyed by operation id, such as
+    `get_/v1/trades/{symbol_id}/history`; an override of None disables
+    retries for that operation. The budget and metrics are shared by all
+    operations.
+    """
+
+    def __init__(
+        self,
+        default: RetryConfig | None = None,
+        overrides: dict[str, RetryConfig | None] | None = None,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        self.default = default or RetryConfig()
+        r"""Settings of operations without an override."""
+        self.overrides = overrides or {}
+        r"""Settings per operation id."""
+        self.budget = budget or RetryBudget()
+        r"""Budget shared by all operations."""
+        self.metrics = RetryMetrics()
+        r"""Attempt counters per operation id."""
+
+    def config_for(self, operation_id: str) -> RetryConfig | None:
+        """Get the settings of an operation, or None if it is not retried."""
+        return self.overrides.get(operation_id, self.default)
+
+
+class _Attempts:
+    """Bookkeeping of the attempts of one request."""
+
+    def __init__(self, policy: RetryPolicy, operation_id: str) -> None:
+        self.policy = policy
+        self.operation_id = operation_id
+        self.config = policy.config_for(operation_id)
+        self.started = time.monotonic()
+        self.count = 0
+
+    def begin(self) -> None:
+        """Record the start of an attempt."""
+        self.count += 1
+        self.policy.metrics.increment(self.operation_id, "attempts")
+        if self.count == 1:
+            self.policy.budget.deposit()
+
+    def should_retry(self, response: httpx.Response) -> bool:
+        """Whether a response has a retryable status code."""
+        return self.config is not None and match_status_codes(
+            list(self.config.status_codes),
+            response.status_code,
+        )
+
+    def should_retry_error(self, error: Exception) -> bool:
+        """Whether an error raised by the transport is retryable."""
+        return (
+            self.config is not None
+            and self.config.retry_connection_errors
+            and isinstance(error, httpx.TransportError)
+        )
+
+    def delay(self, response: httpx.Response | None) -> float | None:
+        """Get the wait before the next attempt, or None to give up."""
+        assert self.config is not None  # noqa: S101
+        backoff = self.config.backoff
+        interval = backoff.interval(self.count)
+        if response is not None and self.config.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                interval = retry_after
+        elapsed = time.monotonic() - self.started
+        if (
+            self.count >= self.config.max_attempts
+            or elapsed + interval > backoff.max_elapsed_time
+        ):
+            self.policy.metrics.increment(self.operation_id, "exhausted")
+            return None
+        if not self.policy.budget.withdraw():
+            self.policy.metrics.increment(self.operation_id, "budget_denied")
+            return None
+        self.policy.metrics.increment(self.operation_id, "retries")
+        return interval
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date."""
+    if value is None:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (date - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+
+def retry(
+    send: Callable[[], httpx.Response],
+    policy: RetryPolicy,
+    operation_id: str,
+    discard: Callable[[httpx.Response], None] = httpx.Response.close,
+) -> httpx.Response:
+    """Send a request, retrying it according to the policy.
+
+    The response of the last attempt is returned even if its status is
+    retryable; responses of earlier attempts are passed to `discard`.
+    """
+    attempts = _Attempts(policy, operation_id)
+    while True:
+        attempts.begin()
+        try:
+            response = send()
+        except Exception as e:
+            if not attempts.should_retry_error(e):
+                raise
+            delay = attempts.delay(None)
+            if delay is None:
+                raise
+        else:
+            if not attempts.should_retry(response):
+                return response
+            delay = attempts.delay(response)
+            if delay is None:
+                return response
+            discard(response)
+        time.sleep(delay)
+
+
+async def retry_async(
+    send: Callable[[], Awaitable[httpx.Response]],
+    policy: RetryPolicy,
+    operation_id: str,
+    discard: Callable[[httpx.Response], Awaitable[None]] = httpx.Response.aclose,
+) -> httpx.Response:
+    """Send a request asynchronously, retrying it according to the policy."""
+    attempts = _Attempts(policy, operation_id)
+    while True:
+        attempts.begin()
+        try:
+            response = await send()
+        except Exception as e:
+            if not attempts.should_retry_error(e):
+                raise
+            delay = attempts.delay(None)
+            if delay is None:
+                raise
+        else:
+            if not attempts.should_retry(response):
+                return response
+            delay = attempts.delay(response)
+            if delay is None:
+                return response
+            await discard(response)
+        await asyncio.sleep(delay)
@@ -0,0 +1,182 @@
+"""Incremental decoding of JSON array responses."""
+
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import TypeVar
+
+import msgspec
+
+_T = TypeVar("_T")
+
+_RAW_ITEMS = msgspec.json.Decoder(list[msgspec.Raw])
+_STRUCTURAL = re.compile(rb'[\[\]{},"]')
+_STRING_TAIL = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_WHITESPACE = b" \t\r\n"
+
+_MAX_GUESSES = 3
+"""Item boundaries guessed per chunk before scanning it for structural characters."""
+
+
+class JSONArraySplitter:
+    """Split a top-level JSON array into the raw encodings of its items.
+
+    Chunks are fed as they arrive and every item completed by a chunk is
+    returned, so only the item being received is buffered rather than the
+    whole array. Items are not validated; that is left to the decoder.
+
+    The buffer always starts at an item boundary. For each chunk the last
+    boundary is guessed from a `},` or `],` and everything before it is
+    split by msgspec in a single call. A guess inside a nested container or
+    a string cannot decode, so a successful guess is always a boundary.
+    When no guess succeeds, the unscanned bytes are scanned instead.
+    """
+
+    __slots__ = ("_buffer", "_depth", "_pos", "_started", "done")
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._started = False
+        self._pos = 0
+        self._depth = 1
+        self.done = False
+        r"""Whether the closing bracket of the array has been seen."""
+
+    def feed(self, chunk: bytes) -> list[msgspec.Raw]:
+        """Consume a chunk and return the items it completes."""
+        if self.done:
+            return []
+        # Boundaries before the new chunk have already been split off, but a
+        # `},` may straddle the chunk border
+        searched = max(len(self._buffer) - 1, 0)
+        self._buffer += chunk
+        if not self._started:
+            if not self._start():
+                return []
+            searched = 0
+
+        items = self._split_all()
+        if items is None:
+            items = self._split_at_guess(searched)
+        if items is None:
+            items = self._scan()
+        return items
+
+    def close(self) -> None:
+        """Check that the whole array was received."""
+        if not self.done:
+            msg = "truncated JSON array"
+            raise msgspec.DecodeError(msg)
+
+    def _start(self) -> bool:
+        """Drop the opening bracket once it has been received."""
+        stripped = self._buffer.lstrip(_WHITESPACE)
+        if not stripped:
+            return False
+        if stripped[:1] != b"[":
+            msg = "expected a JSON array"
+            raise msgspec.DecodeError(msg)
+        self._buffer = stripped[1:]
+        self._started = True
+        return True
+
+    def _split_all(self) -> list[msgspec.Raw] | None:
+        """Split the rest of the array once its closing bracket has arrived."""
+        buffer = self._buffer
+        if buffer.rstrip(_WHITESPACE)[-1:] != b"]":
+            return None
+        try:
+            items = _RAW_ITEMS.decode(b"[" + buffer)
+        except msgspec.DecodeError:
+            return None
+        self._drop(len(buffer))
+        self.done = True
+        return items
+
+    def _split_at_guess(self, searched: int) -> list[msgspec.Raw] | None:
+        """Split the buffer at its last boundary, if it can be guessed."""
+        buffer = self._buffer
+        end = len(buffer)
+        for _ in range(_MAX_GUESSES):
+            cut = max(
+                buffer.rfind(b"},", searched, end),
+                buffer.rfind(b"],", searched, end),
+            )
+            if cut < 0:
+                break
+            try:
+                items = _RAW_ITEMS.decode(b"[" + buffer[: cut + 1] + b"]")
+            except msgspec.DecodeError:
+                end = cut + 1
+                continue
+            self._drop(cut + 2)
+            return items
+        return None
+
+    def _scan(self) -> list[msgspec.Raw]:
+        """Split the buffer by tracking nesting over its unscanned bytes."""
+        buffer = self._buffer
+        items: list[msgspec.Raw] = []
+        item_start = 0
+        pos = self._pos
+
+        while match := _STRUCTURAL.search(buffer, pos):
+            pos = match.start()
+            char = buffer[pos : pos + 1]
+            if char == b'"':
+                tail = _STRING_TAIL.match(buffer, pos + 1)
+                if tail is None:
+                    break
+                pos = tail.end()
+                continue
+            if char in b"[{":
+                self._depth += 1
+            elif self._depth > 1:
+                if char != b",":
+                    self._depth -= 1
+            else:
+                item = bytes(buffer[item_start:pos]).strip(_WHITESPACE)
+                if item:
+                    items.append(msgspec.Raw(item))
+                item_start = pos + 1
+                if char == b"]":
+                    self.done = True
+                    break
+            pos += 1
+
+        self._pos = pos
+        self._drop(item_start)
+        return items
+
+    def _drop(self, size: int) -> None:
+        """Drop the first `size` bytes of the buffer, which have been split."""
+        if not size:
+            return
+        del self._buffer[:size]
+        self._pos -= size
+        if self._pos <= 0:
+            self._pos = 0
+            self._depth = 1
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    decoder: msgspec.json.Decoder[_T],
+) -> Iterator[_T]:
+    """Decode the items of a JSON array as its chunks arrive."""
+    splitter = JSONArraySplitter()
+    for chunk in chunks:
+        for item in splitter.feed(chunk):
+            yield decoder.decode(item)
+    splitter.close()
+
+
+async def aiter_json_array(
+    chunks: AsyncIterable[bytes],
+    decoder: msgspec.json.Decoder[_T],
+) -> AsyncIterator[_T]:
+    """Decode the items of a JSON array as its chunks arrive asynchronously."""
+    splitter = JSONArraySplitter()
+    async for chunk in chunks:
+        for item in splitter.feed(chunk):
+            yield decoder.decode(item)
+    splitter.close()
@@ -25,6 +25,9 @@ from mypy_extensions import NamedArg
 from typing_inspect import is_optional_type
 
 NOT_SUPPORTED = "not supported"
+LIMIT_HEADER_PREFIXES = ("x-ratelimit-", "x-concurrencylimit-")
+
+_SINGLE_CONNECTION_LIMITS = httpx.Limits(max_keepalive_connections=1, max_connections=1)
 
 
 class SecurityClient:
@@ -36,12 +39,20 @@ class SecurityClient:
         query_params: dict[str, str] | None = None,
         headers: dict[str, str] | None = None,
         timeout: int = 60,
+        async_client: httpx.AsyncClient | None = None,
     ) -> None:
         self.client = client
+        self.async_client = async_client
         self.query_params = query_params or {}
         self.headers = headers or {}
         self.timeout = timeout
-        self.limits = httpx.Limits(max_keepalive_connections=1, max_connections=1)
+        self.limits = _SINGLE_CONNECTION_LIMITS
+
+    def _apply(self, request: httpx.Request) -> None:
+        """Apply the security query parameters and headers to a request."""
+        if self.query_params:
+            request.url = request.url.copy_merge_params(self.query_params)
+        request.headers.update(self.headers)
 
     def send(
         self,
@@ -49,20 +60,35 @@ class SecurityClient:
         **kwargs: Any,
     ) -> httpx.Response:
         """Send a request."""
-        request.url = request.url.copy_merge_params(self.query_params)
-        request.headers.update(self.headers)
+        self._apply(request)
         if self.client is not None:
             return self.client.send(request, **kwargs)
         with httpx.Client(timeout=self.timeout, limits=self.limits) as client:
             return client.send(request, **kwargs)
 
+    async def send_async(
+        self,
+        request: httpx.Request,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request asynchronously."""
+        self._apply(request)
+        if self.async_client is not None:
+            return await self.async_client.send(request, **kwargs)
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=self.limits,
+        ) as client:
+            return await client.send(request, **kwargs)
+
 
 def configure_security_client(
     session: httpx.Client | None,
     security: msgspec.Struct | None,
+    async_session: httpx.AsyncClient | None = None,
 ) -> SecurityClient:
     """Configure a client with security settings."""
-    client = SecurityClient(session)
+    client = SecurityClient(session, async_client=async_session)
 
     if security is None:
         return client
@@ -424,15 +450,17 @@ class PipeDelimitedQueryParamHandler:
         return _get_delimited_query_params(metadata, field_name, value, "|")
 
 
+_QUERY_PARAM_HANDLERS: dict[str, QueryParamHandler] = {
+    "form": FormQueryParamHandler(),
+    "deepObject": DeepObjectQueryParamHandler(),
+    "pipeDelimited": PipeDelimitedQueryParamHandler(),
+}
+
+
 def get_query_param_handler(style: str) -> QueryParamHandler:
     """Get the appropriate query parameter handler based on style."""
-    handlers = {
-        "form": FormQueryParamHandler(),
-        "deepObject": DeepObjectQueryParamHandler(),
-        "pipeDelimited": PipeDelimitedQueryParamHandler(),
-    }
     # Default to form style
-    return handlers.get(style, FormQueryParamHandler())  # type: ignore[return-value]
+    return _QUERY_PARAM_HANDLERS.get(style, _QUERY_PARAM_HANDLERS["form"])
 
 
 def process_query_param(
@@ -510,6 +538,31 @@ def get_headers(headers_params: msgspec.Struct | None) -> dict[str, str]:
     return headers
 
 
+def request_key(request: httpx.Request) -> tuple[str, str, str]:
+    """Get the key identifying identical requests: method, URL with query and Accept header."""
+    return request.method, str(request.url), request.headers.get("accept", "")
+
+
+def get_limit_headers(headers: httpx.Headers) -> dict[str, str]:
+    """Get the rate limit and concurrency limit headers of a response."""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.startswith(LIMIT_HEADER_PREFIXES)
+    }
+
+
+def get_int_header(headers: httpx.Headers, name: str) -> int | None:
+    """Get an integer header, ignoring missing or malformed values."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
 def _get_serialized_params(
     metadata: dict[str, Any],
     field_type: type[msgspec.Struct],
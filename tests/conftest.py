@@ -9,7 +9,7 @@ from dotenv import load_dotenv
 from syrupy.assertion import SnapshotAssertion
 from syrupy.extensions.json import JSONSnapshotExtension
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +46,18 @@ def coinapi(api_key: str) -> CoinAPI:
     return CoinAPI(api_key)
 
 
+@pytest.fixture
+def async_coinapi(api_key: str) -> AsyncCoinAPI:
+    """Return an AsyncCoinAPI instance."""
+    return AsyncCoinAPI(api_key)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
 @pytest.fixture(scope="package")
 def vcr_config(record_mode: str) -> dict[str, Any]:
     """VCR configuration."""
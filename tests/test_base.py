@@ -1,11 +1,14 @@
 """Tests for the operations base."""
 
 import httpx
+import msgspec
 import pytest
 
+from coinapi import CoinAPI
 from coinapi._hooks import SDKHooks
 from coinapi.base import Base
 from coinapi.config import CoinAPIConfig
+from coinapi.models import components, operations
 from coinapi.models.errors import CoinAPIError
 
 
@@ -51,3 +54,111 @@ def test_set_response_content_text_plain(config: CoinAPIConfig) -> None:
     base._set_response_content(res, http_res, "text/plain", type(res))  # type: ignore[type-var]
 
     assert res.content_plain == "Test content"
+
+
+def test_prepare_headers_prefers_msgpack(config: CoinAPIConfig) -> None:
+    """Test that msgpack mode negotiates MessagePack ahead of JSON."""
+    config.prefer_msgpack = True
+    base = Base(config)
+
+    request = operations.GetV1TradesLatestRequest()
+
+    headers = base._prepare_headers(request, None)
+
+    assert headers["Accept"].startswith("application/x-msgpack;q=1")
+
+
+def test_msgpack_response_decoded() -> None:
+    """Test that a MessagePack response is decoded into typed content."""
+    trades = [
+        {
+            "symbol_id": "KRAKEN_SPOT_BTC_USD",
+            "time_exchange": "2024-03-06T20:46:24.6673328Z",
+            "time_coinapi": "2024-03-06T20:46:24.7071883Z",
+            "uuid": "bbd51db9-d0af-4ff1-909f-fd8b2aa56272",
+            "price": 67088.3,
+            "size": 0.002,
+            "taker_side": "SELL",
+        },
+    ]
+    payload = msgspec.msgpack.encode(trades)
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Accept"])
+        return httpx.Response(
+            200,
+            content=payload,
+            headers={"Content-Type": "application/x-msgpack"},
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    coinapi = CoinAPI("testing", client=client, prefer_msgpack=True)
+
+    res = coinapi.trades.get_v1_trades_latest()
+
+    assert seen[0].startswith("application/x-msgpack")
+    assert res.body == payload
+    assert res.content == msgspec.json.decode(
+        msgspec.json.encode(trades),
+        type=list[components.V1Trade],
+    )
+
+
+def test_stream_request_error_response() -> None:
+    """Test that a streamed error response raises before yielding items."""
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, json={"error": "Too many requests"})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    coinapi = CoinAPI("testing", client=client)
+    request = operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+    )
+
+    with pytest.raises(CoinAPIError, match="API error occurred"):
+        next(coinapi.trades.stream_v1_trades_symbol_id_history(request))
+
+
+@pytest.mark.parametrize("lean", [False, True])
+def test_lean_responses(lean: bool) -> None:
+    """Test that lean responses keep only the status, limit headers and content."""
+    payload = msgspec.msgpack.encode([])
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=payload,
+            headers={
+                "Content-Type": "application/x-msgpack",
+                "X-RateLimit-Remaining": "999",
+                "X-ConcurrencyLimit-Limit": "10",
+                "Server": "stand-in",
+            },
+        )
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    coinapi = CoinAPI("testing", client=client, lean_responses=lean)
+
+    res = coinapi.trades.get_v1_trades_latest()
+
+    assert res.status_code == 200
+    assert res.content == []
+    assert res.headers == {
+        "x-ratelimit-remaining": "999",
+        "x-concurrencylimit-limit": "10",
+    }
+    assert (res.raw_response is None) is lean
+    assert (res.body is None) is lean
+
+
+def test_prepare_headers_accept_encoding(config: CoinAPIConfig) -> None:
+    """Test that the configured compression is negotiated."""
+    config.compression = ("gzip",)
+    base = Base(config)
+    request = operations.GetV1TradesLatestRequest()
+
+    headers = base._prepare_headers(request, None)
+
+    assert headers["Accept-Encoding"] == "gzip"
@@ -0,0 +1,184 @@
+"""Tests for executing batches of operations."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+from coinapi.batch import aiter_batch, iter_batch
+from coinapi.concurrency import ConcurrencyGovernor
+from coinapi.models import errors, operations
+
+
+class Server:
+    """Stand-in echoing the requested path, failing for unknown symbols."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request without waiting."""
+        if "UNKNOWN" in request.url.path:
+            return httpx.Response(400, json={"error": "unknown symbol"})
+        trade = {
+            "symbol_id": request.url.path,
+            "time_exchange": "2024-01-01T00:00:00.0000000Z",
+            "time_coinapi": "2024-01-01T00:00:00.1000000Z",
+            "uuid": "770C7A3B-7258-4441-8182-83740F3E2457",
+            "price": 42000.5,
+            "size": 0.25,
+            "taker_side": "BUY",
+        }
+        return httpx.Response(200, json=[trade])
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request after a delay, tracking requests in flight."""
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return self.respond(request)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request asynchronously after a delay."""
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self.respond(request)
+
+
+def history(symbol_id: str) -> operations.GetV1TradesSymbolIDHistoryRequest:
+    """Build a trades history request."""
+    return operations.GetV1TradesSymbolIDHistoryRequest(symbol_id=symbol_id)
+
+
+def test_results_in_input_order_with_errors() -> None:
+    """Test that outcomes follow the input order and failures stay per item."""
+    client = httpx.Client(transport=httpx.MockTransport(Server()))
+    coinapi = CoinAPI("testing", client=client)
+
+    results = coinapi.batch(
+        [
+            (coinapi.trades.get_v1_trades_symbol_id_history, history("A")),
+            (coinapi.trades.get_v1_trades_symbol_id_history, history("UNKNOWN")),
+            (coinapi.trades.get_v1_trades_latest, {"limit": 10}),
+            (coinapi.metadata.get_v1_exchanges, None),
+        ],
+    )
+
+    assert [result.ok for result in results] == [True, False, True, True]
+    assert results[0].unwrap().status_code == 200
+    assert isinstance(results[1].error, errors.CoinAPIError)
+    with pytest.raises(errors.CoinAPIError):
+        results[1].unwrap()
+    assert results[2].response.status_code == 200  # type: ignore[union-attr]
+
+
+def test_empty_batch() -> None:
+    """Test that an empty batch returns no results."""
+    assert CoinAPI("testing").batch([]) == []
+
+
+def test_bounded_by_max_workers() -> None:
+    """Test that no more than `max_workers` operations run at once."""
+    server = Server(delay=0.01)
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    coinapi = CoinAPI("testing", client=client)
+    calls = [
+        (coinapi.trades.get_v1_trades_symbol_id_history, history(f"S{i}"))
+        for i in range(12)
+    ]
+
+    results = coinapi.batch(calls, max_workers=3)
+
+    assert all(result.ok for result in results)
+    assert server.peak == 3
+
+
+def test_honors_concurrency_governor() -> None:
+    """Test that requests of a batch are admitted by the concurrency governor."""
+    server = Server(delay=0.01)
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    governor = ConcurrencyGovernor(2, max_limit=2)
+    coinapi = CoinAPI("testing", client=client, concurrency_governor=governor)
+    calls = [
+        (coinapi.trades.get_v1_trades_symbol_id_history, history(f"S{i}"))
+        for i in range(8)
+    ]
+
+    coinapi.batch(calls, max_workers=8)
+
+    assert server.peak == 2
+    assert governor.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_async_batch() -> None:
+    """Test that async batches keep input order and bound concurrency."""
+    server = Server(delay=0.01)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client)
+    symbols = ["A", "UNKNOWN", "B", "C", "D"]
+
+    results = await coinapi.batch(
+        [
+            (coinapi.trades.get_v1_trades_symbol_id_history, history(symbol))
+            for symbol in symbols
+        ],
+        max_workers=2,
+    )
+
+    assert [result.ok for result in results] == [True, False, True, True, True]
+    assert results[3].unwrap().content[0].symbol_id == "/v1/trades/C/history"
+    assert server.peak == 2
+
+
+def test_iter_batch_starts_calls_as_consumed() -> None:
+    """Test that iterated batches hold at most `max_workers` calls at once."""
+    started: list[int] = []
+
+    def operation(i: int) -> int:
+        started.append(i)
+        return i
+
+    results = iter_batch(((operation, {"i": i}) for i in range(10)), max_workers=3)
+
+    assert next(results).unwrap() == 0
+    deadline = time.monotonic() + 5
+    while len(started) < 4 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    time.sleep(0.01)
+    assert sorted(started) == [0, 1, 2, 3]
+    assert [result.unwrap() for result in results] == list(range(1, 10))
+
+
+@pytest.mark.anyio
+async def test_aiter_batch() -> None:
+    """Test that async iterated batches keep input order and bound concurrency."""
+    server = Server(delay=0.01)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client)
+    symbols = ["A", "UNKNOWN", "B", "C", "D"]
+
+    results = [
+        result
+        async for result in aiter_batch(
+            (
+                (coinapi.trades.get_v1_trades_symbol_id_history, history(symbol))
+                for symbol in symbols
+            ),
+            max_workers=2,
+        )
+    ]
+
+    assert [result.ok for result in results] == [True, False, True, True, True]
+    assert server.peak == 2
@@ -0,0 +1,172 @@
+"""Tests for the in-memory response cache."""
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+from coinapi.cache import ResponseCache, estimate_size
+from coinapi.models import errors
+
+EXCHANGES = "get_/v1/exchanges"
+SYMBOLS = "get_/v1/symbols"
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Get the current time."""
+        return self.now
+
+
+class Server:
+    """Stand-in counting the requests it answers."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.requests = 0
+
+    def __call__(self, _: httpx.Request) -> httpx.Response:
+        """Answer a request with an empty array."""
+        self.requests += 1
+        return httpx.Response(self.status_code, json=[])
+
+
+def sdk(server: Server, cache: ResponseCache) -> CoinAPI:
+    """Build an SDK sending its requests to a stand-in."""
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    return CoinAPI("testing", client=client, response_cache=cache)
+
+
+def test_estimate_size_counts_references() -> None:
+    """Test that larger decoded contents have larger estimates."""
+    small = [{"asset_id": "BTC"}]
+    large = [{"asset_id": f"ASSET{i}"} for i in range(100)]
+
+    assert estimate_size(large) > 50 * estimate_size(small)
+    assert estimate_size([small, small]) < 2 * estimate_size(small)
+
+
+def test_caches_configured_operations() -> None:
+    """Test that repeated calls of a cached operation send one request."""
+    server = Server()
+    cache = ResponseCache()
+    coinapi = sdk(server, cache)
+
+    first = coinapi.metadata.get_v1_exchanges()
+    second = coinapi.metadata.get_v1_exchanges()
+
+    assert second is first
+    assert server.requests == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 1
+    assert cache.size > 0
+
+
+def test_does_not_cache_other_operations() -> None:
+    """Test that operations without a TTL are always sent."""
+    server = Server()
+    cache = ResponseCache()
+    coinapi = sdk(server, cache)
+
+    coinapi.metadata.get_v1_symbols()
+    coinapi.metadata.get_v1_symbols()
+
+    assert server.requests == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_keys_include_query_parameters() -> None:
+    """Test that calls with different arguments are cached separately."""
+    server = Server()
+    coinapi = sdk(server, ResponseCache(default_ttl=60))
+
+    for symbol_id in ("BTC", "ETH", "BTC"):
+        coinapi.metadata.get_v1_symbols(filter_symbol_id=symbol_id)
+
+    assert server.requests == 2
+
+
+def test_entries_expire() -> None:
+    """Test that entries are refetched once their TTL has passed."""
+    server = Server()
+    clock = FakeClock()
+    coinapi = sdk(server, ResponseCache({EXCHANGES: 10}, clock=clock))
+
+    coinapi.metadata.get_v1_exchanges()
+    clock.now = 9
+    coinapi.metadata.get_v1_exchanges()
+    clock.now = 10
+    coinapi.metadata.get_v1_exchanges()
+
+    assert server.requests == 2
+
+
+def test_does_not_cache_errors() -> None:
+    """Test that failed responses are not cached."""
+    server = Server(status_code=500)
+    cache = ResponseCache()
+    coinapi = sdk(server, cache)
+
+    for _ in range(2):
+        with pytest.raises(errors.CoinAPIError):
+            coinapi.metadata.get_v1_exchanges()
+
+    assert server.requests == 2
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used() -> None:
+    """Test that entries beyond the size bound are evicted in LRU order."""
+    cache = ResponseCache(default_ttl=60)
+    entry_size = estimate_size(["x" * 100])
+    cache.max_bytes = 2 * entry_size
+
+    cache.put(SYMBOLS, "a", ["a" * 100])
+    cache.put(SYMBOLS, "b", ["b" * 100])
+    cache.get(SYMBOLS, "a")
+    cache.put(SYMBOLS, "c", ["c" * 100])
+
+    assert cache.get(SYMBOLS, "b") is None
+    assert cache.get(SYMBOLS, "a") is not None
+    assert cache.get(SYMBOLS, "c") is not None
+    assert cache.evictions == 1
+    assert cache.size == 2 * entry_size
+
+
+def test_skips_entries_larger_than_bound() -> None:
+    """Test that a response larger than the whole cache is not stored."""
+    cache = ResponseCache(default_ttl=60, max_bytes=100)
+
+    cache.put(SYMBOLS, "a", ["a" * 1000])
+
+    assert len(cache) == 0
+
+
+def test_invalidate() -> None:
+    """Test dropping the entries of one operation or of all operations."""
+    cache = ResponseCache(default_ttl=60)
+    cache.put(EXCHANGES, "a", [])
+    cache.put(SYMBOLS, "a", [])
+    cache.put(SYMBOLS, "b", [])
+
+    assert cache.invalidate(SYMBOLS) == 2
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert cache.size == 0
+
+
+@pytest.mark.anyio
+async def test_async_caches_configured_operations() -> None:
+    """Test that the async client uses the cache as well."""
+    server = Server()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    coinapi = AsyncCoinAPI("testing", client=client, response_cache=ResponseCache())
+
+    await coinapi.ohlcv.get_v1_ohlcv_periods()
+    await coinapi.ohlcv.get_v1_ohlcv_periods()
+
+    assert server.requests == 1
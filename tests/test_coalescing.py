@@ -0,0 +1,153 @@
+"""Tests for coalescing identical concurrent requests."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+from coinapi.coalescing import RequestCoalescer
+from coinapi.models import errors
+
+
+class SlowServer:
+    """Stand-in answering every request after a delay."""
+
+    def __init__(self, status_code: int = 200, delay: float = 0.05) -> None:
+        self.status_code = status_code
+        self.delay = delay
+        self.urls: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request with an empty array."""
+        with self._lock:
+            self.urls.append(str(request.url))
+        time.sleep(self.delay)
+        return httpx.Response(self.status_code, json=[])
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request asynchronously with an empty array."""
+        self.urls.append(str(request.url))
+        await asyncio.sleep(self.delay)
+        return httpx.Response(self.status_code, json=[])
+
+
+def run_threads(count: int, target: object) -> list[object]:
+    """Call `target` from `count` threads at once and collect the outcomes."""
+    outcomes: list[object] = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        try:
+            outcomes[index] = target()  # type: ignore[operator]
+        except Exception as e:  # noqa: BLE001
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def sdk(server: SlowServer, coalescer: RequestCoalescer) -> CoinAPI:
+    """Build an SDK sending its requests to a stand-in."""
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    return CoinAPI("testing", client=client, coalescer=coalescer)
+
+
+def test_concurrent_duplicates_share_request() -> None:
+    """Test that identical concurrent calls share one request and one result."""
+    server = SlowServer()
+    coalescer = RequestCoalescer()
+    coinapi = sdk(server, coalescer)
+
+    results = run_threads(8, coinapi.metadata.get_v1_symbols)
+
+    assert len(server.urls) == 1
+    assert all(result is results[0] for result in results)
+    assert coalescer.executed == 1
+    assert coalescer.coalesced == 7
+    assert coalescer.in_flight == 0
+
+
+def test_different_arguments_not_shared() -> None:
+    """Test that calls with different query parameters are sent separately."""
+    server = SlowServer()
+    coinapi = sdk(server, RequestCoalescer())
+    symbol_ids = iter(["BTC", "ETH"])
+    lock = threading.Lock()
+
+    def call() -> object:
+        with lock:
+            symbol_id = next(symbol_ids)
+        return coinapi.metadata.get_v1_symbols(filter_symbol_id=symbol_id)
+
+    run_threads(2, call)
+
+    assert len(server.urls) == 2
+
+
+def test_errors_are_shared() -> None:
+    """Test that every caller of a shared request receives its error."""
+    server = SlowServer(status_code=503)
+    coinapi = sdk(server, RequestCoalescer())
+
+    outcomes = run_threads(4, coinapi.metadata.get_v1_symbols)
+
+    assert len(server.urls) == 1
+    assert all(isinstance(outcome, errors.CoinAPIError) for outcome in outcomes)
+
+
+def test_sequential_calls_not_cached() -> None:
+    """Test that a call after completion sends a new request."""
+    server = SlowServer(delay=0)
+    coinapi = sdk(server, RequestCoalescer())
+
+    coinapi.metadata.get_v1_symbols()
+    coinapi.metadata.get_v1_symbols()
+
+    assert len(server.urls) == 2
+
+
+@pytest.mark.anyio
+async def test_async_duplicates_share_request() -> None:
+    """Test that identical concurrent tasks share one request."""
+    server = SlowServer()
+    coalescer = RequestCoalescer()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client, coalescer=coalescer)
+
+    results = await asyncio.gather(
+        *(coinapi.metadata.get_v1_symbols() for _ in range(5)),
+    )
+
+    assert len(server.urls) == 1
+    assert all(result is results[0] for result in results)
+    assert coalescer.coalesced == 4
+    assert coalescer.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_async_cancelled_leader_does_not_cancel_followers() -> None:
+    """Test that cancelling the first caller leaves the shared request running."""
+    server = SlowServer()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client, coalescer=RequestCoalescer())
+
+    leader = asyncio.create_task(coinapi.metadata.get_v1_symbols())
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(coinapi.metadata.get_v1_symbols())
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    res = await follower
+
+    assert res.status_code == 200
+    assert leader.cancelled()
+    assert len(server.urls) == 1
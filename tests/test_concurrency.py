@@ -0,0 +1,198 @@
+"""Tests for the adaptive concurrency governor."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from coinapi import CoinAPI
+from coinapi.concurrency import ConcurrencyGovernor
+from coinapi.models import operations
+
+
+def response(
+    status_code: int = 200,
+    limit: int = 10,
+    remaining: int = 5,
+) -> httpx.Response:
+    """Build a response with concurrency limit headers."""
+    return httpx.Response(
+        status_code,
+        headers={
+            "X-ConcurrencyLimit-Limit": str(limit),
+            "X-ConcurrencyLimit-Remaining": str(remaining),
+        },
+    )
+
+
+def test_invalid_limits() -> None:
+    """Test that the minimum limit must not exceed the initial limit."""
+    with pytest.raises(ValueError, match="min_limit"):
+        ConcurrencyGovernor(2, min_limit=3)
+
+
+def test_grows_on_headroom() -> None:
+    """Test that a saturated limit grows while the API reports spare capacity."""
+    governor = ConcurrencyGovernor(2)
+    governor.acquire()
+    governor.acquire()
+
+    governor.release(response(remaining=3))
+
+    assert governor.limit == 3
+    assert governor.in_flight == 1
+    assert governor.server_limit == 10
+
+
+def test_does_not_grow_when_unused() -> None:
+    """Test that the limit only grows when it is fully used."""
+    governor = ConcurrencyGovernor(4)
+    governor.acquire()
+
+    governor.release(response(remaining=3))
+
+    assert governor.limit == 4
+
+
+def test_never_exceeds_server_limit() -> None:
+    """Test that the limit is capped by the reported concurrency limit."""
+    governor = ConcurrencyGovernor(8)
+    governor.acquire()
+
+    governor.release(response(limit=5, remaining=1))
+
+    assert governor.limit == 5
+
+
+def test_never_exceeds_max_limit() -> None:
+    """Test that the limit is capped by the configured maximum."""
+    governor = ConcurrencyGovernor(2, max_limit=2)
+    governor.acquire()
+    governor.acquire()
+
+    governor.release(response(remaining=5))
+
+    assert governor.limit == 2
+
+
+def test_shrinks_on_rejection() -> None:
+    """Test that a rejected request halves the limit down to the minimum."""
+    governor = ConcurrencyGovernor(8, min_limit=3)
+    governor.acquire()
+
+    governor.release(response(429, remaining=0))
+    assert governor.limit == 4
+
+    governor.acquire()
+    governor.release(response(429, remaining=0))
+    assert governor.limit == 3
+
+
+def test_blocks_threads_beyond_limit() -> None:
+    """Test that threads wait for a slot once the limit is reached."""
+    governor = ConcurrencyGovernor(1)
+    governor.acquire()
+    acquired = threading.Event()
+
+    def worker() -> None:
+        governor.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    governor.release()
+    assert acquired.wait(1)
+    thread.join()
+    assert governor.in_flight == 1
+
+
+@pytest.mark.anyio
+async def test_blocks_tasks_beyond_limit() -> None:
+    """Test that tasks wait for a slot, including slots freed by threads."""
+    governor = ConcurrencyGovernor(1)
+    governor.acquire()
+
+    task = asyncio.create_task(governor.acquire_async())
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    await asyncio.to_thread(governor.release)
+    await asyncio.wait_for(task, 1)
+    assert governor.in_flight == 1
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiter_passes_slot_on() -> None:
+    """Test that a cancelled waiter does not keep other waiters blocked."""
+    governor = ConcurrencyGovernor(1)
+    await governor.acquire_async()
+    first = asyncio.create_task(governor.acquire_async())
+    second = asyncio.create_task(governor.acquire_async())
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+    governor.release()
+    await asyncio.wait_for(second, 1)
+
+    assert first.cancelled()
+    assert governor.in_flight == 1
+
+
+def test_sdk_limits_requests_in_flight() -> None:
+    """Test that concurrent SDK calls never exceed the governor limit."""
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(
+            200,
+            json=[],
+            headers={
+                "X-ConcurrencyLimit-Limit": "2",
+                "X-ConcurrencyLimit-Remaining": "0",
+            },
+        )
+
+    governor = ConcurrencyGovernor(2)
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    coinapi = CoinAPI("testing", client=client, concurrency_governor=governor)
+
+    threads = [
+        threading.Thread(target=coinapi.trades.get_v1_trades_latest) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == 2
+    assert governor.in_flight == 0
+    assert governor.server_limit == 2
+
+
+def test_sdk_stream_holds_slot_until_closed() -> None:
+    """Test that a streamed response keeps its slot until it is consumed."""
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[])
+
+    governor = ConcurrencyGovernor(2)
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    coinapi = CoinAPI("testing", client=client, concurrency_governor=governor)
+    request = operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+    )
+
+    assert list(coinapi.trades.stream_v1_trades_symbol_id_history(request)) == []
+    assert governor.in_flight == 0
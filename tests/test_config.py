@@ -0,0 +1,172 @@
+"""Tests for the SDK config."""
+
+import importlib.util
+
+import httpx
+import msgspec
+import pytest
+
+from coinapi.config import (
+    DEFAULT_LIMITS,
+    CoinAPIConfig,
+    default_compression,
+    resolve_compression,
+    supported_encodings,
+)
+from coinapi.models import components
+from coinapi.utils import utils
+
+
+def test_get_client_reuses_owned_client() -> None:
+    """Test that the SDK-owned client is created once and reused."""
+    config = CoinAPIConfig(None)
+
+    client = config.get_client()
+
+    assert config.get_client() is client
+    config.close()
+    assert client.is_closed
+
+
+def test_get_client_applies_limits() -> None:
+    """Test that the pool limits are applied to the SDK-owned client."""
+    limits = httpx.Limits(max_connections=3, max_keepalive_connections=2)
+    config = CoinAPIConfig(None, limits=limits)
+
+    client = config.get_client()
+
+    pool = client._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 3
+    assert pool._max_keepalive_connections == 2
+    config.close()
+
+
+def test_get_client_returns_user_client() -> None:
+    """Test that a caller-provided client is used and never closed by the SDK."""
+    user_client = httpx.Client()
+    config = CoinAPIConfig(user_client)
+
+    assert config.get_client() is user_client
+    config.close()
+    assert not user_client.is_closed
+    user_client.close()
+
+
+def test_close_recreates_client() -> None:
+    """Test that a closed config creates a new client on next use."""
+    config = CoinAPIConfig(None)
+    first = config.get_client()
+    config.close()
+
+    second = config.get_client()
+
+    assert second is not first
+    assert not second.is_closed
+    config.close()
+
+
+def test_default_limits() -> None:
+    """Test the default limits keep connections alive."""
+    config = CoinAPIConfig(None)
+
+    assert config.limits is DEFAULT_LIMITS
+    assert DEFAULT_LIMITS.max_keepalive_connections
+
+
+@pytest.mark.anyio
+async def test_get_async_client_reuses_owned_client() -> None:
+    """Test that the SDK-owned async client is created once and reused."""
+    config = CoinAPIConfig(None)
+
+    client = config.get_async_client()
+
+    assert config.get_async_client() is client
+    await config.aclose()
+    assert client.is_closed
+
+
+@pytest.fixture(name="configure_calls")
+def configure_calls_fixture(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    """Record the security values passed to `configure_security_client`."""
+    calls: list[object] = []
+    original = utils.configure_security_client
+
+    def configure(
+        session: httpx.Client | None,
+        security: msgspec.Struct | None,
+    ) -> utils.SecurityClient:
+        calls.append(security)
+        return original(session, security)
+
+    monkeypatch.setattr(utils, "configure_security_client", configure)
+    return calls
+
+
+def test_security_resolved_once(configure_calls: list[object]) -> None:
+    """Test that static security is resolved on first use only."""
+    config = CoinAPIConfig(None, security=components.Security(api_key="key"))
+
+    first = config.get_security_client()
+    second = config.get_security_client()
+
+    assert len(configure_calls) == 1
+    assert first.headers == {"X-CoinAPI-Key": "key"}
+    assert second.headers is first.headers
+    assert second.client is config.get_client()
+    config.close()
+
+
+def test_security_callable_recomputed_on_change(
+    configure_calls: list[object],
+) -> None:
+    """Test that callable security is only re-resolved when its value changes."""
+    keys = iter(["one", "one", "two"])
+    config = CoinAPIConfig(
+        None,
+        security=lambda: components.Security(api_key=next(keys)),
+    )
+
+    headers = [config.get_security_client().headers for _ in range(3)]
+
+    assert len(configure_calls) == 2
+    assert headers[0] is headers[1]
+    assert headers[2] == {"X-CoinAPI-Key": "two"}
+    config.close()
+
+
+def test_default_compression() -> None:
+    """Test that every supported encoding is negotiated by default."""
+    config = CoinAPIConfig(None)
+
+    assert config.compression is None
+    assert config.get_accept_encoding() == ", ".join(supported_encodings())
+    assert {"gzip", "deflate"} <= set(default_compression())
+
+
+def test_supported_encodings_follow_installed_packages(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that br and zstd are supported only with their decoder packages."""
+    installed = {"brotlicffi", "zstandard"}
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name: object() if name in installed else None,
+    )
+
+    assert supported_encodings() == ("gzip", "deflate", "br", "zstd")
+    installed.clear()
+    assert supported_encodings() == ("gzip", "deflate")
+
+
+def test_compression_disabled() -> None:
+    """Test that an empty compression setting asks for identity responses."""
+    config = CoinAPIConfig(None, compression=resolve_compression([]))
+
+    assert config.get_accept_encoding() == "identity"
+
+
+def test_compression_unsupported() -> None:
+    """Test that encodings httpx cannot decode are rejected."""
+    with pytest.raises(ValueError, match="cannot decode"):
+        resolve_compression(["gzip", "compress"])
@@ -0,0 +1,54 @@
+"""Tests for cached response decoders."""
+
+import msgspec
+
+from coinapi.models import components, operations
+from coinapi.utils import decoders
+
+TRADES = b"""[
+    {
+        "symbol_id": "KRAKEN_SPOT_BTC_USD",
+        "time_exchange": "2024-03-06T20:46:24.6673328Z",
+        "time_coinapi": "2024-03-06T20:46:24.7071883Z",
+        "uuid": "bbd51db9-d0af-4ff1-909f-fd8b2aa56272",
+        "price": 67088.3,
+        "size": 0.002,
+        "taker_side": "SELL"
+    }
+]"""
+
+
+def test_codec_is_cached_on_class() -> None:
+    """Test that the codec is built once and stored on the response class."""
+    response_cls = operations.GetV1TradesSymbolIDHistoryResponse
+
+    codec = decoders.get_response_codec(response_cls)
+
+    assert decoders.get_response_codec(response_cls) is codec
+    assert response_cls.__dict__["_response_codec"] is codec
+
+
+def test_codec_content_type() -> None:
+    """Test that the codec resolves the type of the content field."""
+    codec = decoders.get_response_codec(operations.GetV1TradesLatestResponse)
+
+    assert codec.content_type == list[components.V1Trade] | None
+
+
+def test_codec_json_decode() -> None:
+    """Test that the cached decoder matches a one-off typed decode."""
+    codec = decoders.get_response_codec(operations.GetV1TradesSymbolIDHistoryResponse)
+
+    assert codec.json.decode(TRADES) == msgspec.json.decode(
+        TRADES,
+        type=list[components.V1Trade],
+    )
+
+
+def test_codec_msgpack_decode() -> None:
+    """Test that the msgpack decoder yields the same structs as JSON."""
+    codec = decoders.get_response_codec(operations.GetV1TradesSymbolIDHistoryResponse)
+    payload = msgspec.msgpack.encode(msgspec.json.decode(TRADES))
+
+    assert codec.msgpack is codec.msgpack
+    assert codec.msgpack.decode(payload) == codec.json.decode(TRADES)
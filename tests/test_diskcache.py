@@ -0,0 +1,181 @@
+"""Tests for the persistent cache of historical responses."""
+
+import datetime as dt
+import pathlib
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+from coinapi.diskcache import DiskCache, parse_time
+from coinapi.models import errors, operations
+
+TRADES = "get_/v1/trades/{symbol_id}/history"
+
+TRADE = {
+    "symbol_id": "BITSTAMP_SPOT_BTC_USD",
+    "time_exchange": "2024-01-01T00:00:00.0000000Z",
+    "time_coinapi": "2024-01-01T00:00:00.1000000Z",
+    "uuid": "770C7A3B-7258-4441-8182-83740F3E2457",
+    "price": 42000.5,
+    "size": 0.25,
+    "taker_side": "BUY",
+}
+
+
+class Server:
+    """Stand-in counting the requests it answers."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.requests = 0
+
+    def __call__(self, _: httpx.Request) -> httpx.Response:
+        """Answer a request with a single trade."""
+        self.requests += 1
+        return httpx.Response(self.status_code, json=[TRADE])
+
+
+def sdk(server: Server, cache: DiskCache) -> CoinAPI:
+    """Build an SDK sending its requests to a stand-in."""
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    return CoinAPI("testing", client=client, disk_cache=cache)
+
+
+def history(
+    time_start: str = "2024-01-01T00:00:00",
+    time_end: str | None = "2024-01-02T00:00:00",
+) -> operations.GetV1TradesSymbolIDHistoryRequest:
+    """Build a trades history request."""
+    return operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="BITSTAMP_SPOT_BTC_USD",
+        time_start=time_start,
+        time_end=time_end,
+    )
+
+
+def test_parse_time() -> None:
+    """Test that times with and without offsets are parsed as UTC."""
+    expected = dt.datetime(2024, 1, 1, 12, tzinfo=dt.timezone.utc)
+
+    assert parse_time("2024-01-01T12:00:00") == expected
+    assert parse_time("2024-01-01T12:00:00.0000000Z") == expected
+    assert parse_time("2024-01-01T14:00:00+02:00") == expected
+    assert parse_time("yesterday") is None
+
+
+def test_serves_closed_windows_from_disk(tmp_path: pathlib.Path) -> None:
+    """Test that a closed window is fetched once, also across cache instances."""
+    server = Server()
+    first = sdk(server, DiskCache(tmp_path)).trades.get_v1_trades_symbol_id_history(
+        history(),
+    )
+
+    cache = DiskCache(tmp_path)
+    second = sdk(server, cache).trades.get_v1_trades_symbol_id_history(history())
+
+    assert server.requests == 1
+    assert second.content == first.content
+    assert second.content is not None
+    assert second.content[0].price == 42000.5
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert len(cache) == 1
+    assert 0 < cache.size < 1000
+
+
+def test_equivalent_times_share_entry(tmp_path: pathlib.Path) -> None:
+    """Test that differently written times of the same window share an entry."""
+    server = Server()
+    coinapi = sdk(server, DiskCache(tmp_path))
+
+    coinapi.trades.get_v1_trades_symbol_id_history(history())
+    coinapi.trades.get_v1_trades_symbol_id_history(
+        history("2024-01-01T02:00:00+02:00", "2024-01-02T00:00:00.0000000Z"),
+    )
+
+    assert server.requests == 1
+
+
+@pytest.mark.parametrize(
+    "time_end",
+    [None, (dt.datetime.now(dt.timezone.utc) - dt.timedelta(minutes=5)).isoformat()],
+)
+def test_does_not_store_open_windows(
+    tmp_path: pathlib.Path,
+    time_end: str | None,
+) -> None:
+    """Test that windows without an end, or ending too recently, are always sent."""
+    server = Server()
+    cache = DiskCache(tmp_path)
+    coinapi = sdk(server, cache)
+
+    coinapi.trades.get_v1_trades_symbol_id_history(history(time_end=time_end))
+    coinapi.trades.get_v1_trades_symbol_id_history(history(time_end=time_end))
+
+    assert server.requests == 2
+    assert len(cache) == 0
+
+
+def test_does_not_store_errors(tmp_path: pathlib.Path) -> None:
+    """Test that failed responses are not stored."""
+    server = Server(status_code=500)
+    cache = DiskCache(tmp_path)
+
+    with pytest.raises(errors.CoinAPIError):
+        sdk(server, cache).trades.get_v1_trades_symbol_id_history(history())
+
+    assert len(cache) == 0
+
+
+def test_missing_body_is_a_miss(tmp_path: pathlib.Path) -> None:
+    """Test that an entry whose body was deleted is fetched again."""
+    server = Server()
+    cache = DiskCache(tmp_path)
+    coinapi = sdk(server, cache)
+    coinapi.trades.get_v1_trades_symbol_id_history(history())
+    for body in tmp_path.glob("*/*.gz"):
+        body.unlink()
+
+    coinapi.trades.get_v1_trades_symbol_id_history(history())
+
+    assert server.requests == 2
+    assert cache.misses == 2
+
+
+def test_evicts_least_recently_used(tmp_path: pathlib.Path) -> None:
+    """Test that entries beyond `max_bytes` are removed, oldest access first."""
+    cache = DiskCache(tmp_path)
+    coinapi = sdk(Server(), cache)
+    coinapi.trades.get_v1_trades_symbol_id_history(history())
+    cache.max_bytes = cache.size
+
+    coinapi.trades.get_v1_trades_symbol_id_history(
+        history(time_start="2024-01-01T12:00:00"),
+    )
+
+    assert len(cache) == 1
+    assert len(list(tmp_path.glob("*/*.gz"))) == 1
+
+
+def test_invalidate(tmp_path: pathlib.Path) -> None:
+    """Test removing the entries of an operation."""
+    cache = DiskCache(tmp_path)
+    sdk(Server(), cache).trades.get_v1_trades_symbol_id_history(history())
+
+    assert cache.invalidate("get_/v1/ohlcv/{symbol_id}/history") == 0
+    assert cache.invalidate(TRADES) == 1
+    assert len(cache) == 0
+    assert list(tmp_path.glob("*/*.gz")) == []
+
+
+@pytest.mark.anyio
+async def test_async_serves_closed_windows_from_disk(tmp_path: pathlib.Path) -> None:
+    """Test that the async client uses the disk cache as well."""
+    server = Server()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    coinapi = AsyncCoinAPI("testing", client=client, disk_cache=DiskCache(tmp_path))
+
+    await coinapi.trades.get_v1_trades_symbol_id_history(history())
+    await coinapi.trades.get_v1_trades_symbol_id_history(history())
+
+    assert server.requests == 1
@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 from coinapi.models import operations
 
 
@@ -68,3 +68,18 @@ def test_get_v1_pair_history(
     assert response.status_code == 200
     assert response.content is not None
     assert response.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_history_periods.yaml")
+async def test_get_v1_history_periods_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_history_periods with the async client."""
+    response = await async_coinapi.exchange_rates.get_v1_history_periods()
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
@@ -0,0 +1,236 @@
+"""Tests for the SDK hooks."""
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+from coinapi._hooks import (
+    AfterErrorContext,
+    AfterErrorHook,
+    AfterSuccessContext,
+    AfterSuccessHook,
+    AsyncAfterSuccessHook,
+    AsyncBeforeRequestHook,
+    BeforeRequestContext,
+    BeforeRequestHook,
+    SDKHooks,
+    SDKInitHook,
+)
+from coinapi.models import errors, operations
+
+SERVER_URL = "https://stand-in.example"
+
+
+def respond(request: httpx.Request) -> httpx.Response:
+    """Answer with the request tags, or an error for unknown symbols."""
+    if "UNKNOWN" in request.url.path:
+        return httpx.Response(400, json={"error": "unknown symbol"})
+    return httpx.Response(
+        200,
+        json=[],
+        headers={"X-Seen-Tags": request.headers.get("X-Tags", "")},
+    )
+
+
+class Tag(BeforeRequestHook):
+    """Append a tag to the `X-Tags` header."""
+
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+
+    def before_request(
+        self,
+        hook_ctx: BeforeRequestContext,  # noqa: ARG002
+        request: httpx.Request,
+    ) -> httpx.Request:
+        """Copy the request with the tag appended."""
+        headers = httpx.Headers(request.headers)
+        tags = headers.get("X-Tags")
+        headers["X-Tags"] = f"{tags},{self.tag}" if tags else self.tag
+        return httpx.Request(
+            request.method,
+            request.url,
+            headers=headers,
+            extensions=request.extensions,
+        )
+
+
+class AsyncTag(AsyncBeforeRequestHook):
+    """Append a tag to the `X-Tags` header asynchronously."""
+
+    def __init__(self, tag: str) -> None:
+        self.tag = Tag(tag)
+
+    async def before_request(
+        self,
+        hook_ctx: BeforeRequestContext,
+        request: httpx.Request,
+    ) -> httpx.Request:
+        """Copy the request with the tag appended."""
+        return self.tag.before_request(hook_ctx, request)
+
+
+class Mark(AfterSuccessHook):
+    """Append a mark to the `X-Marks` response header."""
+
+    def __init__(self, mark: str) -> None:
+        self.mark = mark
+
+    def after_success(
+        self,
+        hook_ctx: AfterSuccessContext,  # noqa: ARG002
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Copy the response with the mark appended."""
+        marks = response.headers.get("X-Marks")
+        headers = httpx.Headers(response.headers)
+        headers["X-Marks"] = f"{marks},{self.mark}" if marks else self.mark
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=response.content,
+            request=response.request,
+        )
+
+
+def seen_tags(res: operations.GetV1TradesLatestResponse) -> str:
+    """Get the tags the stand-in received."""
+    assert res.raw_response is not None
+    return res.raw_response.headers["X-Seen-Tags"]
+
+
+def sdk(hooks: SDKHooks | None = None) -> CoinAPI:
+    """Build an SDK sending its requests to a stand-in."""
+    client = httpx.Client(transport=httpx.MockTransport(respond))
+    return CoinAPI("testing", client=client, hooks=hooks)
+
+
+def test_hooks_are_per_instance() -> None:
+    """Test that hooks registered on one SDK do not run for another."""
+    tagged, plain = sdk(), sdk()
+    tagged.sdk_configuration.get_hooks().register_before_request_hook(Tag("a"))
+
+    assert seen_tags(tagged.trades.get_v1_trades_latest()) == "a"
+    assert seen_tags(plain.trades.get_v1_trades_latest()) == ""
+    assert SDKHooks().before_request_hooks == []
+
+
+def test_before_request_hooks_are_chained() -> None:
+    """Test that each before request hook receives the previous hook's request."""
+    hooks = SDKHooks()
+    hooks.register_before_request_hook(Tag("a"))
+    hooks.register_before_request_hook(Tag("b"))
+
+    res = sdk(hooks).trades.get_v1_trades_latest()
+
+    assert seen_tags(res) == "a,b"
+
+
+def test_after_success_hooks_are_chained() -> None:
+    """Test that each after success hook receives the previous hook's response."""
+    hooks = SDKHooks()
+    hooks.register_after_success_hook(Mark("a"))
+    hooks.register_after_success_hook(Mark("b"))
+
+    res = sdk(hooks).trades.get_v1_trades_latest()
+
+    assert res.raw_response is not None
+    assert res.raw_response.headers["x-marks"] == "a,b"
+
+
+def test_after_error_hook_replaces_error() -> None:
+    """Test that after error hooks can replace the raised error."""
+
+    class Replace(AfterErrorHook):
+        def after_error(
+            self,
+            hook_ctx: AfterErrorContext,
+            response: httpx.Response | None,
+            error: Exception | None,  # noqa: ARG002
+        ) -> tuple[httpx.Response | None, Exception | None]:
+            return response, LookupError(hook_ctx.operation_id)
+
+    hooks = SDKHooks()
+    hooks.register_after_error_hook(Replace())
+
+    with pytest.raises(LookupError, match="history") as e:
+        sdk(hooks).trades.get_v1_trades_symbol_id_history(
+            operations.GetV1TradesSymbolIDHistoryRequest(symbol_id="UNKNOWN"),
+        )
+    assert isinstance(e.value.__cause__, errors.CoinAPIError)
+
+
+def test_no_dispatch_without_hooks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that hook dispatch is skipped when no hooks are registered."""
+
+    def fail(*_: object) -> None:
+        pytest.fail("hook dispatch ran without hooks")
+
+    for name in ("before_request", "after_success", "after_error"):
+        monkeypatch.setattr(SDKHooks, name, fail)
+    coinapi = sdk()
+
+    coinapi.trades.get_v1_trades_latest()
+    with pytest.raises(errors.CoinAPIError):
+        coinapi.trades.get_v1_trades_symbol_id_history(
+            operations.GetV1TradesSymbolIDHistoryRequest(symbol_id="UNKNOWN"),
+        )
+
+
+def test_sdk_init_hook() -> None:
+    """Test that SDK init hooks of passed hooks run when the SDK is built."""
+
+    class Redirect(SDKInitHook):
+        def sdk_init(
+            self,
+            base_url: str,  # noqa: ARG002
+            client: httpx.Client | None,
+        ) -> tuple[str, httpx.Client | None]:
+            return SERVER_URL, client
+
+    hooks = SDKHooks()
+    hooks.register_sdk_init_hook(Redirect())
+
+    res = sdk(hooks).trades.get_v1_trades_latest()
+
+    assert res.raw_response is not None
+    assert str(res.raw_response.request.url).startswith(SERVER_URL)
+
+
+def test_sync_client_rejects_async_hooks() -> None:
+    """Test that async hooks fail clearly on the sync client."""
+    hooks = SDKHooks()
+    hooks.register_before_request_hook(AsyncTag("a"))
+
+    with pytest.raises(TypeError, match="async client"):
+        sdk(hooks).trades.get_v1_trades_latest()
+
+
+@pytest.mark.anyio
+async def test_async_client_runs_sync_and_async_hooks() -> None:
+    """Test that the async client chains sync and async hooks in order."""
+    seen: list[str] = []
+
+    class Record(AsyncAfterSuccessHook):
+        async def after_success(
+            self,
+            hook_ctx: AfterSuccessContext,
+            response: httpx.Response,
+        ) -> httpx.Response:
+            seen.append(hook_ctx.operation_id)
+            return response
+
+    hooks = SDKHooks()
+    hooks.register_before_request_hook(AsyncTag("a"))
+    hooks.register_before_request_hook(Tag("b"))
+    hooks.register_after_success_hook(Record())
+    hooks.register_after_success_hook(Mark("c"))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    coinapi = AsyncCoinAPI("testing", client=client, hooks=hooks)
+
+    res = await coinapi.trades.get_v1_trades_latest()
+
+    assert seen_tags(res) == "a,b"
+    assert res.raw_response is not None
+    assert res.raw_response.headers["x-marks"] == "c"
+    assert seen == ["get_/v1/trades/latest"]
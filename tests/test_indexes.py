@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 from coinapi.models import components, operations
 
 
@@ -86,3 +86,18 @@ def test_get_v1_indexes_index_id_timeseries(
     assert response.status_code == 200
     assert response.content is not None
     assert response.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_indexes.yaml")
+async def test_get_v1_indexes_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_indexes with the async client."""
+    response = await async_coinapi.indexes.get_v1_indexes()
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
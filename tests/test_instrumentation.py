@@ -0,0 +1,281 @@
+"""Tests for per-operation instrumentation."""
+
+import http.server
+import json
+import threading
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+from coinapi._hooks import AfterSuccessContext, AfterSuccessHook
+from coinapi.instrumentation import Histogram, Instrumentation, RequestTrace
+from coinapi.models import errors, operations
+
+LATEST = "get_/v1/trades/latest"
+HISTORY = "get_/v1/trades/{symbol_id}/history"
+
+TRADE = {
+    "symbol_id": "BITSTAMP_SPOT_BTC_USD",
+    "time_exchange": "2024-01-01T00:00:00.0000000Z",
+    "time_coinapi": "2024-01-01T00:00:00.1000000Z",
+    "uuid": "770C7A3B-7258-4441-8182-83740F3E2457",
+    "price": 42000.5,
+    "size": 0.25,
+    "taker_side": "BUY",
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Answer with three trades, or an error for unknown symbols."""
+    if "UNKNOWN" in request.url.path:
+        return httpx.Response(400, json={"error": "unknown symbol"})
+    return httpx.Response(
+        200,
+        json=[TRADE] * 3,
+        headers={"X-RateLimit-Request-Cost": "2"},
+    )
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Local server answering every request with three trades."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        body = json.dumps([TRADE] * 3).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: object) -> None:
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def local_server() -> Iterator[str]:
+    """Serve trades on a local port."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def sdk(instrumentation: Instrumentation) -> CoinAPI:
+    """Build an SDK sending its requests to the stand-in."""
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return CoinAPI("testing", client=client, instrumentation=instrumentation)
+
+
+def test_histogram() -> None:
+    """Test bucketing, summary statistics and quantile estimates."""
+    histogram = Histogram((1, 10, 100))
+    for value in (0.5, 5, 5, 50, 500):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot.counts == (1, 2, 1, 1)
+    assert (snapshot.count, snapshot.sum) == (5, 560.5)
+    assert (snapshot.min, snapshot.max, snapshot.mean) == (0.5, 500, 112.1)
+    assert 1 <= snapshot.quantile(0.5) <= 10  # type: ignore[operator]
+    assert snapshot.quantile(1.0) == 500
+
+
+def test_empty_histogram() -> None:
+    """Test that an empty histogram has no statistics."""
+    snapshot = Histogram((1,)).snapshot()
+
+    assert snapshot.mean is None
+    assert snapshot.quantile(0.5) is None
+
+
+def test_trace_events() -> None:
+    """Test that connection setup and first byte are timed from trace events."""
+    trace = RequestTrace()
+    trace("connection.connect_tcp.started", {})
+    trace("connection.connect_tcp.complete", {})
+    trace("http11.receive_response_headers.started", {})
+    ttfb_before_headers = trace.ttfb_seconds
+    trace("http11.receive_response_headers.complete", {})
+
+    assert ttfb_before_headers is None
+    assert trace.connect_seconds is not None
+    assert trace.ttfb_seconds is not None
+    assert 0 <= trace.connect_seconds <= trace.ttfb_seconds <= trace.elapsed
+
+
+def test_trace_forwards_to_existing_callback() -> None:
+    """Test that a trace callback set on the request keeps receiving events."""
+    events: list[str] = []
+    request = httpx.Request(
+        "GET",
+        "https://rest.coinapi.io/v1/exchanges",
+        extensions={"trace": lambda name, _: events.append(name)},
+    )
+    instrumentation = Instrumentation()
+
+    instrumentation.start(request)
+    instrumentation.start(request)
+    request.extensions["trace"]("http11.receive_response_headers.complete", {})
+
+    assert events == ["http11.receive_response_headers.complete"]
+    assert request.extensions["coinapi.trace"].ttfb_seconds is not None
+
+
+@pytest.mark.anyio
+async def test_async_trace_forwards_to_existing_callback() -> None:
+    """Test that an async trace callback set on the request is awaited."""
+    events: list[str] = []
+
+    async def trace(name: str, _: dict[str, object]) -> None:
+        events.append(name)
+
+    request = httpx.Request(
+        "GET",
+        "https://rest.coinapi.io/v1/exchanges",
+        extensions={"trace": trace},
+    )
+
+    Instrumentation().start(request, is_async=True)
+    await request.extensions["trace"]("connection.connect_tcp.complete", {})
+
+    assert events == ["connection.connect_tcp.complete"]
+    assert request.extensions["coinapi.trace"].connect_seconds is not None
+
+
+def test_records_responses_and_decoding() -> None:
+    """Test that sizes, item counts and costs are recorded per operation."""
+    instrumentation = Instrumentation()
+    coinapi = sdk(instrumentation)
+
+    coinapi.trades.get_v1_trades_latest()
+    coinapi.trades.get_v1_trades_latest()
+
+    stats = instrumentation.snapshot()[LATEST]
+    assert (stats.responses, stats.errors, stats.statuses) == (2, 0, {200: 2})
+    histograms = stats.histograms
+    assert histograms["total_seconds"].count == 2
+    assert histograms["response_bytes"].sum > 0
+    assert histograms["decode_seconds"].count == 2
+    assert histograms["items"].sum == 6
+    assert histograms["cost"].sum == 4
+    assert histograms["connect_seconds"].count == 0
+
+
+def test_records_errors() -> None:
+    """Test that error statuses and transport failures are counted."""
+    instrumentation = Instrumentation()
+    coinapi = sdk(instrumentation)
+
+    with pytest.raises(errors.CoinAPIError):
+        coinapi.trades.get_v1_trades_symbol_id_history(
+            operations.GetV1TradesSymbolIDHistoryRequest(symbol_id="UNKNOWN"),
+        )
+
+    def refuse(_: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    client = httpx.Client(transport=httpx.MockTransport(refuse))
+    with pytest.raises(httpx.ConnectError):
+        CoinAPI(
+            "testing",
+            client=client,
+            instrumentation=instrumentation,
+        ).trades.get_v1_trades_latest()
+
+    snapshot = instrumentation.snapshot()
+    assert snapshot[HISTORY].statuses == {400: 1}
+    assert snapshot[HISTORY].histograms["decode_seconds"].count == 0
+    assert snapshot[LATEST].errors == 1
+
+
+def test_records_streams_when_closed() -> None:
+    """Test that a streamed response is recorded once fully consumed."""
+    instrumentation = Instrumentation()
+    coinapi = sdk(instrumentation)
+    request = operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="BITSTAMP_SPOT_BTC_USD",
+    )
+
+    assert len(list(coinapi.trades.stream_v1_trades_symbol_id_history(request))) == 3
+
+    stats = instrumentation.snapshot()[HISTORY]
+    assert stats.responses == 1
+    assert stats.histograms["items"].sum == 3
+    assert stats.histograms["decode_seconds"].count == 0
+
+
+def test_snapshot_reset() -> None:
+    """Test that a snapshot can clear the measurements."""
+    instrumentation = Instrumentation()
+    sdk(instrumentation).trades.get_v1_trades_latest()
+
+    assert LATEST in instrumentation.snapshot(reset=True)
+    assert instrumentation.snapshot() == {}
+
+
+def test_traces_real_connections(local_server: str) -> None:
+    """Test that connection setup and first byte are timed over real sockets."""
+    instrumentation = Instrumentation()
+    coinapi = CoinAPI(
+        "testing",
+        server_url=local_server,
+        instrumentation=instrumentation,
+    )
+
+    with coinapi:
+        coinapi.trades.get_v1_trades_latest()
+        coinapi.trades.get_v1_trades_latest()
+
+    histograms = instrumentation.snapshot()[LATEST].histograms
+    assert histograms["connect_seconds"].count == 1
+    assert histograms["ttfb_seconds"].count == 2
+
+
+@pytest.mark.anyio
+async def test_async_traces_real_connections(local_server: str) -> None:
+    """Test that asynchronous requests are traced as well."""
+    instrumentation = Instrumentation()
+    coinapi = AsyncCoinAPI(
+        "testing",
+        server_url=local_server,
+        instrumentation=instrumentation,
+    )
+
+    async with coinapi:
+        await coinapi.trades.get_v1_trades_latest()
+
+    histograms = instrumentation.snapshot()[LATEST].histograms
+    assert histograms["connect_seconds"].count == 1
+    assert histograms["ttfb_seconds"].count == 1
+
+
+def test_calls_after_success_hook() -> None:
+    """Test that after success hooks see successful responses only."""
+    seen: list[tuple[str, int]] = []
+
+    class Recorder(AfterSuccessHook):
+        def after_success(
+            self,
+            hook_ctx: AfterSuccessContext,
+            response: httpx.Response,
+        ) -> httpx.Response:
+            seen.append((hook_ctx.operation_id, response.status_code))
+            return response
+
+    coinapi = sdk(Instrumentation())
+    coinapi.sdk_configuration.get_hooks().register_after_success_hook(Recorder())
+
+    coinapi.trades.get_v1_trades_latest()
+    with pytest.raises(errors.CoinAPIError):
+        coinapi.trades.get_v1_trades_symbol_id_history(
+            operations.GetV1TradesSymbolIDHistoryRequest(symbol_id="UNKNOWN"),
+        )
+
+    assert seen == [(LATEST, 200)]
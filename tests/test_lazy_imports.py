@@ -0,0 +1,76 @@
+"""Tests for lazy loading of the package, models and operation groups."""
+
+import importlib.metadata
+import subprocess
+import sys
+
+import pytest
+
+import coinapi
+from coinapi import CoinAPI, CoinAPIConfig
+from coinapi.models import operations
+
+
+def loaded_after(code: str) -> set[str]:
+    """Get the modules loaded by running `code` in a new interpreter."""
+    script = f"{code}\nimport sys\nprint(' '.join(sys.modules))"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_loads_nothing() -> None:
+    """Test that importing the package does not load the SDK or httpx."""
+    modules = loaded_after("import coinapi")
+
+    assert {m for m in modules if m.startswith("coinapi")} == {
+        "coinapi",
+        "coinapi._lazy",
+    }
+    assert "httpx" not in modules
+
+
+def test_client_defers_groups_and_models() -> None:
+    """Test that building a client loads no operation group, model or metadata."""
+    modules = loaded_after("from coinapi import CoinAPI; CoinAPI('key')")
+
+    assert "coinapi.trades" not in modules
+    assert not any(m.startswith("coinapi.models.operations.") for m in modules)
+    assert "importlib.metadata" not in modules
+
+
+def test_group_loads_its_module_only() -> None:
+    """Test that accessing a group loads its module but not the others."""
+    modules = loaded_after("from coinapi import CoinAPI; CoinAPI('key').trades")
+
+    assert "coinapi.trades" in modules
+    assert "coinapi.quotes" not in modules
+    assert "coinapi.models.operations.get_v1_quotes_latest" not in modules
+
+
+def test_group_is_created_once() -> None:
+    """Test that a group is created on first access and then reused."""
+    sdk = CoinAPI("key")
+
+    assert sdk.trades is sdk.trades
+    assert sdk.trades.sdk_configuration is sdk.sdk_configuration
+    assert "trades" in vars(sdk)
+    assert "quotes" not in vars(sdk)
+
+
+def test_lazy_exports() -> None:
+    """Test that lazily exported names resolve, list and fail like attributes."""
+    assert operations.GetV1TradesLatestRequest.__name__ == "GetV1TradesLatestRequest"
+    assert "GetV1QuotesLatestRequest" in dir(operations)
+    assert "CoinAPI" in dir(coinapi)
+    with pytest.raises(AttributeError, match="Missing"):
+        _ = operations.Missing  # type: ignore[attr-defined]
+
+
+def test_version() -> None:
+    """Test that the deferred version matches the installed package."""
+    assert CoinAPIConfig.version == importlib.metadata.version("coinapi-rest")
@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 
 
 @pytest.mark.vcr
@@ -96,3 +96,18 @@ def test_get_v1_symbols_exchange_id(
 
     assert res.content is not None
     assert res.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_assets.yaml")
+async def test_get_v1_assets_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_assets with the async client."""
+    response = await async_coinapi.metadata.get_v1_assets(filter_asset_id="BTC,XMR")
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 from coinapi.models import operations
 
 
@@ -87,3 +87,18 @@ def test_get_v1_metrics_asset_listing(
     assert response.status_code == 200
     assert response.content is not None
     assert response.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_metrics.yaml")
+async def test_get_v1_metrics_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_metrics with the async client."""
+    response = await async_coinapi.metrics.get_v1_metrics_listing()
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
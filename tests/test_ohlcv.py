@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 from coinapi.models import operations
 
 
@@ -68,3 +68,37 @@ def test_get_v1_ohlcv_symbol_id_latest(
     assert response.status_code == 200
     assert response.content is not None
     assert response.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_ohlcv_periods.yaml")
+async def test_get_v1_ohlcv_periods_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_ohlcv_periods with the async client."""
+    response = await async_coinapi.ohlcv.get_v1_ohlcv_periods()
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
+
+
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_ohlcv_symbol_id_history.yaml")
+def test_stream_v1_ohlcv_symbol_id_history(
+    coinapi: CoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test for stream_v1_ohlcv_symbol_id_history."""
+    request = operations.GetV1OhlcvSymbolIDHistoryRequest(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+        period_id="1DAY",
+        time_start="2021-01-01T00:00:00",
+        time_end="2021-01-05T00:00:00",
+    )
+    items = list(coinapi.ohlcv.stream_v1_ohlcv_symbol_id_history(request))
+
+    assert items
+    assert items == snapshot
@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 from coinapi.models import operations
 
 
@@ -76,3 +76,40 @@ def test_get_v1_orderbooks_symbol_id_latest(
     assert response.status_code == 200
     assert response.content is not None
     assert response.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_orderbooks_symbol_id_current.yaml")
+async def test_get_v1_orderbooks_symbol_id_current_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_orderbooks_symbol_id_current with the async client."""
+    response = await async_coinapi.order_book.get_v1_orderbooks_symbol_id_current(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+        limit_levels=10,
+    )
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
+
+
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_orderbooks_symbol_id_history.yaml")
+def test_stream_v1_orderbooks_symbol_id_history(
+    coinapi: CoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test for stream_v1_orderbooks_symbol_id_history."""
+    request = operations.GetV1OrderbooksSymbolIDHistoryRequest(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+        time_start="2021-01-01T00:00:00",
+        time_end="2021-01-02T00:00:00",
+        limit=10,
+    )
+    books = list(coinapi.order_book.stream_v1_orderbooks_symbol_id_history(request))
+
+    assert books
+    assert books == snapshot
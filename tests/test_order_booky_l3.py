@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 
 
 @pytest.mark.vcr
@@ -36,3 +36,21 @@ def test_get_v1_orderbooks3_symbol_id_current(
     assert response.status_code == 200
     assert response.content is not None
     assert response.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_orderbooks3_symbol_id_current.yaml")
+async def test_get_v1_orderbooks3_symbol_id_current_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_orderbooks3_symbol_id_current with the async client."""
+    response = await async_coinapi.order_book_l3.get_v1_orderbooks3_symbol_id_current(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+        limit_levels=10,
+    )
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
@@ -0,0 +1,414 @@
+"""Tests for paging through history operations."""
+
+import asyncio
+import datetime as dt
+import threading
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI, paging
+from coinapi.paging import PageReport, format_time
+
+EPOCH = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+
+TICKS = 10_000_000
+"""Ticks of 100 ns per second, the precision of API times."""
+
+
+def to_ticks(value: str) -> int:
+    """Parse an API time into ticks since the epoch."""
+    value = value.removesuffix("Z")
+    whole, _, fraction = value.partition(".")
+    seconds = (
+        dt.datetime.fromisoformat(whole).replace(tzinfo=dt.timezone.utc) - EPOCH
+    ).total_seconds()
+    return int(seconds) * TICKS + int(fraction.ljust(7, "0")[:7])
+
+
+def to_time(ticks: int) -> str:
+    """Format ticks since the epoch as an API time."""
+    seconds, fraction = divmod(ticks, TICKS)
+    whole = (EPOCH + dt.timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%S")
+    return f"{whole}.{fraction:07d}Z"
+
+
+def trade(i: int, tick: int) -> dict[str, object]:
+    """Build the `i`-th trade of a history."""
+    return {
+        "symbol_id": "BITSTAMP_SPOT_BTC_USD",
+        "time_exchange": to_time(tick),
+        "time_coinapi": to_time(tick),
+        "uuid": f"trade-{i}",
+        "price": 42000.0 + i,
+        "size": 1.0,
+    }
+
+
+def quote(i: int, tick: int) -> dict[str, object]:
+    """Build the `i`-th quote update of a history, identified by its bid size."""
+    return {
+        "symbol_id": "BITSTAMP_SPOT_BTC_USD",
+        "time_exchange": to_time(tick),
+        "time_coinapi": to_time(tick),
+        "ask_price": 42001.0,
+        "ask_size": 1.0,
+        "bid_price": 42000.0,
+        "bid_size": float(i),
+    }
+
+
+def book(i: int, tick: int) -> dict[str, object]:
+    """Build the `i`-th order book snapshot of a history, told apart by `time_coinapi`."""
+    return {
+        "symbol_id": "BITSTAMP_SPOT_BTC_USD",
+        "time_exchange": to_time(tick),
+        "time_coinapi": to_time(tick + i * TICKS // 1000),
+        "asks": [{"price": 42001.0, "size": 1.0}],
+        "bids": [{"price": 42000.0, "size": float(i)}],
+    }
+
+
+class History:
+    """Stand-in serving a trade or quote history with the API's paging semantics."""
+
+    def __init__(
+        self,
+        ticks: list[int],
+        item: Callable[[int, int], dict[str, object]] = trade,
+    ) -> None:
+        self.items = [item(i, tick) for i, tick in enumerate(ticks)]
+        self.ticks = ticks
+        self.requests: list[httpx.QueryParams] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a history request from `time_start`, up to `time_end` and `limit`."""
+        params = request.url.params
+        with self._lock:
+            self.requests.append(params)
+        start = to_ticks(params["time_start"])
+        end = to_ticks(params["time_end"]) if "time_end" in params else None
+        page = [
+            trade
+            for trade, tick in zip(self.items, self.ticks, strict=True)
+            if tick >= start and (end is None or tick < end)
+        ]
+        page = page[: int(params["limit"])]
+        return httpx.Response(
+            200,
+            json=page,
+            headers={"x-ratelimit-request-cost": str(len(page))},
+        )
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Answer a history request asynchronously."""
+        return self(request)
+
+
+def sdk(history: History) -> CoinAPI:
+    """Build an SDK sending its requests to a stand-in."""
+    client = httpx.Client(transport=httpx.MockTransport(history))
+    return CoinAPI("testing", client=client)
+
+
+def uuids(trades: object) -> list[str]:
+    """Get the uuids of trades."""
+    return [t.uuid for t in trades]  # type: ignore[attr-defined]
+
+
+# Bursts of trades sharing a time, and trades 100 ns apart within one
+# microsecond, straddling page boundaries.
+TICKS_WITH_BURSTS = [
+    *(0 for _ in range(3)),
+    15,
+    *(TICKS for _ in range(3)),
+    TICKS + 13,
+    TICKS + 26,
+    TICKS + 28,
+    *range(2 * TICKS, 2 * TICKS + 50, 5),
+]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_pages_through_history_once(prefetch: bool) -> None:
+    """Test that every trade is yielded exactly once, in order."""
+    history = History(TICKS_WITH_BURSTS)
+
+    trades = sdk(history).trades.iter_trades_history(
+        "BITSTAMP_SPOT_BTC_USD",
+        "2024-01-01T00:00:00",
+        limit=5,
+        prefetch=prefetch,
+    )
+
+    assert uuids(trades) == [t["uuid"] for t in history.items]
+    assert len(history.requests) > len(history.items) // 5
+
+
+def test_stops_at_time_end() -> None:
+    """Test that no trade at or after `time_end` is yielded or requested."""
+    history = History(list(range(0, 100 * TICKS, TICKS)))
+    time_end = EPOCH + dt.timedelta(seconds=30)
+
+    trades = list(
+        sdk(history).trades.iter_trades_history(
+            "BITSTAMP_SPOT_BTC_USD",
+            EPOCH,
+            time_end,
+            limit=7,
+        ),
+    )
+
+    assert len(trades) == 30
+    assert trades[-1].time_exchange < time_end
+    assert {params["time_end"] for params in history.requests} == {
+        "2024-01-01T00:00:30",
+    }
+
+
+def test_prefetches_next_page() -> None:
+    """Test that the next page is requested before the current one is consumed."""
+    history = History(list(range(20)))
+    trades = sdk(history).trades.iter_trades_history(
+        "BITSTAMP_SPOT_BTC_USD",
+        EPOCH,
+        limit=10,
+    )
+
+    next(trades)
+    deadline = time.monotonic() + 5
+    while len(history.requests) < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    trades.close()
+
+    assert len(history.requests) == 2
+
+
+def test_too_many_trades_at_one_time() -> None:
+    """Test that a burst larger than a page is reported instead of looping."""
+    history = History([0] * 6)
+    trades = sdk(history).trades.iter_trades_history(
+        "BITSTAMP_SPOT_BTC_USD",
+        EPOCH,
+        limit=5,
+        prefetch=False,
+    )
+
+    with pytest.raises(ValueError, match="larger limit"):
+        list(trades)
+
+
+def test_format_time() -> None:
+    """Test that times are formatted as UTC without an offset."""
+    cet = dt.timezone(dt.timedelta(hours=1))
+
+    assert format_time(dt.datetime(2024, 1, 1, 1, tzinfo=cet)) == "2024-01-01T00:00:00"
+    assert (
+        format_time(dt.datetime(2024, 1, 1, 0, 0, 0, 5)) == "2024-01-01T00:00:00.000005"
+    )
+    assert format_time("2024-01-01") == "2024-01-01"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_async_pages_through_history_once(prefetch: bool) -> None:
+    """Test that the async iterator yields every trade exactly once."""
+    history = History(TICKS_WITH_BURSTS)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(history.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client)
+
+    trades = [
+        trade
+        async for trade in coinapi.trades.iter_trades_history(
+            "BITSTAMP_SPOT_BTC_USD",
+            EPOCH,
+            limit=5,
+            prefetch=prefetch,
+        )
+    ]
+
+    assert uuids(trades) == [t["uuid"] for t in history.items]
+
+
+@pytest.mark.anyio
+async def test_async_close_waits_for_prefetch() -> None:
+    """Test that closing the iterator early lets the cancelled prefetch finish."""
+    calls: list[str] = []
+    cancelled: list[str] = []
+    prefetching = asyncio.Event()
+
+    async def fetch(start: str) -> list[dt.datetime]:
+        calls.append(start)
+        if len(calls) > 1:
+            prefetching.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(start)
+                raise
+        return [EPOCH + dt.timedelta(seconds=i) for i in range(5)]
+
+    cursor = paging.TimeCursor(EPOCH, limit=5, time_of=lambda t: t, key_of=lambda t: t)
+    pages = paging.aiter_pages(fetch, cursor)
+    await anext(pages)
+    await prefetching.wait()
+    await pages.aclose()
+
+    assert cancelled == calls[1:]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_pages_through_quotes_once(prefetch: bool) -> None:
+    """Test that every quote update is yielded exactly once, page by page."""
+    history = History(TICKS_WITH_BURSTS, quote)
+
+    pages = list(
+        sdk(history).quotes.iter_quotes_history_pages(
+            "BITSTAMP_SPOT_BTC_USD",
+            EPOCH,
+            limit=5,
+            prefetch=prefetch,
+        ),
+    )
+
+    assert [q.bid_size for page in pages for q in page] == [
+        q["bid_size"] for q in history.items
+    ]
+    assert len(pages) == len(history.requests)
+    assert all(0 < len(page) <= 5 for page in pages[:-1])
+
+
+def test_keeps_identical_quotes_at_a_seam() -> None:
+    """Test that separate but identical quote updates straddling a seam are kept."""
+    history = History(
+        [0, 0, 0, TICKS, TICKS, TICKS, 2 * TICKS],
+        lambda _, tick: quote(0, tick),
+    )
+
+    quotes = list(
+        sdk(history).quotes.iter_quotes_history(
+            "BITSTAMP_SPOT_BTC_USD",
+            EPOCH,
+            limit=5,
+            prefetch=False,
+        ),
+    )
+
+    assert [to_ticks(params["time_start"]) for params in history.requests] == [
+        0,
+        TICKS - 10,
+    ]
+    assert len(quotes) == len(history.items)
+
+
+def test_quotes_stop_at_time_end() -> None:
+    """Test that the quote iterator forwards `time_end` and `limit`."""
+    history = History(list(range(0, 100 * TICKS, TICKS)), quote)
+
+    quotes = list(
+        sdk(history).quotes.iter_quotes_history(
+            "BITSTAMP_SPOT_BTC_USD",
+            EPOCH,
+            EPOCH + dt.timedelta(seconds=30),
+            limit=7,
+        ),
+    )
+
+    assert [q.bid_size for q in quotes] == [float(i) for i in range(30)]
+    assert {params["limit"] for params in history.requests} == {"7"}
+
+
+@pytest.mark.anyio
+async def test_async_pages_through_quotes_once() -> None:
+    """Test that the async quote iterator yields every update exactly once."""
+    history = History(TICKS_WITH_BURSTS, quote)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(history.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client)
+
+    quotes = [
+        q
+        async for q in coinapi.quotes.iter_quotes_history(
+            "BITSTAMP_SPOT_BTC_USD",
+            EPOCH,
+            limit=5,
+        )
+    ]
+
+    assert [q.bid_size for q in quotes] == [q["bid_size"] for q in history.items]
+
+
+def bid_sizes(books: object) -> list[float]:
+    """Get the size of the first bid of order book snapshots."""
+    return [b.bids[0]["size"] for b in books]  # type: ignore[attr-defined]
+
+
+def test_walks_order_book_history_once() -> None:
+    """Test that every snapshot is streamed once and each page cost reported."""
+    history = History(TICKS_WITH_BURSTS, book)
+    reports: list[PageReport] = []
+
+    books = sdk(history).order_book.iter_orderbooks_history(
+        "BITSTAMP_SPOT_BTC_USD",
+        EPOCH,
+        limit=5,
+        limit_levels=1,
+        on_page=reports.append,
+    )
+
+    first = next(books)
+    assert first.time_exchange == EPOCH
+    assert reports == []
+    assert bid_sizes([first, *books]) == [
+        b["bids"][0]["size"]  # type: ignore[index]
+        for b in history.items
+    ]
+    assert {params["limit_levels"] for params in history.requests} == {"1"}
+    assert [r.time_start for r in reports] == [
+        params["time_start"] for params in history.requests
+    ]
+    assert sum(r.items for r in reports) == len(history.items)
+    assert reports[-1].total_credits == sum(r.credits for r in reports)
+    assert reports[-1].total_credits > len(history.items)
+
+
+def test_order_book_burst_too_large() -> None:
+    """Test that the walker reports snapshots it cannot page past."""
+    history = History([0] * 6, book)
+    books = sdk(history).order_book.iter_orderbooks_history(
+        "BITSTAMP_SPOT_BTC_USD",
+        EPOCH,
+        limit=5,
+    )
+
+    with pytest.raises(ValueError, match="larger limit"):
+        list(books)
+
+
+@pytest.mark.anyio
+async def test_async_walks_order_book_history_once() -> None:
+    """Test that the async walker streams every snapshot once."""
+    history = History(TICKS_WITH_BURSTS, book)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(history.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client)
+    reports: list[PageReport] = []
+
+    books = [
+        b
+        async for b in coinapi.order_book.iter_orderbooks_history(
+            "BITSTAMP_SPOT_BTC_USD",
+            EPOCH,
+            time_end=EPOCH + dt.timedelta(seconds=2),
+            limit=5,
+            on_page=reports.append,
+        )
+    ]
+
+    assert len(books) == len(TICKS_WITH_BURSTS) - 10
+    assert len(reports) == len(history.requests)
+    assert [r.credits for r in reports] == [5] * (len(reports) - 1) + [
+        reports[-1].credits,
+    ]
+    assert reports[-1].total_credits == sum(r.credits for r in reports)
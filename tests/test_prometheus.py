@@ -0,0 +1,156 @@
+"""Tests for the Prometheus metrics exporter."""
+
+import urllib.error
+import urllib.request
+
+import httpx
+import pytest
+
+from coinapi import CoinAPI
+from coinapi.concurrency import ConcurrencyGovernor
+from coinapi.instrumentation import Instrumentation
+from coinapi.models import errors
+from coinapi.prometheus import CONTENT_TYPE, PrometheusExporter
+from coinapi.ratelimit import RateLimiter
+from coinapi.utils.retries import RetryPolicy
+
+EXCHANGES = "get_/v1/exchanges"
+
+
+def respond(request: httpx.Request) -> httpx.Response:
+    """Answer with an empty list, or an error for unknown exchanges."""
+    headers = {
+        "X-RateLimit-Limit": "1000",
+        "X-RateLimit-Remaining": "990",
+        "X-RateLimit-Reset": "2024-01-01T00:00:00Z",
+    }
+    if request.url.path.endswith("UNKNOWN"):
+        return httpx.Response(550, json={"error": "no data"}, headers=headers)
+    return httpx.Response(200, json=[], headers=headers)
+
+
+def sdk(instrumentation: Instrumentation) -> CoinAPI:
+    """Build an SDK sending its requests to a stand-in."""
+    client = httpx.Client(transport=httpx.MockTransport(respond))
+    return CoinAPI("testing", client=client, instrumentation=instrumentation)
+
+
+def samples(text: str) -> dict[str, str]:
+    """Get the sample values of an exposition by metric name and labels."""
+    return dict(
+        line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#")
+    )
+
+
+def test_renders_instrumentation() -> None:
+    """Test that counters, histograms and limit headers are rendered."""
+    instrumentation = Instrumentation()
+    coinapi = sdk(instrumentation)
+    coinapi.metadata.get_v1_exchanges()
+    coinapi.metadata.get_v1_exchanges()
+    with pytest.raises(errors.CoinAPIError):
+        coinapi.metadata.get_v1_exchanges_exchange_id("UNKNOWN")
+
+    text = PrometheusExporter(instrumentation).render()
+    values = samples(text)
+
+    assert (
+        values[f'coinapi_responses_total{{operation="{EXCHANGES}",status="200"}}']
+        == "2"
+    )
+    assert (
+        values[
+            'coinapi_responses_total{operation="get_/v1/exchanges/{exchange_id}",status="550"}'
+        ]
+        == "1"
+    )
+    assert values[f'coinapi_transport_errors_total{{operation="{EXCHANGES}"}}'] == "0"
+    assert (
+        values[
+            f'coinapi_request_duration_seconds_bucket{{operation="{EXCHANGES}",le="+Inf"}}'
+        ]
+        == "2"
+    )
+    assert values[f'coinapi_response_bytes_count{{operation="{EXCHANGES}"}}'] == "2"
+    assert values["coinapi_ratelimit_remaining"] == "990"
+    assert values["coinapi_ratelimit_limit"] == "1000"
+    assert "coinapi_ratelimit_reset" not in values
+    assert "# TYPE coinapi_request_duration_seconds histogram" in text
+    assert "# TYPE coinapi_ratelimit_remaining gauge" in text
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    """Test that bucket counts never decrease and end at the total count."""
+    instrumentation = Instrumentation()
+    coinapi = sdk(instrumentation)
+    for _ in range(3):
+        coinapi.metadata.get_v1_exchanges()
+
+    values = samples(PrometheusExporter(instrumentation).render())
+    buckets = [
+        int(value)
+        for name, value in values.items()
+        if name.startswith("coinapi_response_items_bucket")
+    ]
+
+    assert buckets == sorted(buckets)
+    assert buckets[-1] == 3
+
+
+def test_escapes_label_values() -> None:
+    """Test that quotes, backslashes and newlines in labels are escaped."""
+    instrumentation = Instrumentation()
+    instrumentation.observe_error('a"b\\c\nd')
+
+    text = PrometheusExporter(instrumentation).render()
+
+    assert 'coinapi_transport_errors_total{operation="a\\"b\\\\c\\nd"} 1' in text
+
+
+def test_renders_components() -> None:
+    """Test that the limiter, governor and retry policy state is rendered."""
+    limiter = RateLimiter()
+    governor = ConcurrencyGovernor(4)
+    policy = RetryPolicy()
+    policy.metrics.increment(EXCHANGES, "attempts")
+
+    values = samples(
+        PrometheusExporter(
+            rate_limiter=limiter,
+            concurrency_governor=governor,
+            retry_policy=policy,
+        ).render(),
+    )
+
+    assert values["coinapi_limiter_spent_credits"] == "0"
+    assert "coinapi_limiter_remaining_credits" not in values
+    assert values["coinapi_concurrency_limit"] == "4"
+    assert values["coinapi_concurrency_in_flight"] == "0"
+    assert values[f'coinapi_retry_attempts_total{{operation="{EXCHANGES}"}}'] == "1"
+    assert values[f'coinapi_retry_retries_total{{operation="{EXCHANGES}"}}'] == "0"
+    assert float(values["coinapi_retry_budget_tokens"]) > 0
+
+
+def test_renders_nothing_without_sources() -> None:
+    """Test that an exporter without sources renders an empty exposition."""
+    assert PrometheusExporter().render() == ""
+
+
+def test_serves_metrics() -> None:
+    """Test that the metrics endpoint serves the rendered text."""
+    instrumentation = Instrumentation()
+    sdk(instrumentation).metadata.get_v1_exchanges()
+    exporter = PrometheusExporter(instrumentation)
+    server = exporter.serve(port=0)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with urllib.request.urlopen(f"{url}/metrics") as response:  # noqa: S310
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            assert response.read().decode() == exporter.render()
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(f"{url}/other")  # noqa: S310
+        assert e.value.code == 404
+        e.value.close()
+    finally:
+        server.shutdown()
+        server.server_close()
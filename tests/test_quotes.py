@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 
 
 @pytest.mark.vcr
@@ -84,3 +84,40 @@ def test_get_v1_quotes_symbol_id_latest(
     assert response.status_code == 200
     assert response.content is not None
     assert response.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_quotes_symbol_id_current.yaml")
+async def test_get_v1_quotes_symbol_id_current_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_quotes_symbol_id_current with the async client."""
+    response = await async_coinapi.quotes.get_v1_quotes_symbol_id_current(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+    )
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
+
+
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_quotes_symbol_id_history.yaml")
+def test_stream_v1_quotes_symbol_id_history(
+    coinapi: CoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test stream_v1_quotes_symbol_id_history."""
+    quotes = list(
+        coinapi.quotes.stream_v1_quotes_symbol_id_history(
+            symbol_id="KRAKEN_SPOT_BTC_USD",
+            time_start="2022-01-01T00:00:00",
+            time_end="2022-01-02T00:00:00",
+            limit=10,
+        ),
+    )
+
+    assert quotes
+    assert quotes == snapshot
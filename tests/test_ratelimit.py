@@ -0,0 +1,191 @@
+"""Tests for the request budget limiter."""
+
+import httpx
+import pytest
+
+from coinapi import CoinAPI
+from coinapi.ratelimit import RateLimiter, estimate_cost
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def response(status_code: int = 200, **headers: str) -> httpx.Response:
+    """Build a response with rate limit headers given as keyword arguments."""
+    return httpx.Response(
+        status_code,
+        headers={name.replace("_", "-"): value for name, value in headers.items()},
+    )
+
+
+@pytest.fixture(name="clock")
+def clock_fixture() -> FakeClock:
+    """Return a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture(name="limiter")
+def limiter_fixture(clock: FakeClock) -> RateLimiter:
+    """Return a limiter with a 100 second window."""
+    return RateLimiter(window=100, probe_interval=10, clock=clock)
+
+
+def test_estimate_cost() -> None:
+    """Test that the cost follows the limit query parameter."""
+    url = "https://rest.coinapi.io/v1/trades/latest"
+
+    assert estimate_cost(httpx.Request("GET", url)) == 1
+    assert estimate_cost(httpx.Request("GET", url, params={"limit": 50})) == 1
+    assert estimate_cost(httpx.Request("GET", url, params={"limit": 1000})) == 10
+    assert estimate_cost(httpx.Request("GET", url, params={"limit": 1001})) == 11
+
+
+def test_unknown_budget_does_not_wait(limiter: RateLimiter) -> None:
+    """Test that requests pass until a response reports the budget."""
+    assert limiter._reserve(5) == 0
+    assert limiter.remaining is None
+    assert limiter.spent == 5
+
+
+def test_waits_for_credits_to_leave_window(
+    limiter: RateLimiter,
+    clock: FakeClock,
+) -> None:
+    """Test that an exhausted budget waits for the oldest spend to expire."""
+    limiter._reserve(1)
+    limiter.update(response(x_ratelimit_remaining="1", x_ratelimit_request_cost="1"), 1)
+    clock.now += 30
+    assert limiter._reserve(1) == 0
+
+    assert limiter._reserve(1) == 70
+
+    clock.now += 70
+    assert limiter.remaining == 1
+    assert limiter._reserve(1) == 0
+
+
+def test_reported_cost_replaces_estimate(limiter: RateLimiter) -> None:
+    """Test that the reported request cost is logged instead of the estimate."""
+    limiter._reserve(1)
+    limiter.update(response(x_ratelimit_request_cost="10"), 1)
+
+    assert limiter.spent == 10
+
+
+def test_tightest_quota_applies(limiter: RateLimiter) -> None:
+    """Test that the subscription quota limits the budget unless overage is enabled."""
+    limiter._reserve(1)
+    limiter.update(
+        response(x_ratelimit_remaining="100", x_ratelimit_quota_remaining="3"),
+        1,
+    )
+    assert limiter.remaining == 3
+
+    limiter._reserve(1)
+    limiter.update(
+        response(
+            x_ratelimit_remaining="100",
+            x_ratelimit_quota_remaining="3",
+            x_ratelimit_quota_overage="ENABLED",
+        ),
+        1,
+    )
+    assert limiter.remaining == 100
+
+
+def test_in_flight_requests_are_deducted(limiter: RateLimiter) -> None:
+    """Test that reservations not yet answered are deducted from the report."""
+    limiter._reserve(1)
+    limiter._reserve(1)
+
+    limiter.update(response(x_ratelimit_remaining="10"), 1)
+
+    assert limiter.remaining == 9
+
+
+def test_too_many_requests_exhausts_budget(limiter: RateLimiter) -> None:
+    """Test that a 429 without Retry-After stops spending."""
+    limiter._reserve(1)
+    limiter.update(response(429), 1)
+
+    assert limiter.remaining == 0
+    assert limiter._reserve(1) == 100
+
+
+def test_too_many_requests_honours_retry_after(
+    limiter: RateLimiter,
+    clock: FakeClock,
+) -> None:
+    """Test that a 429 blocks spending for the Retry-After delay."""
+    limiter._reserve(1)
+    limiter.update(response(429, retry_after="5"), 1)
+
+    assert limiter._reserve(1) == 5
+
+    clock.now += 5
+    assert limiter._reserve(1) == 0
+
+
+def test_unexplained_deficit_probes_periodically(
+    limiter: RateLimiter,
+    clock: FakeClock,
+) -> None:
+    """Test that a budget spent elsewhere lets one probe through per interval."""
+    limiter._reserve(1)
+    limiter.update(response(x_ratelimit_remaining="-50"), 1)
+
+    assert limiter._reserve(1) == 10
+    clock.now += 10
+    assert limiter._reserve(1) == 0
+    assert limiter._reserve(1) == 10
+
+
+def test_release_returns_credits(limiter: RateLimiter) -> None:
+    """Test that a request that was never answered does not spend credits."""
+    limiter._reserve(1)
+    limiter.update(response(x_ratelimit_remaining="5"), 1)
+    limiter._reserve(2)
+
+    limiter.release(2)
+
+    assert limiter.remaining == 5
+    assert limiter.spent == 1
+
+
+def test_sdk_updates_limiter() -> None:
+    """Test that the SDK reserves credits and reads the budget from responses."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json=[],
+            headers={
+                "X-RateLimit-Remaining": "41",
+                "X-RateLimit-Request-Cost": request.url.params["limit"],
+            },
+        )
+
+    limiter = RateLimiter()
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    coinapi = CoinAPI("testing", client=client, rate_limiter=limiter)
+
+    coinapi.trades.get_v1_trades_latest(limit=3)
+
+    assert limiter.remaining == 41
+    assert limiter.spent == 3
+
+
+@pytest.mark.anyio
+async def test_acquire_async(limiter: RateLimiter) -> None:
+    """Test that credits can be acquired from a coroutine."""
+    await limiter.acquire_async(2)
+
+    assert limiter.spent == 2
@@ -0,0 +1,109 @@
+"""Tests for precompiled request plans."""
+
+from typing import Annotated
+
+import msgspec
+import pytest
+
+from coinapi.models import operations
+from coinapi.utils import request_plan, utils
+
+SERVER_URL = "https://rest.coinapi.io/"
+
+REQUESTS = [
+    operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+        time_start="2022-01-01T00:00:00",
+        time_end="2022-01-02T00:00:00",
+        limit=10,
+        include_id=True,
+    ),
+    operations.GetV1OhlcvSymbolIDHistoryRequest(
+        symbol_id="BITSTAMP_SPOT_BTC_USD",
+        period_id="1MIN",
+        time_start="2022-01-01T00:00:00",
+    ),
+    operations.GetV1PairHistoryRequest(
+        asset_id_base="BTC",
+        asset_id_quote="USD",
+        period_id="1DAY",
+    ),
+    operations.GetV1SymbolsRequest(filter_symbol_id="BTC", filter_exchange_id="X,Y"),
+    operations.GetV1ExchangesRequest(),
+    operations.GetV1OhlcvPeriodsRequest(),
+]
+
+
+@pytest.mark.parametrize("request_", REQUESTS, ids=lambda r: type(r).__name__)
+def test_plan_matches_reflective_building(request_: operations.CoinAPIRequest) -> None:
+    """Test that plans produce the same URL and query as the reflective helpers."""
+    plan = request_plan.get_request_plan(type(request_))
+
+    assert plan.build_url(SERVER_URL, request_) == utils.generate_url(
+        type(request_),
+        SERVER_URL,
+        request_.endpoint,
+        request_,
+    )
+    assert plan.build_query_params(request_) == utils.get_query_params(
+        type(request_),
+        request_,
+    )
+
+
+def test_plan_is_cached_on_class() -> None:
+    """Test that the plan is compiled once and stored on the request class."""
+    plan = request_plan.get_request_plan(operations.GetV1TradesSymbolIDHistoryRequest)
+
+    assert (
+        request_plan.get_request_plan(operations.GetV1TradesSymbolIDHistoryRequest)
+        is plan
+    )
+    assert (
+        operations.GetV1TradesSymbolIDHistoryRequest.__dict__["_request_plan"] is plan
+    )
+
+
+def test_plan_is_not_inherited() -> None:
+    """Test that a subclass gets its own plan."""
+
+    class Parent(operations.CoinAPIRequest, frozen=True):
+        method = "GET"
+        endpoint = "/parent"
+
+    class Child(Parent, frozen=True):
+        endpoint = "/child/{child_id}"
+        child_id: Annotated[
+            str,
+            msgspec.Meta(extra={"path_param": {"field_name": "child_id"}}),
+        ] = "x"
+
+    request_plan.get_request_plan(Parent)
+
+    assert request_plan.get_request_plan(Child).build_url("", Child()) == "/child/x"
+
+
+def test_plan_keeps_missing_placeholder() -> None:
+    """Test that unset path params leave the placeholder as the reflective path does."""
+
+    class Request(operations.CoinAPIRequest, frozen=True):
+        method = "GET"
+        endpoint = "/items/{item_id}"
+        item_id: Annotated[
+            str | None,
+            msgspec.Meta(extra={"path_param": {"field_name": "item_id"}}),
+        ] = None
+
+    assert (
+        request_plan.get_request_plan(Request).build_url("", Request())
+        == "/items/{item_id}"
+    )
+
+
+def test_plan_is_cached_per_request_class() -> None:
+    """Test that every request class gets its own plan, compiled once."""
+    plans = [request_plan.get_request_plan(type(request_)) for request_ in REQUESTS]
+
+    assert len({id(plan) for plan in plans}) == len(REQUESTS)
+    for request_, plan in zip(REQUESTS, plans, strict=True):
+        assert request_plan.get_request_plan(type(request_)) is plan
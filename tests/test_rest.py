@@ -0,0 +1,44 @@
+"""Tests for the SDK entrypoints."""
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+
+
+def test_context_manager_closes_owned_client() -> None:
+    """Test that leaving the context closes the SDK-owned client."""
+    with CoinAPI("testing") as coinapi:
+        client = coinapi.sdk_configuration.get_client()
+
+    assert client.is_closed
+
+
+def test_context_manager_keeps_user_client_open() -> None:
+    """Test that a caller-provided client outlives the SDK."""
+    user_client = httpx.Client()
+
+    with CoinAPI("testing", client=user_client) as coinapi:
+        assert coinapi.sdk_configuration.get_client() is user_client
+
+    assert not user_client.is_closed
+    user_client.close()
+
+
+def test_pool_settings() -> None:
+    """Test that pool settings are passed to the configuration."""
+    limits = httpx.Limits(max_connections=5, keepalive_expiry=10)
+
+    coinapi = CoinAPI("testing", limits=limits, timeout=5)
+
+    assert coinapi.sdk_configuration.limits is limits
+    assert coinapi.sdk_configuration.timeout == 5
+
+
+@pytest.mark.anyio
+async def test_async_context_manager_closes_owned_client() -> None:
+    """Test that leaving the async context closes the SDK-owned client."""
+    async with AsyncCoinAPI("testing") as coinapi:
+        client = coinapi.sdk_configuration.get_async_client()
+
+    assert client.is_closed
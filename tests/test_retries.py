@@ -0,0 +1,245 @@
+"""Tests for retrying requests."""
+
+import datetime as dt
+import email.utils
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+from coinapi.concurrency import ConcurrencyGovernor
+from coinapi.models import errors, operations
+from coinapi.utils.retries import (
+    BackoffStrategy,
+    RetryBudget,
+    RetryConfig,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+LATEST = "get_/v1/trades/latest"
+HISTORY = "get_/v1/trades/{symbol_id}/history"
+
+NO_WAIT = RetryConfig(backoff=BackoffStrategy(initial_interval=0, jitter=0))
+
+
+class Faults:
+    """Stand-in answering with scripted faults before succeeding."""
+
+    def __init__(
+        self,
+        *faults: int | Exception,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.faults = list(faults)
+        self.headers = headers or {}
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request with the next fault, or with an empty array."""
+        self.requests += 1
+        if not self.faults:
+            return httpx.Response(200, json=[])
+        fault = self.faults.pop(0)
+        if isinstance(fault, Exception):
+            raise fault
+        return httpx.Response(fault, headers=self.headers, request=request)
+
+
+def sdk(faults: Faults, policy: RetryPolicy, **kwargs: object) -> CoinAPI:
+    """Build an SDK sending its requests to a stand-in."""
+    client = httpx.Client(transport=httpx.MockTransport(faults))
+    return CoinAPI("testing", client=client, retry_policy=policy, **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record waits between attempts instead of sleeping."""
+    recorded: list[float] = []
+    monkeypatch.setattr("coinapi.utils.retries.time.sleep", recorded.append)
+    return recorded
+
+
+def test_backoff_grows_exponentially() -> None:
+    """Test that the interval grows by the exponent up to the maximum."""
+    backoff = BackoffStrategy(initial_interval=1, max_interval=5, exponent=2, jitter=0)
+
+    assert [backoff.interval(retry) for retry in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_backoff_jitter() -> None:
+    """Test that jitter only shortens the interval."""
+    backoff = BackoffStrategy(initial_interval=1, jitter=0.5)
+
+    assert all(0.5 <= backoff.interval(1) <= 1 for _ in range(100))
+
+
+def test_parse_retry_after() -> None:
+    """Test parsing `Retry-After` in seconds and as an HTTP date."""
+    future = dt.datetime.now(dt.timezone.utc) + dt.timedelta(seconds=30)
+
+    assert parse_retry_after("7") == 7
+    assert 28 < parse_retry_after(email.utils.format_datetime(future)) <= 30  # type: ignore[operator]
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retries_until_success(sleeps: list[float]) -> None:
+    """Test that retryable statuses are retried and counted."""
+    faults = Faults(503, 550)
+    policy = RetryPolicy(NO_WAIT)
+
+    res = sdk(faults, policy).trades.get_v1_trades_latest()
+
+    assert res.status_code == 200
+    assert faults.requests == 3
+    assert sleeps == [0, 0]
+    assert policy.metrics.snapshot()[LATEST] == {
+        "attempts": 3,
+        "retries": 2,
+        "exhausted": 0,
+        "budget_denied": 0,
+    }
+
+
+def test_gives_up_after_max_attempts(sleeps: list[float]) -> None:
+    """Test that the last response is raised once attempts run out."""
+    faults = Faults(500, 502, 504)
+    policy = RetryPolicy(RetryConfig(max_attempts=2, backoff=NO_WAIT.backoff))
+
+    with pytest.raises(errors.CoinAPIError) as exc_info:
+        sdk(faults, policy).trades.get_v1_trades_latest()
+
+    assert exc_info.value.status_code == 502
+    assert faults.requests == 2
+    assert len(sleeps) == 1
+    assert policy.metrics.snapshot()[LATEST]["exhausted"] == 1
+
+
+def test_does_not_retry_client_errors(sleeps: list[float]) -> None:
+    """Test that statuses outside the retried codes fail immediately."""
+    faults = Faults(400)
+
+    with pytest.raises(errors.CoinAPIError):
+        sdk(faults, RetryPolicy(NO_WAIT)).trades.get_v1_trades_latest()
+
+    assert faults.requests == 1
+    assert sleeps == []
+
+
+def test_respects_retry_after(sleeps: list[float]) -> None:
+    """Test that `Retry-After` replaces the backoff interval."""
+    faults = Faults(429, headers={"Retry-After": "3"})
+
+    sdk(faults, RetryPolicy(NO_WAIT)).trades.get_v1_trades_latest()
+
+    assert sleeps == [3]
+
+
+def test_retry_after_beyond_max_elapsed_time(sleeps: list[float]) -> None:
+    """Test that a `Retry-After` past the elapsed time limit is not waited for."""
+    faults = Faults(429, headers={"Retry-After": "600"})
+
+    with pytest.raises(errors.CoinAPIError):
+        sdk(faults, RetryPolicy()).trades.get_v1_trades_latest()
+
+    assert sleeps == []
+
+
+def test_retries_connection_errors(sleeps: list[float]) -> None:
+    """Test that transport errors are retried."""
+    faults = Faults(httpx.ConnectError("refused"), httpx.ReadTimeout("slow"))
+
+    res = sdk(faults, RetryPolicy(NO_WAIT)).trades.get_v1_trades_latest()
+
+    assert res.status_code == 200
+    assert len(sleeps) == 2
+
+
+def test_connection_errors_not_retried() -> None:
+    """Test that transport errors are raised when connection retries are off."""
+    faults = Faults(httpx.ConnectError("refused"))
+    policy = RetryPolicy(RetryConfig(retry_connection_errors=False))
+
+    with pytest.raises(httpx.ConnectError):
+        sdk(faults, policy).trades.get_v1_trades_latest()
+
+
+def test_overrides_per_operation(sleeps: list[float]) -> None:
+    """Test that operations use their override, and None disables retries."""
+    policy = RetryPolicy(
+        NO_WAIT,
+        overrides={
+            LATEST: None,
+            HISTORY: RetryConfig(max_attempts=10, backoff=NO_WAIT.backoff),
+        },
+    )
+
+    with pytest.raises(errors.CoinAPIError):
+        sdk(Faults(503), policy).trades.get_v1_trades_latest()
+    faults = Faults(*[503] * 8)
+    sdk(faults, policy).trades.get_v1_trades_symbol_id_history(
+        operations.GetV1TradesSymbolIDHistoryRequest(symbol_id="BITSTAMP_SPOT_BTC_USD"),
+    )
+
+    assert faults.requests == 9
+    assert len(sleeps) == 8
+
+
+def test_budget_caps_retries(sleeps: list[float]) -> None:
+    """Test that retries stop once the budget is spent."""
+    policy = RetryPolicy(NO_WAIT, budget=RetryBudget(ratio=0, capacity=1))
+    coinapi = sdk(Faults(503, 503, 503), policy)
+
+    with pytest.raises(errors.CoinAPIError):
+        coinapi.trades.get_v1_trades_latest()
+
+    assert len(sleeps) == 1
+    assert policy.budget.tokens == 0
+    assert policy.metrics.snapshot()[LATEST]["budget_denied"] == 1
+
+
+def test_budget_refills_with_requests() -> None:
+    """Test that requests deposit tokens up to the capacity."""
+    budget = RetryBudget(ratio=0.5, capacity=2)
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+    budget.deposit()
+    budget.deposit()
+
+    assert budget.withdraw()
+    assert budget.tokens == 0
+
+
+def test_retried_stream_frees_slot(sleeps: list[float]) -> None:
+    """Test that discarded streamed responses give back their concurrency slot."""
+    governor = ConcurrencyGovernor(1)
+    coinapi = sdk(Faults(503), RetryPolicy(NO_WAIT), concurrency_governor=governor)
+    request = operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="BITSTAMP_SPOT_BTC_USD",
+    )
+
+    assert list(coinapi.trades.stream_v1_trades_symbol_id_history(request)) == []
+    assert len(sleeps) == 1
+    assert governor.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_async_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that asynchronous requests are retried."""
+    sleeps: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr("coinapi.utils.retries.asyncio.sleep", sleep)
+    faults = Faults(429, httpx.ConnectError("refused"))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(faults))
+    coinapi = AsyncCoinAPI("testing", client=client, retry_policy=RetryPolicy(NO_WAIT))
+
+    res = await coinapi.trades.get_v1_trades_latest()
+
+    assert res.status_code == 200
+    assert sleeps == [0, 0]
@@ -0,0 +1,87 @@
+"""Tests for incremental JSON array decoding."""
+
+import msgspec
+import pytest
+
+from coinapi.models import components
+from coinapi.utils import streaming
+
+ITEMS = [
+    {"a": 'x"],{[\\', "b": [1, {"c": "]"}]},
+    5,
+    "s,]",
+    None,
+    [1, [2]],
+    {"e": "é"},
+]
+
+
+def chunked(data: bytes, size: int) -> list[bytes]:
+    """Split data into chunks of `size` bytes."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+def test_splitter_items(size: int) -> None:
+    """Test that items are split correctly whatever the chunk boundaries."""
+    splitter = streaming.JSONArraySplitter()
+    raw = msgspec.json.encode(ITEMS)
+
+    items = [item for chunk in chunked(raw, size) for item in splitter.feed(chunk)]
+
+    assert splitter.done
+    assert [msgspec.json.decode(item) for item in items] == ITEMS
+
+
+def test_splitter_empty_array() -> None:
+    """Test that an empty array yields no items."""
+    splitter = streaming.JSONArraySplitter()
+
+    assert splitter.feed(b" [ ]\n") == []
+    assert splitter.done
+
+
+def test_splitter_rejects_non_array() -> None:
+    """Test that a non-array body is rejected."""
+    splitter = streaming.JSONArraySplitter()
+
+    with pytest.raises(msgspec.DecodeError, match="expected a JSON array"):
+        splitter.feed(b'{"error": "Invalid API key"}')
+
+
+def test_splitter_buffers_only_pending_item() -> None:
+    """Test that completed items are dropped from the buffer."""
+    splitter = streaming.JSONArraySplitter()
+    splitter.feed(b'[{"a": 1}, {"a": 2}, {"a"')
+
+    assert bytes(splitter._buffer) == b' {"a"'
+
+
+def test_iter_json_array_truncated() -> None:
+    """Test that a truncated array raises after yielding complete items."""
+    decoder = msgspec.json.Decoder(int)
+    items = streaming.iter_json_array([b"[1, 2,", b" 3"], decoder)
+
+    assert next(items) == 1
+    assert next(items) == 2
+    with pytest.raises(msgspec.DecodeError, match="truncated"):
+        next(items)
+
+
+def test_iter_json_array_typed() -> None:
+    """Test that items are decoded into the requested type."""
+    trade = {
+        "symbol_id": "KRAKEN_SPOT_BTC_USD",
+        "time_exchange": "2024-03-06T20:46:24.6673328Z",
+        "time_coinapi": "2024-03-06T20:46:24.7071883Z",
+        "uuid": "bbd51db9-d0af-4ff1-909f-fd8b2aa56272",
+        "price": 67088.3,
+        "size": 0.002,
+        "taker_side": "SELL",
+    }
+    raw = msgspec.json.encode([trade, trade])
+    decoder = msgspec.json.Decoder(components.V1Trade)
+
+    trades = list(streaming.iter_json_array(chunked(raw, 10), decoder))
+
+    assert trades == msgspec.json.decode(raw, type=list[components.V1Trade])
@@ -0,0 +1,343 @@
+"""Tests for splitting time ranges and merging their timeseries."""
+
+import datetime as dt
+import threading
+
+import httpx
+import pytest
+
+from coinapi import AsyncCoinAPI, CoinAPI
+from coinapi.models import components
+from coinapi.timeranges import align, group_by_symbol, merge, parse_time, split
+
+UTC = dt.timezone.utc
+
+PERIODS = [
+    {"period_id": "1MIN", "length_seconds": 60, "length_months": 0},
+    {"period_id": "1DAY", "length_seconds": 86400, "length_months": 0},
+    {"period_id": "3MTH", "length_seconds": 0, "length_months": 3},
+]
+
+MINUTE = components.V1TimeseriesPeriod(length_seconds=60, length_months=0)
+QUARTER = components.V1TimeseriesPeriod(length_seconds=0, length_months=3)
+
+
+def minute(i: int) -> dt.datetime:
+    """Get the start of the `i`-th minute of 2024."""
+    return dt.datetime(2024, 1, 1, tzinfo=UTC) + dt.timedelta(minutes=i)
+
+
+def item(start: dt.datetime, end: dt.datetime) -> components.V1TimeseriesItem:
+    """Build a timeseries item."""
+    return components.V1TimeseriesItem(
+        time_period_start=start,
+        time_period_end=end,
+        volume_traded=1.0,
+        trades_count=1,
+    )
+
+
+class Minutes:
+    """Stand-in serving one-minute OHLCV history with trades in `active` minutes.
+
+    With `concurrent`, the first `concurrent` history requests are only
+    answered once they are all in flight.
+    """
+
+    def __init__(self, active: range, concurrent: int = 0) -> None:
+        self.active = active
+        self.requests: list[httpx.QueryParams] = []
+        self._lock = threading.Lock()
+        self._barrier = threading.Barrier(concurrent, timeout=5) if concurrent else None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a periods or history request."""
+        if request.url.path.endswith("/periods"):
+            return httpx.Response(200, json=PERIODS)
+        params = request.url.params
+        with self._lock:
+            self.requests.append(params)
+            waiting = (
+                self._barrier is not None
+                and len(self.requests) <= self._barrier.parties
+            )
+        if waiting:
+            self._barrier.wait()  # type: ignore[union-attr]
+        start, end = parse_time(params["time_start"]), parse_time(params["time_end"])
+        items = [
+            {
+                "time_period_start": minute(i).isoformat(),
+                "time_period_end": minute(i + 1).isoformat(),
+                "volume_traded": 1.0,
+                "trades_count": i,
+            }
+            for i in self.active
+            if start <= minute(i) < end
+        ]
+        return httpx.Response(200, json=items[: int(params["limit"])])
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request asynchronously."""
+        return self(request)
+
+
+def test_align() -> None:
+    """Test that times are aligned to period starts in seconds or months."""
+    assert align(dt.datetime(2024, 1, 1, 0, 1, 30, tzinfo=UTC), MINUTE) == minute(1)
+    assert align(dt.datetime(2024, 5, 17, 9, tzinfo=UTC), QUARTER) == dt.datetime(
+        2024,
+        4,
+        1,
+        tzinfo=UTC,
+    )
+
+
+def test_parse_time() -> None:
+    """Test that API times are parsed as UTC, truncated to microseconds."""
+    expected = dt.datetime(2024, 1, 1, 23, 59, 59, 999999, tzinfo=UTC)
+
+    assert parse_time("2024-01-01T23:59:59.9999999Z") == expected
+    assert parse_time("2024-01-01T23:59:59.999999") == expected
+    assert parse_time(expected.replace(tzinfo=None)) == expected
+
+
+def test_split_into_aligned_chunks() -> None:
+    """Test that chunks hold at most `limit` periods and start on period starts."""
+    start = dt.datetime(2024, 1, 1, 0, 0, 30, tzinfo=UTC)
+
+    chunks = split(start, minute(25), MINUTE, 10)
+
+    assert chunks == [
+        (start, minute(10)),
+        (minute(10), minute(20)),
+        (minute(20), minute(25)),
+    ]
+
+
+def test_split_by_months() -> None:
+    """Test that month periods are split on calendar months."""
+    start = dt.datetime(2020, 2, 1, tzinfo=UTC)
+
+    chunks = split(start, dt.datetime(2022, 1, 1, tzinfo=UTC), QUARTER, 3)
+
+    assert [chunk_end.date().isoformat() for _, chunk_end in chunks] == [
+        "2020-10-01",
+        "2021-07-01",
+        "2022-01-01",
+    ]
+
+
+def test_merge_drops_repeats_and_finds_gaps() -> None:
+    """Test that a period repeated at a seam is kept once and gaps are found."""
+    series = merge(
+        [
+            [item(minute(1), minute(2)), item(minute(2), minute(3))],
+            [item(minute(2), minute(3)), item(minute(5), minute(6))],
+        ],
+        minute(0),
+        dt.datetime(2024, 1, 1, 0, 7, 30, tzinfo=UTC),
+        MINUTE,
+    )
+
+    assert [i.time_period_start for i in series.items] == [
+        minute(1),
+        minute(2),
+        minute(5),
+    ]
+    assert series.gaps == [
+        (minute(0), minute(1)),
+        (minute(3), minute(5)),
+        (minute(6), minute(8)),
+    ]
+
+
+def test_merge_from_unaligned_start() -> None:
+    """Test that no gap is reported before the first period after `time_start`."""
+    series = merge(
+        [[item(minute(1), minute(2)), item(minute(3), minute(4))]],
+        dt.datetime(2024, 1, 1, 0, 0, 30, tzinfo=UTC),
+        minute(4),
+        MINUTE,
+    )
+
+    assert series.gaps == [(minute(2), minute(3))]
+
+
+def test_merge_rejects_overlaps() -> None:
+    """Test that periods overlapping without repeating are reported."""
+    with pytest.raises(ValueError, match="overlaps"):
+        merge(
+            [[item(minute(0), minute(2))], [item(minute(1), minute(3))]],
+            minute(0),
+            minute(3),
+            MINUTE,
+        )
+
+
+def test_history_range_fetches_chunks_concurrently() -> None:
+    """Test that chunks are fetched at the same time and merged in order."""
+    history = Minutes(range(3, 95), concurrent=3)
+    client = httpx.Client(transport=httpx.MockTransport(history))
+    coinapi = CoinAPI("testing", client=client)
+
+    series = coinapi.ohlcv.get_ohlcv_history_range(
+        "BITSTAMP_SPOT_BTC_USD",
+        "1MIN",
+        "2024-01-01T00:00:00Z",
+        minute(100),
+        limit=10,
+    )
+
+    assert [i.trades_count for i in series.items] == list(range(3, 95))
+    assert series.gaps == [(minute(0), minute(3)), (minute(95), minute(100))]
+    assert len(history.requests) == 10
+    assert {params["period_id"] for params in history.requests} == {"1MIN"}
+
+
+def test_history_range_unknown_period() -> None:
+    """Test that a period missing from the catalog is reported."""
+    client = httpx.Client(transport=httpx.MockTransport(Minutes(range(0))))
+    coinapi = CoinAPI("testing", client=client)
+
+    with pytest.raises(ValueError, match="5MIN"):
+        coinapi.ohlcv.get_ohlcv_history_range(
+            "BITSTAMP_SPOT_BTC_USD",
+            "5MIN",
+            minute(0),
+            minute(100),
+        )
+
+
+@pytest.mark.anyio
+async def test_async_history_range() -> None:
+    """Test that the async range download merges every chunk."""
+    history = Minutes(range(0, 100, 7))
+    client = httpx.AsyncClient(transport=httpx.MockTransport(history.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client)
+
+    series = await coinapi.ohlcv.get_ohlcv_history_range(
+        "BITSTAMP_SPOT_BTC_USD",
+        "1MIN",
+        minute(0),
+        minute(100),
+        limit=30,
+    )
+
+    assert [i.trades_count for i in series.items] == list(range(0, 100, 7))
+    assert series.gaps[0] == (minute(1), minute(7))
+    assert series.gaps[-1] == (minute(99), minute(100))
+    assert len(series.gaps) == len(series.items)
+
+
+class ExchangeDays:
+    """Stand-in serving exchange-wide hourly OHLCV history for two symbols."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.QueryParams] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request for part of one day."""
+        params = request.url.params
+        self.requests.append(params)
+        start, end = parse_time(params["time_start"]), parse_time(params["time_end"])
+        assert start.date() == end.date()
+        items: list[dict[str, object]] = []
+        hour = start
+        while hour < end:
+            items.extend(
+                {
+                    "time_period_start": hour.isoformat(),
+                    "time_period_end": (hour + dt.timedelta(hours=1)).isoformat(),
+                    "volume_traded": 1.0,
+                    "trades_count": hour.hour,
+                    "symbol_id_exchange": symbol.replace("_", ""),
+                    "symbol_id_coinapi": f"BINANCE_SPOT_{symbol}",
+                }
+                for symbol in ("BTC_USDT", "ETH_USDT")
+            )
+            hour += dt.timedelta(hours=1)
+        return httpx.Response(200, json=items)
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request asynchronously."""
+        return self(request)
+
+
+def test_exchange_history_fans_out_per_day() -> None:
+    """Test that a range is requested day by day and grouped by symbol."""
+    server = ExchangeDays()
+    client = httpx.Client(transport=httpx.MockTransport(server))
+    coinapi = CoinAPI("testing", client=client)
+
+    days = list(
+        coinapi.ohlcv.iter_ohlcv_exchange_history(
+            "BINANCE",
+            "1HRS",
+            "2024-01-30T12:00:00",
+            "2024-02-02T06:00:00",
+            max_workers=2,
+        ),
+    )
+
+    assert [(day.time_start.isoformat(), day.time_end.isoformat()) for day in days] == [
+        ("2024-01-30T12:00:00+00:00", "2024-01-31T00:00:00+00:00"),
+        ("2024-01-31T00:00:00+00:00", "2024-02-01T00:00:00+00:00"),
+        ("2024-02-01T00:00:00+00:00", "2024-02-02T00:00:00+00:00"),
+        ("2024-02-02T00:00:00+00:00", "2024-02-02T06:00:00+00:00"),
+    ]
+    assert {params["time_start"] for params in server.requests} == {
+        "2024-01-30T12:00:00",
+        "2024-01-31T00:00:00",
+        "2024-02-01T00:00:00",
+        "2024-02-02T00:00:00",
+    }
+    assert {params["time_end"] for params in server.requests} == {
+        "2024-01-30T23:59:59.9999999",
+        "2024-01-31T23:59:59.9999999",
+        "2024-02-01T23:59:59.9999999",
+        "2024-02-02T06:00:00",
+    }
+    assert set(days[0].series) == {"BINANCE_SPOT_BTC_USDT", "BINANCE_SPOT_ETH_USDT"}
+    assert [i.trades_count for i in days[0].series["BINANCE_SPOT_ETH_USDT"]] == list(
+        range(12, 24),
+    )
+    assert len(days[-1].series["BINANCE_SPOT_BTC_USDT"]) == 6
+
+
+def test_group_by_exchange_symbol() -> None:
+    """Test that items without a CoinAPI symbol are keyed by the exchange one."""
+    items = [
+        components.ModelsExchangeTimeseriesItem(
+            time_period_start=minute(i),
+            time_period_end=minute(i + 1),
+            volume_traded=1.0,
+            trades_count=i,
+            symbol_id_exchange="BTCUSDT",
+        )
+        for i in range(3)
+    ]
+
+    day = group_by_symbol((minute(0), minute(3)), items)
+
+    assert day.series == {"BTCUSDT": items}
+
+
+@pytest.mark.anyio
+async def test_async_exchange_history() -> None:
+    """Test that the async fan-out yields every day in order."""
+    server = ExchangeDays()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server.handle_async))
+    coinapi = AsyncCoinAPI("testing", client=client)
+
+    days = [
+        day
+        async for day in coinapi.ohlcv.iter_ohlcv_exchange_history(
+            "BINANCE",
+            "1HRS",
+            dt.datetime(2024, 1, 1, tzinfo=UTC),
+            dt.datetime(2024, 1, 4, tzinfo=UTC),
+        )
+    ]
+
+    assert [day.time_start.day for day in days] == [1, 2, 3]
+    assert all(len(day.series["BINANCE_SPOT_BTC_USDT"]) == 24 for day in days)
@@ -3,7 +3,7 @@
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
-from coinapi import CoinAPI
+from coinapi import AsyncCoinAPI, CoinAPI
 from coinapi.models import operations
 
 
@@ -58,3 +58,65 @@ def test_get_v1_trades_latest(
     assert response.status_code == 200
     assert response.content is not None
     assert response.content == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_trades_latest.yaml")
+async def test_get_v1_trades_latest_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get_v1_trades_latest with the async client."""
+    response = await async_coinapi.trades.get_v1_trades_latest(
+        filter_symbol_id="KRAKEN_SPOT_BTC_USD,KRAKEN_SPOT_ETH_USD",
+        limit=10,
+    )
+
+    assert response.status_code == 200
+    assert response.content is not None
+    assert response.content == snapshot
+
+
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_trades_symbol_id_history.yaml")
+def test_stream_v1_trades_symbol_id_history(
+    coinapi: CoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test stream_v1_trades_symbol_id_history."""
+    request = operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+        time_start="2022-01-01T00:00:00",
+        time_end="2022-01-02T00:00:00",
+        limit=10,
+    )
+    trades = list(coinapi.trades.stream_v1_trades_symbol_id_history(request))
+
+    assert len(trades) == 10
+    assert trades == snapshot
+
+
+@pytest.mark.anyio
+@pytest.mark.vcr
+@pytest.mark.default_cassette("test_get_v1_trades_symbol_id_history.yaml")
+async def test_stream_v1_trades_symbol_id_history_async(
+    async_coinapi: AsyncCoinAPI,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test stream_v1_trades_symbol_id_history with the async client."""
+    request = operations.GetV1TradesSymbolIDHistoryRequest(
+        symbol_id="KRAKEN_SPOT_BTC_USD",
+        time_start="2022-01-01T00:00:00",
+        time_end="2022-01-02T00:00:00",
+        limit=10,
+    )
+    trades = [
+        trade
+        async for trade in async_coinapi.trades.stream_v1_trades_symbol_id_history(
+            request,
+        )
+    ]
+
+    assert len(trades) == 10
+    assert trades == snapshot